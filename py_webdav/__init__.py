@@ -1,17 +1,23 @@
 """A Python library for WebDAV, CalDAV and CardDAV."""
 
-from .client import Client
-from .fs_local import LocalFileSystem
-from .inform_api_client import InformAPIClient, InformConfig
-from .server import Handler, create_app
-from .webdav import (
-    ConditionalMatch,
-    CopyOptions,
-    CreateOptions,
-    FileInfo,
-    MoveOptions,
-    RemoveAllOptions,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .fs_local import LocalFileSystem
+    from .inform_api_client import InformAPIClient, InformConfig
+    from .server import Handler, create_app
+    from .webdav import (
+        ConditionalMatch,
+        CopyOptions,
+        CreateOptions,
+        FileInfo,
+        MoveOptions,
+        RemoveAllOptions,
+    )
 
 __version__ = "0.1.0"
 
@@ -27,3 +33,36 @@ __all__ = [
     "MoveOptions",
     "RemoveAllOptions",
 ]
+
+# Exported names and the submodules defining them. They are imported on first
+# access, so that e.g. the command line tool can parse its arguments without
+# loading httpx, Starlette and lxml first.
+_EXPORTS = {
+    "Client": ".client",
+    "LocalFileSystem": ".fs_local",
+    "InformAPIClient": ".inform_api_client",
+    "InformConfig": ".inform_api_client",
+    "Handler": ".server",
+    "create_app": ".server",
+    "ConditionalMatch": ".webdav",
+    "CopyOptions": ".webdav",
+    "CreateOptions": ".webdav",
+    "FileInfo": ".webdav",
+    "MoveOptions": ".webdav",
+    "RemoveAllOptions": ".webdav",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import exported names from their submodule on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported exports."""
+    return sorted({*globals(), *_EXPORTS})
@@ -105,6 +105,26 @@ class CalDAVBackend(Protocol):
         """
         ...
 
+    async def get_calendar_objects(
+        self, request: Request, paths: list[str]
+    ) -> list[CalendarObject]:
+        """Get several calendar objects at once (calendar-multiget).
+
+        Optional: the server falls back to get_calendar_object if missing.
+
+        Args:
+            request: HTTP request
+            paths: Calendar object paths
+
+        Returns:
+            List of CalendarObject for the paths that exist, in request order
+
+        Raises:
+            Exception: If the storage or API behind the backend fails, so the
+                multiget is not answered as if the objects were deleted
+        """
+        ...
+
     async def list_calendar_objects(
         self, request: Request, calendar_path: str, comp_request: CalendarCompRequest | None = None
     ) -> list[CalendarObject]:
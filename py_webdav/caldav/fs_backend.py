@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from datetime import UTC, datetime
 from hashlib import md5
 from pathlib import Path
@@ -171,10 +172,33 @@ class LocalCalDAVBackend:
         self, request: Request, path: str, comp_request: CalendarCompRequest | None = None
     ) -> CalendarObject:
         """Get a calendar object."""
+        obj = self._read_calendar_object(path)
+        if obj is None:
+            raise HTTPError(404, Exception(f"Calendar object not found: {path}"))
+        return obj
+
+    async def get_calendar_objects(
+        self, request: Request, paths: list[str]
+    ) -> list[CalendarObject]:
+        """Get several calendar objects, skipping missing ones."""
+        objects = []
+        for path in paths:
+            try:
+                obj = self._read_calendar_object(path)
+            except Exception:
+                # Skip invalid paths and unreadable objects
+                continue
+            if obj is not None:
+                objects.append(obj)
+
+        return objects
+
+    def _read_calendar_object(self, path: str) -> CalendarObject | None:
+        """Read a calendar object from disk, or return None if it does not exist."""
         file_path = self._object_file(path)
 
         if not file_path.exists() or not file_path.is_file():
-            raise HTTPError(404, Exception(f"Calendar object not found: {path}"))
+            return None
 
         # Read iCalendar data
         ical_data = file_path.read_text()
@@ -203,10 +227,13 @@ class LocalCalDAVBackend:
         if not calendar_dir.exists():
             raise HTTPError(404, Exception(f"Calendar not found: {calendar_path}"))
 
+        with os.scandir(calendar_dir) as it:
+            names = [entry.name for entry in it if entry.name.endswith(".ics")]
+
         objects = []
-        for file_path in calendar_dir.glob("*.ics"):
+        for name in names:
             try:
-                object_path = f"{calendar_path}{file_path.name}"
+                object_path = f"{calendar_path}{name}"
                 obj = await self.get_calendar_object(request, object_path, comp_request)
                 objects.append(obj)
             except Exception:
@@ -7,18 +7,151 @@ and delete operations.
 
 from __future__ import annotations
 
+import asyncio
+import re
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
-from hashlib import md5
+from hashlib import blake2b
 from typing import Any
 
+import httpx
+from icalendar import Alarm
 from icalendar import Calendar as iCalendar
+from icalendar import Event as iEvent
 from starlette.requests import Request
 
 from ..inform_api_client import InformAPIClient, InformConfig
 from ..inform_calendar_utils import InformCalendarConverter
-from ..internal import HTTPError
+from ..internal import HTTPError, is_not_found
 from .caldav import Calendar, CalendarCompRequest, CalendarObject, CalendarQuery
 
+# Maximum number of serialized occurrences kept in the iCalendar cache
+ICAL_CACHE_SIZE = 4096
+
+# Occurrence index bounds: entries expire after OCCURRENCE_INDEX_TTL seconds
+OCCURRENCE_INDEX_SIZE = 10_000
+OCCURRENCE_INDEX_TTL = 60.0
+
+# Maximum number of concurrent INFORM requests when resolving a multiget
+MULTIGET_CONCURRENCY = 8
+
+# INFORM text fields copied verbatim into VEVENT properties
+_TEXT_PROPERTIES = (
+    ("subject", "summary"),
+    ("content", "description"),
+    ("location", "location"),
+)
+
+# INFORM datetime fields and the VEVENT properties they map to
+_TIME_PROPERTIES = (
+    ("startDateTime", "dtstart"),
+    ("endDateTime", "dtend"),
+)
+
+# Every occurrence field read by _inform_occurrence_to_ical; together they key
+# the iCalendar cache, so any change to a serialized value is picked up
+_ICAL_SOURCE_FIELDS = (
+    "key",
+    "occurrenceId",
+    *(inform_field for inform_field, _ in _TEXT_PROPERTIES),
+    "eventCategory",
+    "wholeDayEvent",
+    *(inform_field for inform_field, _ in _TIME_PROPERTIES),
+    "reminderEnabled",
+    "remindBeforeStart",
+    "private",
+)
+
+# iCalendar BYDAY codes to INFORM weekday names
+_WEEKDAY_MAP: dict[str, str] = {
+    "MO": "monday",
+    "TU": "tuesday",
+    "WE": "wednesday",
+    "TH": "thursday",
+    "FR": "friday",
+    "SA": "saturday",
+    "SU": "sunday",
+}
+
+
+# BYDAY entry with optional ordinal, e.g. "MO", "1MO", "-1FR"
+_BYDAY_RE = re.compile(r"^([+-]?\d+)?(MO|TU|WE|TH|FR|SA|SU)$")
+
+
+def _parse_byday(value: Any) -> tuple[int, str]:
+    """Parse an RRULE BYDAY entry into INFORM week number and weekday name.
+
+    Args:
+        value: BYDAY entry from icalendar (e.g., "1MO")
+
+    Returns:
+        Tuple of (week_number, weekday); defaults to (1, "monday")
+    """
+    match = _BYDAY_RE.match(str(value))
+    if match is None:
+        return 1, "monday"
+
+    ordinal, weekday_code = match.groups()
+    return (int(ordinal) if ordinal else 1), _WEEKDAY_MAP[weekday_code]
+
+
+def _content_etag(encoded: bytes) -> str:
+    """Compute a content-hash ETag.
+
+    BLAKE2b with a 16-byte digest is faster than MD5 and keeps the familiar
+    32 hex character ETag length.
+
+    Args:
+        encoded: Serialized object data
+
+    Returns:
+        Hex digest of the data
+    """
+    return blake2b(encoded, digest_size=16).hexdigest()
+
+
+def _make_object(
+    path: str, ical_data: str, encoded: bytes, etag: str, mod_time: datetime
+) -> CalendarObject:
+    """Create a CalendarObject from serialized iCalendar data.
+
+    Args:
+        path: Calendar object path
+        ical_data: iCalendar data as string
+        encoded: UTF-8 encoded ical_data
+        etag: ETag of the encoded data
+        mod_time: Modification time to report
+
+    Returns:
+        CalendarObject
+    """
+    return CalendarObject(
+        path=path,
+        data=ical_data,
+        mod_time=mod_time,
+        content_length=len(encoded),
+        etag=etag,
+    )
+
+
+def _split_occurrence_name(name: str) -> tuple[str, str | None]:
+    """Split an object name into event key and occurrence ID.
+
+    Occurrence objects are named ``key-occurrenceId``; the split happens at
+    the last hyphen. Names without a hyphen have no occurrence ID.
+
+    Args:
+        name: Object name without the .ics extension
+
+    Returns:
+        Tuple of (event_key, occurrence_id)
+    """
+    idx = name.rfind("-")
+    if idx < 0:
+        return name, None
+    return name[:idx], name[idx + 1 :]
+
 
 class InformCalDAVBackend:
     """INFORM API-based CalDAV backend.
@@ -50,9 +183,27 @@ class InformCalDAVBackend:
         )
         self.home_set_path = home_set_path
         self.principal_path = principal_path
+        self._calendar_path = f"{home_set_path}default/"
+        self._default_calendar = Calendar(
+            path=self._calendar_path,
+            name="INFORM Calendar",
+            description="Calendar synced from INFORM",
+            supported_component_set=["VEVENT"],
+        )
         self.owner_key = owner_key or (config.username if config else "")
         self._sync_weeks = 2  # Sync 2 weeks before/after current date
 
+        # Serialized occurrences keyed by their _ICAL_SOURCE_FIELDS values, which
+        # start with (event_key, occurrence_id). Values are (ical_data, encoded,
+        # etag); oldest entries are evicted first.
+        self._ical_cache: OrderedDict[tuple[Any, ...], tuple[str, bytes, str]] = OrderedDict()
+
+        # Occurrence payloads seen by list/query, keyed by (event_key, occurrence_id).
+        # Values are (monotonic timestamp, event_data).
+        self._occurrence_index: OrderedDict[tuple[str, str], tuple[float, dict[str, Any]]] = (
+            OrderedDict()
+        )
+
     async def calendar_home_set_path(self, request: Request) -> str:
         """Get calendar home set path."""
         return self.home_set_path
@@ -63,7 +214,7 @@ class InformCalDAVBackend:
 
     def _get_calendar_path(self) -> str:
         """Get path for the calendar."""
-        return f"{self.home_set_path}default/"
+        return self._calendar_path
 
     def _get_sync_date_range(self) -> tuple[datetime, datetime]:
         """Get date range for syncing events (2 weeks before/after current date).
@@ -179,6 +330,7 @@ class InformCalDAVBackend:
             await self.api_client.update_calendar_event_occurrence(
                 event_key, occurrence_id, event_data
             )
+            self._invalidate_event_caches(event_key)
 
             # Fetch the updated occurrence
             updated_occurrence = await self.api_client.get_calendar_event_occurrence(
@@ -186,16 +338,8 @@ class InformCalDAVBackend:
             )
 
             # Convert back to iCalendar
-            result_ical = self._inform_occurrence_to_ical(updated_occurrence)
-            etag = md5(result_ical.encode()).hexdigest()
-
-            return CalendarObject(
-                path=path,
-                data=result_ical,
-                mod_time=datetime.now(UTC),
-                content_length=len(result_ical.encode()),
-                etag=etag,
-            )
+            result_ical, encoded, etag = self._cached_occurrence_ical(updated_occurrence)
+            return _make_object(path, result_ical, encoded, etag, datetime.now(UTC))
 
         except Exception as e:
             raise HTTPError(500, Exception(f"Failed to update occurrence: {e}")) from e
@@ -227,51 +371,30 @@ class InformCalDAVBackend:
             uid = event_key
         event.add("uid", uid)
 
-        # Summary (subject)
-        subject = event_data.get("subject", "")
-        if subject:
-            event.add("summary", subject)
-
-        # Description (content)
-        content = event_data.get("content", "")
-        if content:
-            event.add("description", content)
-
-        # Location
-        location = event_data.get("location", "")
-        if location:
-            event.add("location", location)
+        # Summary, description and location
+        for inform_field, ical_property in _TEXT_PROPERTIES:
+            value = event_data.get(inform_field)
+            if value:
+                event.add(ical_property, value)
 
         # Categories
         category = event_data.get("eventCategory", "")
         if category:
             event.add("categories", [category])
 
-        # Start and End times
-        start_dt_str = event_data.get("startDateTime")
-        end_dt_str = event_data.get("endDateTime")
+        # Start and End times (fromisoformat accepts the "Z" suffix)
         whole_day = event_data.get("wholeDayEvent", False)
-
-        if start_dt_str:
-            start_dt = datetime.fromisoformat(start_dt_str.replace("Z", "+00:00"))
-            if whole_day:
-                event.add("dtstart", start_dt.date())
-            else:
-                event.add("dtstart", start_dt)
-
-        if end_dt_str:
-            end_dt = datetime.fromisoformat(end_dt_str.replace("Z", "+00:00"))
-            if whole_day:
-                event.add("dtend", end_dt.date())
-            else:
-                event.add("dtend", end_dt)
+        for inform_field, ical_property in _TIME_PROPERTIES:
+            dt_str = event_data.get(inform_field)
+            if dt_str:
+                dt = datetime.fromisoformat(dt_str)
+                event.add(ical_property, dt.date() if whole_day else dt)
 
         # Reminder/alarm
         reminder_enabled = event_data.get("reminderEnabled", False)
         remind_before = event_data.get("remindBeforeStart", 0)
         if reminder_enabled and remind_before > 0:
-            from icalendar import Alarm
-
+            subject = event_data.get("subject", "")
             alarm = Alarm()
             alarm.add("action", "DISPLAY")
             alarm.add("description", subject or "Reminder")
@@ -291,6 +414,121 @@ class InformCalDAVBackend:
         cal.add_component(event)
         return cal.to_ical().decode("utf-8")
 
+    def _cached_occurrence_ical(self, event_data: dict[str, Any]) -> tuple[str, bytes, str]:
+        """Convert an INFORM occurrence to iCalendar, reusing earlier results.
+
+        The cache is keyed on the values of every field the conversion reads
+        (_ICAL_SOURCE_FIELDS), so an occurrence edited anywhere gets new data
+        and a new ETag, while unchanged occurrences are served from the cache
+        (with a stable ETag) on repeated client polls.
+
+        Args:
+            event_data: Event occurrence data from INFORM API
+
+        Returns:
+            Tuple of (ical_data, encoded ical_data, etag)
+        """
+        key = tuple(event_data.get(field) for field in _ICAL_SOURCE_FIELDS)
+
+        cached = self._ical_cache.get(key)
+        if cached is not None:
+            self._ical_cache.move_to_end(key)
+            return cached
+
+        ical_data = self._inform_occurrence_to_ical(event_data)
+        encoded = ical_data.encode()
+        entry = (ical_data, encoded, _content_etag(encoded))
+
+        self._ical_cache[key] = entry
+        if len(self._ical_cache) > ICAL_CACHE_SIZE:
+            self._ical_cache.popitem(last=False)
+        return entry
+
+    def _index_occurrences(self, events: list[dict[str, Any]]) -> None:
+        """Remember occurrence payloads for later single-object lookups.
+
+        Args:
+            events: Event occurrences returned by the INFORM API
+        """
+        now = time.monotonic()
+        for event_data in events:
+            event_key = event_data.get("key")
+            occurrence_id = event_data.get("occurrenceId")
+            if not event_key or not occurrence_id:
+                continue
+
+            key = (event_key, str(occurrence_id))
+            self._occurrence_index[key] = (now, event_data)
+            self._occurrence_index.move_to_end(key)
+
+        while len(self._occurrence_index) > OCCURRENCE_INDEX_SIZE:
+            self._occurrence_index.popitem(last=False)
+
+    def _lookup_occurrence(self, event_key: str, occurrence_id: str) -> dict[str, Any] | None:
+        """Look up a recently seen occurrence payload.
+
+        Args:
+            event_key: Event key
+            occurrence_id: Occurrence ID
+
+        Returns:
+            Occurrence data, or None if unknown or expired
+        """
+        entry = self._occurrence_index.get((event_key, occurrence_id))
+        if entry is None:
+            return None
+
+        indexed_at, event_data = entry
+        if time.monotonic() - indexed_at > OCCURRENCE_INDEX_TTL:
+            del self._occurrence_index[(event_key, occurrence_id)]
+            return None
+        return event_data
+
+    async def _occurrence_window(self, request: Request) -> dict[tuple[str, str], dict[str, Any]]:
+        """Get occurrences within one year of today, fetched once per request.
+
+        A calendar-multiget resolves many occurrence hrefs in one request; the
+        wide INFORM window is fetched for the first of them and kept on
+        request.state for the rest, including hrefs that turn out to be missing.
+
+        Args:
+            request: HTTP request
+
+        Returns:
+            Occurrence data keyed by (event_key, occurrence_id)
+        """
+        window = getattr(request.state, "inform_occurrence_window", None)
+        if isinstance(window, dict):
+            return window
+
+        # Use a date range that should include any requested occurrence
+        start_date = datetime.now(UTC) - timedelta(days=365)
+        end_date = datetime.now(UTC) + timedelta(days=365)
+
+        response = await self.api_client.get_calendar_events_occurrences(
+            owner_key=self.owner_key,
+            start_datetime=self._format_datetime_for_inform(start_date),
+            end_datetime=self._format_datetime_for_inform(end_date),
+            limit=1000,
+        )
+
+        events = response.get("calendarEvents", [])
+        self._index_occurrences(events)
+        window = {
+            (evt["key"], str(evt["occurrenceId"])): evt
+            for evt in events
+            if evt.get("key") and evt.get("occurrenceId")
+        }
+        request.state.inform_occurrence_window = window
+        return window
+
+    def _invalidate_event_caches(self, event_key: str) -> None:
+        """Drop cached serializations and indexed occurrences of an event."""
+        for key in [k for k in self._ical_cache if k[0] == event_key]:
+            del self._ical_cache[key]
+        for index_key in [k for k in self._occurrence_index if k[0] == event_key]:
+            del self._occurrence_index[index_key]
+
     def _inform_event_to_ical(self, event_data: dict[str, Any]) -> str:
         """Convert INFORM calendar event to iCalendar format.
 
@@ -470,16 +708,7 @@ class InformCalDAVBackend:
         elif freq == "WEEKLY":
             byday = rrule.get("byday", [])
             # Convert to INFORM weekday names
-            day_map = {
-                "MO": "monday",
-                "TU": "tuesday",
-                "WE": "wednesday",
-                "TH": "thursday",
-                "FR": "friday",
-                "SA": "saturday",
-                "SU": "sunday",
-            }
-            weekdays = [day_map.get(str(d), "monday") for d in byday]
+            weekdays = [_WEEKDAY_MAP.get(str(d), "monday") for d in byday]
 
             return {
                 "schemaType": "weekly",
@@ -506,20 +735,7 @@ class InformCalDAVBackend:
                 }
             elif byday:
                 # Specific weekday (e.g., "1MO" = first Monday)
-                byday_str = str(byday[0])
-                week_number = int(byday_str[0]) if byday_str[0].isdigit() else 1
-                weekday_code = byday_str[-2:]
-
-                day_map = {
-                    "MO": "monday",
-                    "TU": "tuesday",
-                    "WE": "wednesday",
-                    "TH": "thursday",
-                    "FR": "friday",
-                    "SA": "saturday",
-                    "SU": "sunday",
-                }
-                weekday = day_map.get(weekday_code, "monday")
+                week_number, weekday = _parse_byday(byday[0])
 
                 return {
                     "schemaType": "monthly",
@@ -551,20 +767,7 @@ class InformCalDAVBackend:
                 }
             elif byday:
                 # Specific weekday
-                byday_str = str(byday[0])
-                week_number = int(byday_str[0]) if byday_str[0].isdigit() else 1
-                weekday_code = byday_str[-2:]
-
-                day_map = {
-                    "MO": "monday",
-                    "TU": "tuesday",
-                    "WE": "wednesday",
-                    "TH": "thursday",
-                    "FR": "friday",
-                    "SA": "saturday",
-                    "SU": "sunday",
-                }
-                weekday = day_map.get(weekday_code, "monday")
+                week_number, weekday = _parse_byday(byday[0])
 
                 return {
                     "schemaType": "yearly",
@@ -584,25 +787,14 @@ class InformCalDAVBackend:
 
     async def list_calendars(self, request: Request) -> list[Calendar]:
         """List all calendars (single default calendar)."""
-        calendar = Calendar(
-            path=self._get_calendar_path(),
-            name="INFORM Calendar",
-            description="Calendar synced from INFORM",
-            supported_component_set=["VEVENT"],
-        )
-        return [calendar]
+        return [self._default_calendar]
 
     async def get_calendar(self, request: Request, path: str) -> Calendar:
         """Get calendar by path."""
-        if path != self._get_calendar_path():
+        if path != self._calendar_path:
             raise HTTPError(404, Exception(f"Calendar not found: {path}"))
 
-        return Calendar(
-            path=path,
-            name="INFORM Calendar",
-            description="Calendar synced from INFORM",
-            supported_component_set=["VEVENT"],
-        )
+        return self._default_calendar
 
     async def create_calendar(self, request: Request, calendar: Calendar) -> None:
         """Create calendar (not supported - single calendar only)."""
@@ -620,79 +812,98 @@ class InformCalDAVBackend:
         Handles both single events and occurrences of series events.
         Path format: key.ics or key-occurrenceId.ics
         """
+        obj = await self._find_calendar_object(request, path)
+        if obj is None:
+            raise HTTPError(404, Exception(f"Calendar object not found: {path}"))
+        return obj
+
+    async def _find_calendar_object(self, request: Request, path: str) -> CalendarObject | None:
+        """Look up a calendar object, returning None if it does not exist."""
         path_str = self._parse_object_path(path)
 
         # Check if this is an occurrence (contains hyphen before .ics)
-        if "-" in path_str:
-            parts = path_str.rsplit("-", 1)
-            event_key = parts[0]
-            occurrence_id = parts[1] if len(parts) > 1 else None
-        else:
-            event_key = path_str
-            occurrence_id = None
+        event_key, occurrence_id = _split_occurrence_name(path_str)
 
         if occurrence_id:
-            # Fetch the specific occurrence
-            # We need to query occurrences to get the occurrence data
-            # Use a date range that should include this occurrence
-            start_date = datetime.now(UTC) - timedelta(days=365)
-            end_date = datetime.now(UTC) + timedelta(days=365)
-
-            response = await self.api_client.get_calendar_events_occurrences(
-                owner_key=self.owner_key,
-                start_datetime=self._format_datetime_for_inform(start_date),
-                end_datetime=self._format_datetime_for_inform(end_date),
-                limit=1000,
-            )
-
-            events = response.get("calendarEvents", [])
-            event_data = None
+            # Occurrences seen by a recent list/query are served from the index
+            event_data = self._lookup_occurrence(event_key, occurrence_id)
 
-            # Find the specific occurrence
-            for evt in events:
-                if evt.get("key") == event_key and evt.get("occurrenceId") == occurrence_id:
-                    event_data = evt
-                    break
-
-            if not event_data:
-                raise HTTPError(404, Exception(f"Occurrence not found: {event_key}-{occurrence_id}"))
-
-            # Convert occurrence to iCalendar
-            ical_data = self._inform_occurrence_to_ical(event_data)
+            if event_data is None:
+                window = await self._occurrence_window(request)
+                event_data = window.get((event_key, occurrence_id))
         else:
-            # Fetch single event
+            # Fetch single event; only a 404 from INFORM means it doesn't exist
             try:
                 event_data = await self.api_client.get_calendar_event(event_key, fields=["all"])
-            except Exception as e:
-                raise HTTPError(404, Exception(f"Event not found: {event_key}")) from e
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 404:
+                    return None
+                raise HTTPError(502, Exception(f"INFORM API error: {e}")) from e
+            except httpx.HTTPError as e:
+                raise HTTPError(502, Exception(f"INFORM API error: {e}")) from e
+
+        if not event_data:
+            return None
+
+        # Convert to iCalendar (single events are treated as a single occurrence)
+        ical_data, encoded, etag = self._cached_occurrence_ical(event_data)
+        return _make_object(path, ical_data, encoded, etag, datetime.now(UTC))
+
+    async def get_calendar_objects(
+        self, request: Request, paths: list[str]
+    ) -> list[CalendarObject]:
+        """Get several calendar objects at once (calendar-multiget).
 
-            # Convert to iCalendar (treat as single occurrence)
-            ical_data = self._inform_occurrence_to_ical(event_data)
+        Occurrence paths missing from the occurrence index are resolved from
+        a single INFORM window fetch; single events are fetched concurrently,
+        at most MULTIGET_CONCURRENCY at a time. Missing objects and objects that
+        cannot be converted are skipped; INFORM API failures are raised.
+        """
+        # Fetch the occurrence window up front so concurrent lookups share it
+        for path in paths:
+            try:
+                path_str = self._parse_object_path(path)
+            except HTTPError:
+                continue
+            event_key, occurrence_id = _split_occurrence_name(path_str)
+            if occurrence_id and self._lookup_occurrence(event_key, occurrence_id) is None:
+                await self._occurrence_window(request)
+                break
 
-        # Generate ETag from content
-        etag = md5(ical_data.encode()).hexdigest()
+        semaphore = asyncio.Semaphore(MULTIGET_CONCURRENCY)
 
-        return CalendarObject(
-            path=path,
-            data=ical_data,
-            mod_time=datetime.now(UTC),
-            content_length=len(ical_data.encode()),
-            etag=etag,
-        )
+        async def fetch(path: str) -> CalendarObject | None:
+            async with semaphore:
+                try:
+                    return await self._find_calendar_object(request, path)
+                except HTTPError as e:
+                    # Skip invalid paths; API failures are reported
+                    if not is_not_found(e):
+                        raise
+                    return None
+                except Exception:
+                    # Skip unconvertible objects
+                    return None
 
-    async def list_calendar_objects(
-        self,
-        request: Request,
-        calendar_path: str,
-        comp_request: CalendarCompRequest | None = None,
+        results = await asyncio.gather(*(fetch(path) for path in paths))
+        return [obj for obj in results if obj is not None]
+
+    async def _materialize_objects(
+        self, calendar_path: str, start_date: datetime, end_date: datetime
     ) -> list[CalendarObject]:
-        """List all calendar objects in the calendar.
+        """Fetch occurrences in a date range and convert them to calendar objects.
 
-        Each occurrence is returned as a separate CalDAV object.
-        """
-        # Get sync date range
-        start_date, end_date = self._get_sync_date_range()
+        Shared by list_calendar_objects and query_calendar_objects so both
+        reuse the occurrence index and the serialization cache.
+
+        Args:
+            calendar_path: Calendar path used as prefix for object paths
+            start_date: Start of the date range
+            end_date: End of the date range
 
+        Returns:
+            List of CalendarObject, one per occurrence
+        """
         # Fetch events from INFORM API
         response = await self.api_client.get_calendar_events_occurrences(
             owner_key=self.owner_key,
@@ -702,7 +913,9 @@ class InformCalDAVBackend:
         )
 
         events = response.get("calendarEvents", [])
+        self._index_occurrences(events)
         objects = []
+        now = datetime.now(UTC)
 
         for event_data in events:
             event_key = event_data.get("key", "")
@@ -712,34 +925,37 @@ class InformCalDAVBackend:
             occurrence_id = event_data.get("occurrenceId")
 
             try:
-                # Convert occurrence to single event iCalendar
-                ical_data = self._inform_occurrence_to_ical(event_data)
-
-                # Generate ETag
-                etag = md5(ical_data.encode()).hexdigest()
-
-                # Create unique object path
-                # For occurrences: key-occurrenceId.ics
-                # For single events: key.ics
-                if occurrence_id:
-                    object_path = f"{calendar_path}{event_key}-{occurrence_id}.ics"
-                else:
-                    object_path = f"{calendar_path}{event_key}.ics"
-
-                obj = CalendarObject(
-                    path=object_path,
-                    data=ical_data,
-                    mod_time=datetime.now(UTC),
-                    content_length=len(ical_data.encode()),
-                    etag=etag,
-                )
-                objects.append(obj)
+                # Convert occurrence to single event iCalendar (cached per payload)
+                ical_data, encoded, etag = self._cached_occurrence_ical(event_data)
             except Exception:
                 # Skip invalid events
                 continue
 
+            # Create unique object path
+            # For occurrences: key-occurrenceId.ics
+            # For single events: key.ics
+            if occurrence_id:
+                object_path = f"{calendar_path}{event_key}-{occurrence_id}.ics"
+            else:
+                object_path = f"{calendar_path}{event_key}.ics"
+
+            objects.append(_make_object(object_path, ical_data, encoded, etag, now))
+
         return objects
 
+    async def list_calendar_objects(
+        self,
+        request: Request,
+        calendar_path: str,
+        comp_request: CalendarCompRequest | None = None,
+    ) -> list[CalendarObject]:
+        """List all calendar objects in the calendar.
+
+        Each occurrence is returned as a separate CalDAV object.
+        """
+        start_date, end_date = self._get_sync_date_range()
+        return await self._materialize_objects(calendar_path, start_date, end_date)
+
     async def query_calendar_objects(
         self, request: Request, calendar_path: str, query: CalendarQuery
     ) -> list[CalendarObject]:
@@ -749,61 +965,14 @@ class InformCalDAVBackend:
         """
         # For now, use the time range filter if available
         # TODO: Implement full filter support
-
-        # Check if query has time range in comp_filter
-        start_date = None
-        end_date = None
-
-        if query.comp_filter.start:
-            start_date = query.comp_filter.start
-        if query.comp_filter.end:
-            end_date = query.comp_filter.end
+        start_date = query.comp_filter.start
+        end_date = query.comp_filter.end
 
         # Use provided time range or default sync range
         if not start_date or not end_date:
             start_date, end_date = self._get_sync_date_range()
 
-        # Fetch events from INFORM API
-        response = await self.api_client.get_calendar_events_occurrences(
-            owner_key=self.owner_key,
-            start_datetime=self._format_datetime_for_inform(start_date),
-            end_datetime=self._format_datetime_for_inform(end_date),
-            limit=1000,
-        )
-
-        events = response.get("calendarEvents", [])
-        objects = []
-
-        for event_data in events:
-            event_key = event_data.get("key", "")
-            if not event_key:
-                continue
-
-            occurrence_id = event_data.get("occurrenceId")
-
-            try:
-                # Convert occurrence to single event iCalendar
-                ical_data = self._inform_occurrence_to_ical(event_data)
-                etag = md5(ical_data.encode()).hexdigest()
-
-                # Create unique object path
-                if occurrence_id:
-                    object_path = f"{calendar_path}{event_key}-{occurrence_id}.ics"
-                else:
-                    object_path = f"{calendar_path}{event_key}.ics"
-
-                obj = CalendarObject(
-                    path=object_path,
-                    data=ical_data,
-                    mod_time=datetime.now(UTC),
-                    content_length=len(ical_data.encode()),
-                    etag=etag,
-                )
-                objects.append(obj)
-            except Exception:
-                continue
-
-        return objects
+        return await self._materialize_objects(calendar_path, start_date, end_date)
 
     async def put_calendar_object(
         self,
@@ -825,25 +994,22 @@ class InformCalDAVBackend:
         event_key = path_str
         occurrence_id = None
 
-        if "-" in path_str:
-            parts = path_str.rsplit("-", 1)
-            potential_key = parts[0]
-            potential_occ_id = parts[1] if len(parts) > 1 else None
+        potential_key, potential_occ_id = _split_occurrence_name(path_str)
 
-            if potential_occ_id:
-                # Verify this is actually an occurrence by checking if it exists
-                try:
-                    await self.api_client.get_calendar_event_occurrence(
-                        potential_key, potential_occ_id, fields=["key"]
-                    )
-                    # If we get here, it's a valid occurrence
-                    is_occurrence = True
-                    event_key = potential_key
-                    occurrence_id = potential_occ_id
-                except Exception:
-                    # Not an occurrence, treat as new event with UUID filename
-                    is_occurrence = False
-                    event_key = path_str
+        if potential_occ_id:
+            # Verify this is actually an occurrence by checking if it exists
+            try:
+                await self.api_client.get_calendar_event_occurrence(
+                    potential_key, potential_occ_id, fields=["key"]
+                )
+                # If we get here, it's a valid occurrence
+                is_occurrence = True
+                event_key = potential_key
+                occurrence_id = potential_occ_id
+            except Exception:
+                # Not an occurrence, treat as new event with UUID filename
+                is_occurrence = False
+                event_key = path_str
 
         if is_occurrence and occurrence_id:
             # Update individual occurrence
@@ -863,10 +1029,9 @@ class InformCalDAVBackend:
 
         # Check if event exists
         try:
-            _existing_event = await self.api_client.get_calendar_event(event_key)
-            event_exists = True
-        except Exception:
-            event_exists = False
+            event_exists = await self.api_client.event_exists(event_key)
+        except httpx.HTTPError as e:
+            raise HTTPError(500, Exception(f"Failed to look up event: {e}")) from e
 
         # Handle preconditions
         if if_none_match and event_exists:
@@ -880,6 +1045,7 @@ class InformCalDAVBackend:
             if event_exists:
                 # Update existing event
                 _updated_event = await self.api_client.update_calendar_event(event_key, event_data)
+                self._invalidate_event_caches(event_key)
             else:
                 # Create new event
                 # Note: INFORM API auto-generates keys, so we can't use the path key
@@ -891,21 +1057,13 @@ class InformCalDAVBackend:
             final_event = await self.api_client.get_calendar_event(event_key, fields=["all"])
 
             # Convert back to iCalendar (as single occurrence)
-            result_ical = self._inform_occurrence_to_ical(final_event)
-            etag = md5(result_ical.encode()).hexdigest()
+            result_ical, encoded, etag = self._cached_occurrence_ical(final_event)
 
             # Update path to use INFORM key as UID (if event was newly created)
             if not event_exists:
-                calendar_path = self._get_calendar_path()
-                path = f"{calendar_path}{event_key}.ics"
-
-            return CalendarObject(
-                path=path,
-                data=result_ical,
-                mod_time=datetime.now(UTC),
-                content_length=len(result_ical.encode()),
-                etag=etag,
-            )
+                path = f"{self._calendar_path}{event_key}.ics"
+
+            return _make_object(path, result_ical, encoded, etag, datetime.now(UTC))
 
         except Exception as e:
             raise HTTPError(500, Exception(f"Failed to save event: {e}")) from e
@@ -923,25 +1081,24 @@ class InformCalDAVBackend:
         event_key = path_str
         occurrence_id = None
 
-        if "-" in path_str:
-            parts = path_str.rsplit("-", 1)
-            potential_key = parts[0]
-            potential_occ_id = parts[1] if len(parts) > 1 else None
+        potential_key, potential_occ_id = _split_occurrence_name(path_str)
 
-            if potential_occ_id:
-                # Verify this is actually an occurrence by trying to get it
-                try:
-                    await self.api_client.get_calendar_event_occurrence(
-                        potential_key, potential_occ_id, fields=["key"]
-                    )
-                    # If we get here, it's a valid occurrence
-                    is_occurrence = True
-                    event_key = potential_key
-                    occurrence_id = potential_occ_id
-                except Exception:
-                    # Not an occurrence, treat as single event
-                    is_occurrence = False
-                    event_key = path_str
+        if potential_occ_id:
+            # Verify this is actually an occurrence by trying to get it
+            try:
+                await self.api_client.get_calendar_event_occurrence(
+                    potential_key, potential_occ_id, fields=["key"]
+                )
+                # If we get here, it's a valid occurrence
+                is_occurrence = True
+                event_key = potential_key
+                occurrence_id = potential_occ_id
+            except Exception:
+                # Not an occurrence, treat as single event
+                is_occurrence = False
+                event_key = path_str
+
+        self._invalidate_event_caches(event_key)
 
         if is_occurrence and occurrence_id:
             # Delete individual occurrence
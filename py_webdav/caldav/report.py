@@ -10,6 +10,21 @@ from lxml import etree
 NAMESPACE = "DAV:"
 CALDAV_NAMESPACE = "urn:ietf:params:xml:ns:caldav"
 
+# Common XML names
+PROP = f"{{{NAMESPACE}}}prop"
+ALLPROP = f"{{{NAMESPACE}}}allprop"
+PROPNAME = f"{{{NAMESPACE}}}propname"
+HREF = f"{{{NAMESPACE}}}href"
+FILTER = f"{{{CALDAV_NAMESPACE}}}filter"
+CALENDAR_QUERY = f"{{{CALDAV_NAMESPACE}}}calendar-query"
+CALENDAR_MULTIGET = f"{{{CALDAV_NAMESPACE}}}calendar-multiget"
+
+# Supported CalDAV REPORT root elements
+REPORT_TAGS = frozenset({CALENDAR_QUERY, CALENDAR_MULTIGET})
+
+# Upper bound on REPORT child elements (hrefs, props, filters)
+MAX_REPORT_CHILDREN = 10_000
+
 
 @dataclass
 class CalendarQueryReport:
@@ -43,14 +58,14 @@ def parse_calendar_report(root: etree._Element) -> CalendarQueryReport | Calenda
     Raises:
         ValueError: If the REPORT request is invalid
     """
-    # Check if it's calendar-query
-    if root.tag == f"{{{CALDAV_NAMESPACE}}}calendar-query":
-        return _parse_calendar_query(root)
-    # Check if it's calendar-multiget
-    elif root.tag == f"{{{CALDAV_NAMESPACE}}}calendar-multiget":
-        return _parse_calendar_multiget(root)
-    else:
+    if root.tag not in REPORT_TAGS:
         raise ValueError(f"Unknown CalDAV REPORT type: {root.tag}")
+    if len(root) > MAX_REPORT_CHILDREN:
+        raise ValueError(f"CalDAV REPORT has more than {MAX_REPORT_CHILDREN} elements")
+
+    if root.tag == CALENDAR_QUERY:
+        return _parse_calendar_query(root)
+    return _parse_calendar_multiget(root)
 
 
 def _parse_calendar_query(root: etree._Element) -> CalendarQueryReport:
@@ -59,13 +74,14 @@ def _parse_calendar_query(root: etree._Element) -> CalendarQueryReport:
 
     # Parse prop/allprop/propname
     for child in root:
-        if child.tag == f"{{{NAMESPACE}}}prop":
+        tag = child.tag
+        if tag == PROP:
             report.prop = [prop.tag for prop in child]
-        elif child.tag == f"{{{NAMESPACE}}}allprop":
+        elif tag == ALLPROP:
             report.allprop = True
-        elif child.tag == f"{{{NAMESPACE}}}propname":
+        elif tag == PROPNAME:
             report.propname = True
-        elif child.tag == f"{{{CALDAV_NAMESPACE}}}filter":
+        elif tag == FILTER:
             # For now, we'll just note that there's a filter
             # Full filter parsing would go here
             report.filter = child
@@ -75,26 +91,16 @@ def _parse_calendar_query(root: etree._Element) -> CalendarQueryReport:
 
 def _parse_calendar_multiget(root: etree._Element) -> CalendarMultigetReport:
     """Parse calendar-multiget REPORT."""
-    hrefs: list[str] = []
-    prop: list[str] | None = None
-    allprop = False
-    propname = False
+    # Let lxml walk the (potentially long) href list; drop duplicates but
+    # keep the client's order (dicts preserve insertion order)
+    hrefs = list(dict.fromkeys(href.text for href in root.iterfind(HREF) if href.text))
 
-    # Parse hrefs and prop/allprop/propname
-    for child in root:
-        if child.tag == f"{{{NAMESPACE}}}href":
-            if child.text:
-                hrefs.append(child.text)
-        elif child.tag == f"{{{NAMESPACE}}}prop":
-            prop = [p.tag for p in child]
-        elif child.tag == f"{{{NAMESPACE}}}allprop":
-            allprop = True
-        elif child.tag == f"{{{NAMESPACE}}}propname":
-            propname = True
+    prop_el = root.find(PROP)
+    prop = [p.tag for p in prop_el] if prop_el is not None else None
 
     return CalendarMultigetReport(
         hrefs=hrefs,
         prop=prop,
-        allprop=allprop,
-        propname=propname,
+        allprop=root.find(ALLPROP) is not None,
+        propname=root.find(PROPNAME) is not None,
     )
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import datetime
+import asyncio
+import copy
+import itertools
+import math
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import format_datetime
 from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Protocol, TypeVar
 
 from lxml import etree
+from lxml.builder import ElementMaker
 from starlette.requests import Request
 from starlette.responses import Response
 
@@ -14,14 +23,69 @@ from ..internal import (
     CurrentUserPrincipal,
     Depth,
     Href,
-    MultiStatus,
     PropFind,
+    is_not_found,
 )
 from ..internal import Response as WebDAVResponse
-from ..internal.elements import COLLECTION, NAMESPACE
-from ..internal.server import serve_multistatus
+from ..internal.elements import (
+    CURRENT_USER_PRINCIPAL,
+    CURRENT_USER_PRIVILEGE_SET,
+    DISPLAY_NAME,
+    GET_CONTENT_LENGTH,
+    GET_CONTENT_TYPE,
+    GET_ETAG,
+    GET_LAST_MODIFIED,
+    NAMESPACE,
+    RESOURCE_TYPE,
+    Prop,
+    PropStat,
+    Status,
+)
+from ..internal.server import serve_multistatus_stream
 from .backend import CalDAVBackend
-from .report import CalendarMultigetReport, CalendarQueryReport
+from .caldav import Calendar, CalendarObject
+from .report import CALDAV_NAMESPACE, CalendarMultigetReport, CalendarQueryReport
+
+# Common XML names
+CALENDAR_HOME_SET = f"{{{CALDAV_NAMESPACE}}}calendar-home-set"
+CALENDAR_DESCRIPTION = f"{{{CALDAV_NAMESPACE}}}calendar-description"
+CALENDAR_DATA = f"{{{CALDAV_NAMESPACE}}}calendar-data"
+SUPPORTED_CALENDAR_COMPONENT_SET = f"{{{CALDAV_NAMESPACE}}}supported-calendar-component-set"
+SUPPORTED_CALENDAR_DATA = f"{{{CALDAV_NAMESPACE}}}supported-calendar-data"
+
+# Shared propstat statuses
+STATUS_OK = Status(code=200, text="OK")
+STATUS_NOT_FOUND = Status(code=404, text="Not Found")
+_STATUS_OK_LINE = STATUS_OK.to_string()
+_STATUS_NOT_FOUND_LINE = STATUS_NOT_FOUND.to_string()
+
+# Placeholder modification time for building response templates
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+# Value handed to the property builders of a table: a _CollectionContext for
+# collections, the CalendarObject itself for calendar objects
+_Ctx = TypeVar("_Ctx")
+
+# Concurrent lookups for backends without get_calendar_objects
+MULTIGET_CONCURRENCY = 16
+
+
+class _ElementMaker(Protocol):
+    """Typed view of lxml.builder.ElementMaker, which ships without stubs."""
+
+    def __call__(self, tag: str, *children: Any) -> etree._Element: ...
+
+    def __getattr__(self, tag: str) -> Callable[..., etree._Element]: ...
+
+
+# Element builders bound to the DAV: and CalDAV namespaces
+E: _ElementMaker = ElementMaker(namespace=NAMESPACE)
+E_CAL: _ElementMaker = ElementMaker(namespace=CALDAV_NAMESPACE)
+
+# Shared parser for REPORT bodies; entities are never expanded
+_REPORT_PARSER = etree.XMLParser(
+    remove_blank_text=True, collect_ids=False, resolve_entities=False, no_network=True
+)
 
 
 class ResourceType(IntEnum):
@@ -53,8 +117,11 @@ def detect_resource_type(path: str, prefix: str = "") -> ResourceType:
     if p == "/":
         return ResourceType.ROOT
 
-    # Count path segments (depth)
-    depth = len([s for s in p.split("/") if s])
+    # Count path segments (depth); p starts with "/" so each other "/" adds one
+    depth = p.count("/") - p.endswith("/")
+    if "//" in p:
+        # Empty segments don't add depth
+        depth = len([s for s in p.split("/") if s])
     return ResourceType(min(depth, ResourceType.CALENDAR_OBJECT))
 
 
@@ -81,6 +148,7 @@ async def handle_caldav_propfind(
     """
     resource_type = detect_resource_type(request.url.path)
     responses = []
+    objects = []
 
     if resource_type == ResourceType.CALENDAR_HOME_SET:
         if request.url.path == calendar_home_path:
@@ -110,15 +178,11 @@ async def handle_caldav_propfind(
                 # If depth > 0, list calendar objects
                 if depth == Depth.ONE:
                     objects = await backend.list_calendar_objects(request, calendar.path)
-                    for obj in objects:
-                        resp = _propfind_calendar_object(obj, propfind)
-                        responses.append(resp)
             except Exception:
                 # Calendar not found or error
                 pass
 
-    ms = MultiStatus(responses=responses)
-    return serve_multistatus(ms)
+    return _serve_calendar_objects(responses, objects, propfind)
 
 
 def _propfind_calendar_home_set(
@@ -135,64 +199,63 @@ def _propfind_calendar_home_set(
     Returns:
         WebDAV Response
     """
-    from ..internal.elements import Prop, PropStat, Status
+    ctx = _CollectionContext(principal_path=principal_path, home_set_path=home_set_path)
+    return _propfind_response(path, propfind, _HOME_SET_PROPS, ctx)
 
-    # Build property functions
-    props: dict[str, Callable] = {}
 
-    # Resource type - collection
-    props[f"{{{NAMESPACE}}}resourcetype"] = lambda: _create_resource_type_collection()
+def _prop_signature(propfind: PropFind) -> tuple[str, ...] | None:
+    """Return the requested property names, or None for allprop/propname.
 
-    # Current user principal
-    props[f"{{{NAMESPACE}}}current-user-principal"] = lambda: _create_current_user_principal(
-        principal_path
-    )
+    allprop and propname list the same properties, so they share a signature.
+    """
+    if propfind.allprop or propfind.propname:
+        return None
+    raw = propfind.prop.raw if propfind.prop else []
+    return tuple(_qualified_tag(prop_elem) for prop_elem in raw)
 
-    # Calendar home set - self-reference
-    props["{urn:ietf:params:xml:ns:caldav}calendar-home-set"] = lambda: _create_calendar_home_set(
-        home_set_path
-    )
 
-    # Display name
-    props[f"{{{NAMESPACE}}}displayname"] = lambda: _create_displayname("Calendars")
+def _propfind_from_signature(prop_sig: tuple[str, ...] | None) -> PropFind:
+    """Rebuild an equivalent PropFind from a property signature."""
+    if prop_sig is None:
+        return PropFind(allprop=True)
+    return PropFind(prop=Prop(raw=[etree.Element(name) for name in prop_sig]))
 
-    # Determine which properties to return
-    requested_props = []
-    if propfind.allprop:
-        requested_props = list(props.keys())
-    elif propfind.propname:
-        requested_props = list(props.keys())
-    elif propfind.prop:
-        for prop_elem in propfind.prop.raw:
-            # Get the full qualified name
-            if "}" in prop_elem.tag:
-                prop_name = prop_elem.tag
-            else:
-                ns = prop_elem.nsmap.get(prop_elem.prefix) if prop_elem.prefix else ""
-                tag = prop_elem.tag.split("}")[-1]
-                prop_name = f"{{{ns}}}{tag}" if ns else tag
-            requested_props.append(prop_name)
-
-    # Build prop element with found properties
-    found_props = []
-    not_found_props = []
 
-    for prop_name in requested_props:
-        if prop_name in props:
-            try:
-                prop_value = props[prop_name]()
-                found_props.append(prop_value)
-            except Exception:
-                not_found_props.append(prop_name)
-        else:
-            not_found_props.append(prop_name)
+def _qualified_tag(elem: etree._Element) -> str:
+    """Return the Clark-notation name of a requested property element."""
+    tag = elem.tag
+    # lxml already qualifies namespaced tags, so this is the common case
+    if tag[0] == "{" or not elem.prefix:
+        return tag
+    ns = elem.nsmap.get(elem.prefix)
+    return f"{{{ns}}}{tag}" if ns else tag
+
+
+def _propfind_response(
+    path: str,
+    propfind: PropFind,
+    props: Mapping[str, Callable[[_Ctx], etree._Element | None]],
+    ctx: _Ctx,
+) -> WebDAVResponse:
+    """Create PROPFIND response from a property table.
+
+    Args:
+        path: Resource path
+        propfind: PropFind request
+        props: Property builders keyed by qualified name
+        ctx: Value passed to each builder
+
+    Returns:
+        WebDAV Response
+    """
+    found_props, not_found_props = _resolve_props(propfind, props, ctx)
 
     # Create propstats
     propstats = []
 
     if found_props:
         prop = Prop(raw=found_props)
-        propstat = PropStat(prop=prop, status=Status(code=200, text="OK"), response_description="")
+        propstat = PropStat(prop=prop, status=STATUS_OK, response_description="")
         propstats.append(propstat)
 
     if not_found_props:
@@ -202,9 +265,7 @@ def _propfind_calendar_home_set(
             not_found_elements.append(elem)
 
         prop = Prop(raw=not_found_elements)
-        propstat = PropStat(
-            prop=prop, status=Status(code=404, text="Not Found"), response_description=""
-        )
+        propstat = PropStat(prop=prop, status=STATUS_NOT_FOUND, response_description="")
         propstats.append(propstat)
 
     return WebDAVResponse(
@@ -214,11 +275,57 @@ def _propfind_calendar_home_set(
     )
 
 
+def _resolve_props(
+    propfind: PropFind,
+    props: Mapping[str, Callable[[_Ctx], etree._Element | None]],
+    ctx: _Ctx,
+) -> tuple[list[etree._Element], list[str]]:
+    """Build the requested properties from a property table.
+
+    Builders may return None for properties the resource does not have; those
+    are left out of allprop/propname listings and reported as not found when
+    requested explicitly.
+
+    Args:
+        propfind: PropFind request
+        props: Property builders keyed by qualified name
+        ctx: Value passed to each builder
+
+    Returns:
+        Tuple of (found property elements, names of properties not found)
+    """
+    # Determine which properties to return
+    listing = propfind.allprop or propfind.propname
+    requested_props = []
+    if listing:
+        requested_props = list(props)
+    elif propfind.prop:
+        requested_props = [_qualified_tag(prop_elem) for prop_elem in propfind.prop.raw]
+
+    found_props: list[etree._Element] = []
+    not_found_props: list[str] = []
+
+    for prop_name in requested_props:
+        build = props.get(prop_name)
+        if build is None:
+            not_found_props.append(prop_name)
+            continue
+        try:
+            prop_value = build(ctx)
+        except Exception:
+            not_found_props.append(prop_name)
+            continue
+        if prop_value is not None:
+            found_props.append(prop_value)
+        elif not listing:
+            not_found_props.append(prop_name)
+
+    return found_props, not_found_props
+
+
 def _create_resource_type_collection() -> etree._Element:
     """Create resourcetype XML element for collection."""
-    rt = etree.Element(f"{{{NAMESPACE}}}resourcetype")
-    etree.SubElement(rt, COLLECTION)
-    return rt
+    return E.resourcetype(E.collection())
 
 
 def _create_current_user_principal(path: str) -> etree._Element:
@@ -229,21 +336,16 @@ def _create_current_user_principal(path: str) -> etree._Element:
 
 def _create_calendar_home_set(path: str) -> etree._Element:
     """Create calendar-home-set XML element."""
-    elem = etree.Element("{urn:ietf:params:xml:ns:caldav}calendar-home-set")
-    href = etree.SubElement(elem, f"{{{NAMESPACE}}}href")
-    href.text = path
-    return elem
+    return E_CAL("calendar-home-set", E.href(path))
 
 
 def _create_displayname(name: str) -> etree._Element:
     """Create displayname XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}displayname")
-    elem.text = name
-    return elem
+    return E.displayname(name)
 
 
 def _propfind_calendar(
-    calendar, propfind: PropFind, principal_path: str, home_set_path: str
+    calendar: Calendar, propfind: PropFind, principal_path: str, home_set_path: str
 ) -> WebDAVResponse:
     """Create PROPFIND response for a calendar collection.
 
@@ -256,286 +358,256 @@ def _propfind_calendar(
     Returns:
         WebDAV Response
     """
-    from ..internal.elements import Prop, PropStat, Status
-
-    # Build property functions
-    props: dict[str, Callable] = {}
-
-    # Resource type - collection with calendar
-    props[f"{{{NAMESPACE}}}resourcetype"] = lambda: _create_calendar_resourcetype()
-
-    # Current user principal
-    props[f"{{{NAMESPACE}}}current-user-principal"] = lambda: _create_current_user_principal(
-        principal_path
+    ctx = _CalendarContext(
+        principal_path=principal_path, home_set_path=home_set_path, calendar=calendar
     )
+    return _propfind_response(calendar.path, propfind, _CALENDAR_PROPS, ctx)
 
-    # Calendar home set
-    props["{urn:ietf:params:xml:ns:caldav}calendar-home-set"] = lambda: _create_calendar_home_set(
-        home_set_path
-    )
-
-    # Display name
-    props[f"{{{NAMESPACE}}}displayname"] = lambda: _create_displayname(calendar.name)
 
-    # Supported calendar components
-    props["{urn:ietf:params:xml:ns:caldav}supported-calendar-component-set"] = (
-        lambda: _create_supported_components(calendar.supported_component_set)
-    )
+def _propfind_calendar_object(obj: CalendarObject, propfind: PropFind) -> WebDAVResponse:
+    """Create PROPFIND response for a calendar object.
 
-    # Calendar description
-    if calendar.description:
-        props["{urn:ietf:params:xml:ns:caldav}calendar-description"] = (
-            lambda: _create_calendar_description(calendar.description)
-        )
+    Args:
+        obj: CalendarObject
+        propfind: PropFind request
 
-    # Supported calendar data (iCalendar MIME type)
-    props["{urn:ietf:params:xml:ns:caldav}supported-calendar-data"] = (
-        lambda: _create_supported_calendar_data()
-    )
+    Returns:
+        WebDAV Response
+    """
+    return _propfind_response(obj.path, propfind, _CALENDAR_OBJECT_PROPS, obj)
 
-    # Current user privilege set (read/write)
-    props[f"{{{NAMESPACE}}}current-user-privilege-set"] = (
-        lambda: _create_current_user_privilege_set()
-    )
 
-    # Determine which properties to return
-    requested_props = []
-    if propfind.allprop:
-        requested_props = list(props.keys())
-    elif propfind.propname:
-        requested_props = list(props.keys())
-    elif propfind.prop:
-        for prop_elem in propfind.prop.raw:
-            if "}" in prop_elem.tag:
-                prop_name = prop_elem.tag
-            else:
-                ns = prop_elem.nsmap.get(prop_elem.prefix) if prop_elem.prefix else ""
-                tag = prop_elem.tag.split("}")[-1]
-                prop_name = f"{{{ns}}}{tag}" if ns else tag
-            requested_props.append(prop_name)
-
-    # Build prop element with found properties
-    found_props = []
-    not_found_props = []
+def _calendar_object_response_xml(obj: CalendarObject, propfind: PropFind) -> etree._Element:
+    """Create the PROPFIND response element for a calendar object directly.
 
-    for prop_name in requested_props:
-        if prop_name in props:
-            try:
-                prop_value = props[prop_name]()
-                found_props.append(prop_value)
-            except Exception:
-                not_found_props.append(prop_name)
-        else:
-            not_found_props.append(prop_name)
+    Args:
+        obj: CalendarObject
+        propfind: PropFind request
 
-    # Create propstats
-    propstats = []
+    Returns:
+        DAV:response element
+    """
+    found_props, not_found_props = _resolve_props(propfind, _CALENDAR_OBJECT_PROPS, obj)
 
+    resp = E.response(E.href(obj.path))
     if found_props:
-        prop = Prop(raw=found_props)
-        propstat = PropStat(prop=prop, status=Status(code=200, text="OK"), response_description="")
-        propstats.append(propstat)
-
+        resp.append(E.propstat(E.prop(*found_props), E.status(_STATUS_OK_LINE)))
     if not_found_props:
-        not_found_elements = []
-        for prop_name in not_found_props:
-            elem = etree.Element(prop_name)
-            not_found_elements.append(elem)
-
-        prop = Prop(raw=not_found_elements)
-        propstat = PropStat(
-            prop=prop, status=Status(code=404, text="Not Found"), response_description=""
-        )
-        propstats.append(propstat)
+        not_found_elements = [etree.Element(prop_name) for prop_name in not_found_props]
+        resp.append(E.propstat(E.prop(*not_found_elements), E.status(_STATUS_NOT_FOUND_LINE)))
+    return resp
 
-    return WebDAVResponse(
-        hrefs=[Href.from_string(calendar.path)],
-        propstats=propstats,
-        status=None,
-    )
 
+def _serve_calendar_objects(
+    responses: list[WebDAVResponse], objects: list[CalendarObject], propfind: PropFind
+) -> Response:
+    """Serve a multistatus of collection responses followed by calendar objects.
 
-def _propfind_calendar_object(obj, propfind: PropFind) -> WebDAVResponse:
-    """Create PROPFIND response for a calendar object.
+    Calendar object rows are the bulk of most responses, so they are built as
+    XML directly instead of going through Response/PropStat/Prop, one at a time
+    while the multistatus is streamed.
 
     Args:
-        obj: CalendarObject
+        responses: Responses for collections, listed first
+        objects: Calendar objects
         propfind: PropFind request
 
     Returns:
-        WebDAV Response
+        Multi-status response
     """
-    from ..internal.elements import Prop, PropStat, Status
-
-    # Build property functions
-    props: dict[str, Callable] = {}
+    prop_sig = _prop_signature(propfind)
+    rows = (_calendar_object_row(obj, propfind, prop_sig) for obj in objects)
+    return serve_multistatus_stream(itertools.chain((resp.to_xml() for resp in responses), rows))
 
-    # Resource type - empty for non-collections
-    props[f"{{{NAMESPACE}}}resourcetype"] = lambda: etree.Element(f"{{{NAMESPACE}}}resourcetype")
 
-    # ETag
-    props[f"{{{NAMESPACE}}}getetag"] = lambda: _create_etag(obj.etag)
+def _calendar_object_row(
+    obj: CalendarObject, propfind: PropFind, prop_sig: tuple[str, ...] | None
+) -> etree._Element:
+    """Create a calendar object response by filling in a cached row template.
 
-    # Content length
-    props[f"{{{NAMESPACE}}}getcontentlength"] = lambda: _create_content_length(obj.content_length)
+    Args:
+        obj: CalendarObject
+        propfind: PropFind request
+        prop_sig: Property signature of propfind
 
-    # Content type
-    props[f"{{{NAMESPACE}}}getcontenttype"] = lambda: _create_content_type("text/calendar")
+    Returns:
+        DAV:response element
+    """
+    template, fillers = _calendar_object_row_template(prop_sig, obj.mod_time is not None)
 
-    # Last modified
-    if obj.mod_time:
-        props[f"{{{NAMESPACE}}}getlastmodified"] = lambda: _create_last_modified(obj.mod_time)
+    row = copy.deepcopy(template)
+    row[0].text = obj.path
+    try:
+        for index, text in fillers:
+            value = text(obj)
+            if value is None:
+                raise ValueError("property not available")
+            row[1][0][index].text = value
+    except Exception:
+        # Let the builders decide which properties are unavailable
+        return _calendar_object_response_xml(obj, propfind)
+    return row
 
-    # Calendar data (the actual iCalendar content)
-    CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
-    props[f"{{{CALDAV_NS}}}calendar-data"] = lambda: _create_calendar_data(obj.data)
 
-    # Determine which properties to return
-    requested_props = []
-    if propfind.allprop:
-        requested_props = list(props.keys())
-    elif propfind.propname:
-        requested_props = list(props.keys())
-    elif propfind.prop:
-        for prop_elem in propfind.prop.raw:
-            if "}" in prop_elem.tag:
-                prop_name = prop_elem.tag
-            else:
-                ns = prop_elem.nsmap.get(prop_elem.prefix) if prop_elem.prefix else ""
-                tag = prop_elem.tag.split("}")[-1]
-                prop_name = f"{{{ns}}}{tag}" if ns else tag
-            requested_props.append(prop_name)
-
-    # Build prop element with found properties
-    found_props = []
-    not_found_props = []
+@lru_cache(maxsize=64)
+def _calendar_object_row_template(
+    prop_sig: tuple[str, ...] | None, has_mod_time: bool
+) -> tuple[etree._Element, tuple[tuple[int, Callable[[CalendarObject], str | None]], ...]]:
+    """Build the response skeleton shared by calendar objects.
 
-    for prop_name in requested_props:
-        if prop_name in props:
-            try:
-                prop_value = props[prop_name]()
-                found_props.append(prop_value)
-            except Exception:
-                not_found_props.append(prop_name)
-        else:
-            not_found_props.append(prop_name)
+    Rows only differ in their href and the text of a few properties, so the
+    skeleton is built once per property signature and copied for each object.
 
-    # Create propstats
-    propstats = []
+    Args:
+        prop_sig: Requested property names, or None for allprop/propname
+        has_mod_time: Whether the objects have a modification time
 
-    if found_props:
-        prop = Prop(raw=found_props)
-        propstat = PropStat(prop=prop, status=Status(code=200, text="OK"), response_description="")
-        propstats.append(propstat)
+    Returns:
+        Tuple of (response template, (found property index, text function) pairs)
+    """
+    sample = CalendarObject(path="", data="", mod_time=_EPOCH if has_mod_time else None)
+    template = _calendar_object_response_xml(sample, _propfind_from_signature(prop_sig))
 
-    if not_found_props:
-        not_found_elements = []
-        for prop_name in not_found_props:
-            elem = etree.Element(prop_name)
-            not_found_elements.append(elem)
-
-        prop = Prop(raw=not_found_elements)
-        propstat = PropStat(
-            prop=prop, status=Status(code=404, text="Not Found"), response_description=""
-        )
-        propstats.append(propstat)
-
-    return WebDAVResponse(
-        hrefs=[Href.from_string(obj.path)],
-        propstats=propstats,
-        status=None,
-    )
+    fillers = []
+    if len(template) > 1 and template[1][-1].text == _STATUS_OK_LINE:
+        for index, elem in enumerate(template[1][0]):
+            text = _CALENDAR_OBJECT_TEXT.get(elem.tag)
+            if text is not None:
+                fillers.append((index, text))
+    return template, tuple(fillers)
 
 
 def _create_calendar_resourcetype() -> etree._Element:
     """Create resourcetype XML element for calendar."""
-    rt = etree.Element(f"{{{NAMESPACE}}}resourcetype")
-    etree.SubElement(rt, COLLECTION)
-    etree.SubElement(rt, "{urn:ietf:params:xml:ns:caldav}calendar")
-    return rt
+    return E.resourcetype(E.collection(), E_CAL.calendar())
 
 
 def _create_supported_components(components: list[str]) -> etree._Element:
     """Create supported-calendar-component-set XML element."""
-    elem = etree.Element("{urn:ietf:params:xml:ns:caldav}supported-calendar-component-set")
-    for comp in components:
-        comp_elem = etree.SubElement(elem, "{urn:ietf:params:xml:ns:caldav}comp")
-        comp_elem.set("name", comp)
-    return elem
+    return E_CAL(
+        "supported-calendar-component-set", *(E_CAL.comp(name=comp) for comp in components)
+    )
 
 
 def _create_etag(etag: str) -> etree._Element:
     """Create getetag XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}getetag")
-    elem.text = f'"{etag}"'
-    return elem
+    return E.getetag(f'"{etag}"')
 
 
 def _create_content_length(length: int) -> etree._Element:
     """Create getcontentlength XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}getcontentlength")
-    elem.text = str(length)
-    return elem
+    return E.getcontentlength(str(length))
 
 
 def _create_content_type(content_type: str) -> etree._Element:
     """Create getcontenttype XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}getcontenttype")
-    elem.text = content_type
-    return elem
+    return E.getcontenttype(content_type)
 
 
 def _create_last_modified(dt: datetime) -> etree._Element:
     """Create getlastmodified XML element."""
-    from email.utils import format_datetime
+    return E.getlastmodified(_http_date(dt))
+
 
-    elem = etree.Element(f"{{{NAMESPACE}}}getlastmodified")
-    elem.text = format_datetime(dt, usegmt=True)
-    return elem
+def _http_date(dt: datetime) -> str:
+    """Format a datetime as an HTTP date."""
+    if dt.tzinfo is None:
+        # Naive datetimes are rejected by format_datetime
+        return format_datetime(dt, usegmt=True)
+    return _http_date_from_epoch(math.floor(dt.timestamp()))
+
+
+@lru_cache(maxsize=8192)
+def _http_date_from_epoch(ts: int) -> str:
+    """Format a POSIX timestamp as an HTTP date."""
+    return format_datetime(datetime.fromtimestamp(ts, tz=UTC), usegmt=True)
 
 
 def _create_calendar_description(description: str) -> etree._Element:
     """Create calendar-description XML element."""
-    CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
-    elem = etree.Element(f"{{{CALDAV_NS}}}calendar-description")
-    elem.text = description
-    return elem
+    return E_CAL("calendar-description", description)
 
 
 def _create_supported_calendar_data() -> etree._Element:
     """Create supported-calendar-data XML element."""
-    CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
-    elem = etree.Element(f"{{{CALDAV_NS}}}supported-calendar-data")
-
-    # Add iCalendar 2.0 support
-    cal_data_type = etree.SubElement(elem, f"{{{CALDAV_NS}}}calendar-data")
-    cal_data_type.set("content-type", "text/calendar")
-    cal_data_type.set("version", "2.0")
-
-    return elem
+    # Advertise iCalendar 2.0 support
+    return E_CAL(
+        "supported-calendar-data",
+        E_CAL("calendar-data", {"content-type": "text/calendar", "version": "2.0"}),
+    )
 
 
 def _create_current_user_privilege_set() -> etree._Element:
     """Create current-user-privilege-set XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}current-user-privilege-set")
+    # Read and write privileges
+    return E(
+        "current-user-privilege-set",
+        E.privilege(E.read()),
+        E.privilege(E.write()),
+    )
 
-    # Add read privilege
-    privilege = etree.SubElement(elem, f"{{{NAMESPACE}}}privilege")
-    etree.SubElement(privilege, f"{{{NAMESPACE}}}read")
 
-    # Add write privilege
-    privilege = etree.SubElement(elem, f"{{{NAMESPACE}}}privilege")
-    etree.SubElement(privilege, f"{{{NAMESPACE}}}write")
+def _create_calendar_data(ical_data: str) -> etree._Element:
+    """Create calendar-data XML element with iCalendar content."""
+    return E_CAL("calendar-data", ical_data)
 
-    return elem
 
+@dataclass
+class _CollectionContext:
+    """Values read by the home set property builders."""
 
-def _create_calendar_data(ical_data: str) -> etree._Element:
-    """Create calendar-data XML element with iCalendar content."""
-    CALDAV_NS = "urn:ietf:params:xml:ns:caldav"
-    elem = etree.Element(f"{{{CALDAV_NS}}}calendar-data")
-    elem.text = ical_data
-    return elem
+    principal_path: str
+    home_set_path: str
+
+
+@dataclass
+class _CalendarContext(_CollectionContext):
+    """Values read by the calendar property builders."""
+
+    calendar: Calendar
+
+
+# Property builders, in the order they are listed for allprop/propname
+_HOME_SET_PROPS: dict[str, Callable[[_CollectionContext], etree._Element | None]] = {
+    RESOURCE_TYPE: lambda ctx: _create_resource_type_collection(),
+    CURRENT_USER_PRINCIPAL: lambda ctx: _create_current_user_principal(ctx.principal_path),
+    CALENDAR_HOME_SET: lambda ctx: _create_calendar_home_set(ctx.home_set_path),
+    DISPLAY_NAME: lambda ctx: _create_displayname("Calendars"),
+}
+
+_CALENDAR_PROPS: dict[str, Callable[[_CalendarContext], etree._Element | None]] = {
+    RESOURCE_TYPE: lambda ctx: _create_calendar_resourcetype(),
+    CURRENT_USER_PRINCIPAL: lambda ctx: _create_current_user_principal(ctx.principal_path),
+    CALENDAR_HOME_SET: lambda ctx: _create_calendar_home_set(ctx.home_set_path),
+    DISPLAY_NAME: lambda ctx: _create_displayname(ctx.calendar.name),
+    SUPPORTED_CALENDAR_COMPONENT_SET: lambda ctx: _create_supported_components(
+        ctx.calendar.supported_component_set
+    ),
+    CALENDAR_DESCRIPTION: lambda ctx: (
+        _create_calendar_description(ctx.calendar.description) if ctx.calendar.description else None
+    ),
+    SUPPORTED_CALENDAR_DATA: lambda ctx: _create_supported_calendar_data(),
+    CURRENT_USER_PRIVILEGE_SET: lambda ctx: _create_current_user_privilege_set(),
+}
+
+_CALENDAR_OBJECT_PROPS: dict[str, Callable[[CalendarObject], etree._Element | None]] = {
+    # Resource type - empty for non-collections
+    RESOURCE_TYPE: lambda obj: E.resourcetype(),
+    GET_ETAG: lambda obj: _create_etag(obj.etag),
+    GET_CONTENT_LENGTH: lambda obj: _create_content_length(obj.content_length),
+    GET_CONTENT_TYPE: lambda obj: _create_content_type("text/calendar"),
+    GET_LAST_MODIFIED: lambda obj: _create_last_modified(obj.mod_time) if obj.mod_time else None,
+    CALENDAR_DATA: lambda obj: _create_calendar_data(obj.data),
+}
+
+# Text of the calendar object properties that differ between objects; None
+# means the object does not have the property
+_CALENDAR_OBJECT_TEXT: dict[str, Callable[[CalendarObject], str | None]] = {
+    GET_ETAG: lambda obj: f'"{obj.etag}"',
+    GET_CONTENT_LENGTH: lambda obj: str(obj.content_length),
+    GET_LAST_MODIFIED: lambda obj: _http_date(obj.mod_time) if obj.mod_time else None,
+    CALENDAR_DATA: lambda obj: obj.data,
+}
 
 
 async def handle_caldav_report(
@@ -559,11 +631,10 @@ async def handle_caldav_report(
 
     # Parse REPORT request body
     body = await request.body()
-    root = etree.fromstring(body)
 
     try:
-        report = parse_calendar_report(root)
-    except ValueError as e:
+        report = parse_calendar_report(etree.fromstring(body, _REPORT_PARSER))
+    except (etree.XMLSyntaxError, ValueError) as e:
         from starlette.responses import Response as StarletteResponse
 
         return StarletteResponse(content=str(e), status_code=400)
@@ -590,7 +661,6 @@ async def _handle_calendar_query(
     backend,  # CalDAVBackend
 ) -> Response:
     """Handle calendar-query REPORT."""
-    from ..internal.elements import Prop
     from .caldav import CalendarCompRequest, CalendarQuery, CompFilter
 
     # Build CalendarQuery from the parsed report
@@ -619,14 +689,7 @@ async def _handle_calendar_query(
         propname=query.propname,
     )
 
-    # Build responses for each object
-    responses = []
-    for obj in objects:
-        resp = _propfind_calendar_object(obj, propfind)
-        responses.append(resp)
-
-    ms = MultiStatus(responses=responses)
-    return serve_multistatus(ms)
+    return _serve_calendar_objects([], objects, propfind)
 
 
 async def _handle_calendar_multiget(
@@ -634,11 +697,14 @@ async def _handle_calendar_multiget(
     multiget: CalendarMultigetReport,
     calendar_home_path: str,
     principal_path: str,
-    backend,  # CalDAVBackend
+    backend: CalDAVBackend,
 ) -> Response:
-    """Handle calendar-multiget REPORT."""
-    from ..internal.elements import Prop
+    """Handle calendar-multiget REPORT.
 
+    Backend failures other than missing objects propagate, so they are answered
+    with an error status instead of a multistatus that looks like every
+    requested event was deleted.
+    """
     # Build PropFind from multiget
     prop_obj = None
     if multiget.prop:
@@ -652,16 +718,46 @@ async def _handle_calendar_multiget(
         propname=multiget.propname,
     )
 
-    # Fetch each requested href
-    responses = []
-    for href in multiget.hrefs:
-        try:
-            obj = await backend.get_calendar_object(request, href)
-            resp = _propfind_calendar_object(obj, propfind)
-            responses.append(resp)
-        except Exception:
-            # If object not found, skip it
-            continue
+    # Fetch all requested hrefs at once (missing ones are skipped)
+    objects = await _fetch_calendar_objects(request, backend, multiget.hrefs)
+
+    return _serve_calendar_objects([], objects, propfind)
+
+
+async def _fetch_calendar_objects(
+    request: Request, backend: CalDAVBackend, paths: list[str]
+) -> list[CalendarObject]:
+    """Fetch calendar objects for a multiget, skipping missing ones.
 
-    ms = MultiStatus(responses=responses)
-    return serve_multistatus(ms)
+    Backends without a batch lookup are queried concurrently, one object per call.
+
+    Args:
+        request: Starlette request
+        backend: CalDAV backend instance
+        paths: Calendar object paths
+
+    Returns:
+        Calendar objects that exist, in request order
+
+    Raises:
+        Exception: If a lookup fails for a reason other than a missing object
+    """
+    get_calendar_objects = getattr(backend, "get_calendar_objects", None)
+    if get_calendar_objects is not None:
+        result: list[CalendarObject] = await get_calendar_objects(request, paths)
+        return result
+
+    semaphore = asyncio.Semaphore(MULTIGET_CONCURRENCY)
+
+    async def fetch(path: str) -> CalendarObject | None:
+        async with semaphore:
+            try:
+                return await backend.get_calendar_object(request, path)
+            except Exception as e:
+                # Only a 404 means the object doesn't exist
+                if not is_not_found(e):
+                    raise
+                return None
+
+    objects = await asyncio.gather(*(fetch(path) for path in paths))
+    return [obj for obj in objects if obj is not None]
@@ -7,6 +7,7 @@ from .carddav import (
     AddressBookMultiGet,
     AddressBookQuery,
     AddressObject,
+    AddressObjectIndex,
     ParamFilter,
     PropFilter,
     SyncQuery,
@@ -27,6 +28,7 @@ __all__ = [
     "AddressBookMultiGet",
     "AddressBookQuery",
     "AddressObject",
+    "AddressObjectIndex",
     "ParamFilter",
     "PropFilter",
     "SyncQuery",
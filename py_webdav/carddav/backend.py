@@ -6,7 +6,7 @@ from typing import Protocol
 
 from starlette.requests import Request
 
-from .carddav import AddressBook, AddressBookQuery, AddressObject
+from .carddav import AddressBook, AddressBookQuery, AddressObject, AddressObjectIndex
 
 
 class CardDAVBackend(Protocol):
@@ -104,6 +104,28 @@ class CardDAVBackend(Protocol):
         """
         ...
 
+    async def get_address_objects(
+        self, request: Request, paths: list[str]
+    ) -> tuple[list[AddressObject], list[str]]:
+        """Get several address objects at once (addressbook-multiget).
+
+        Optional: the server falls back to get_address_object if missing.
+
+        Args:
+            request: HTTP request
+            paths: Address object paths
+
+        Returns:
+            Tuple of (AddressObject list for the paths that exist, in request
+            order; paths that do not exist). Objects that exist but cannot be
+            read or converted may be in neither list.
+
+        Raises:
+            Exception: If the storage or API behind the backend fails, so the
+                multiget is not answered as if the objects were deleted
+        """
+        ...
+
     async def list_address_objects(
         self, request: Request, addressbook_path: str
     ) -> list[AddressObject]:
@@ -121,6 +143,25 @@ class CardDAVBackend(Protocol):
         """
         ...
 
+    async def list_address_objects_index(
+        self, request: Request, addressbook_path: str
+    ) -> AddressObjectIndex:
+        """List address object metadata in an address book, without vCard data.
+
+        Optional: the server falls back to list_address_objects if missing.
+
+        Args:
+            request: HTTP request
+            addressbook_path: Address book path
+
+        Returns:
+            AddressObjectIndex
+
+        Raises:
+            HTTPError: If address book not found (404)
+        """
+        ...
+
     async def query_address_objects(
         self, request: Request, addressbook_path: str, query: AddressBookQuery
     ) -> list[AddressObject]:
@@ -5,14 +5,33 @@ CardDAV is defined in RFC 6352.
 
 from __future__ import annotations
 
+import re
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from hashlib import blake2b
 
 # CardDAV capability
 CAPABILITY_ADDRESSBOOK = "addressbook"
 
+# Shape of a vCard and its unfolded, unparameterized UID line
+_VCARD_RE = re.compile(r"\A\s*BEGIN:VCARD\r?\n.*\r?\nEND:VCARD\s*\Z", re.IGNORECASE | re.DOTALL)
+# Content lines ("[group.]name[;param[=value,...]]:value") accepted without
+# a vobject parse; nested BEGIN/END lines always take the full parse
+_CONTENT_LINE_RE = re.compile(
+    r"""(?:[A-Za-z0-9-]+\.)?[A-Za-z0-9-]+"""
+    r"""(?:;[A-Za-z0-9-]+(?:=(?:"[^"\r\n]*"|[^";:,\r\n]*)(?:,(?:"[^"\r\n]*"|[^";:,\r\n]*))*)?)*"""
+    r""":[^\r\n]*"""
+)
+_COMPONENT_LINE_RE = re.compile(r"(?:BEGIN|END):", re.IGNORECASE)
+_UID_RE = re.compile(r"^UID:([^\r\n]*)\r?(?:\n(?![ \t])|\Z)", re.IGNORECASE | re.MULTILINE)
 
-@dataclass
+# Empty BLAKE2b state copied by _content_etag
+_ETAG_SEED = blake2b(digest_size=16)
+
+
+@dataclass(slots=True)
 class AddressBook:
     """CardDAV address book collection."""
 
@@ -22,7 +41,7 @@ class AddressBook:
     max_resource_size: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressObject:
     """CardDAV address object (vCard data)."""
 
@@ -31,9 +50,42 @@ class AddressObject:
     mod_time: datetime | None = None
     content_length: int = 0
     etag: str = ""
+    raw_path: str | None = None  # File holding the stored vCard bytes, if any
+
+
+@dataclass(slots=True)
+class AddressObjectIndex:
+    """Address object listing stored column-wise, without vCard data.
+
+    PROPFIND listings only read an object's path, ETag, modification time and
+    size, so backends can list these without loading or keeping the vCards.
+    """
+
+    paths: list[str] = field(default_factory=list)
+    etags: list[str] = field(default_factory=list)
+    mod_times: list[datetime | None] = field(default_factory=list)
+    content_lengths: array[int] = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.paths)
 
+    def append(self, path: str, etag: str, mod_time: datetime | None, content_length: int) -> None:
+        """Add one address object to the index."""
+        self.paths.append(path)
+        self.etags.append(etag)
+        self.mod_times.append(mod_time)
+        self.content_lengths.append(content_length)
 
-@dataclass
+    @staticmethod
+    def from_objects(objects: list[AddressObject]) -> AddressObjectIndex:
+        """Build an index from full address objects."""
+        index = AddressObjectIndex()
+        for obj in objects:
+            index.append(obj.path, obj.etag, obj.mod_time, obj.content_length)
+        return index
+
+
+@dataclass(slots=True)
 class TextMatch:
     """Text matching filter."""
 
@@ -42,7 +94,7 @@ class TextMatch:
     match_type: str = "contains"  # contains, equals, starts-with, ends-with
 
 
-@dataclass
+@dataclass(slots=True)
 class ParamFilter:
     """Parameter filter for address book queries."""
 
@@ -51,7 +103,7 @@ class ParamFilter:
     text_match: TextMatch | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PropFilter:
     """Property filter for address book queries."""
 
@@ -61,7 +113,7 @@ class PropFilter:
     param_filters: list[ParamFilter] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressBookQuery:
     """CardDAV addressbook-query REPORT request."""
 
@@ -69,14 +121,14 @@ class AddressBookQuery:
     limit: int = 0  # <= 0 means unlimited
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressBookMultiGet:
     """CardDAV addressbook-multiget REPORT request."""
 
     paths: list[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncQuery:
     """CardDAV sync-collection request."""
 
@@ -84,7 +136,7 @@ class SyncQuery:
     limit: int = 0  # <= 0 means unlimited
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResponse:
     """CardDAV sync-collection response."""
 
@@ -105,6 +157,10 @@ def validate_address_object(vcard_data: str) -> str:
     Raises:
         ValueError: If validation fails
     """
+    uid = _fast_uid(vcard_data)
+    if uid is not None:
+        return uid
+
     try:
         import vobject
 
@@ -121,3 +177,76 @@ def validate_address_object(vcard_data: str) -> str:
 
     except Exception as e:
         raise ValueError(f"invalid vCard object: {e}") from e
+
+
+def _fast_uid(vcard_data: str) -> str | None:
+    """Extract the UID of a simple vCard without parsing it.
+
+    Args:
+        vcard_data: vCard data as string
+
+    Returns:
+        UID, or None if the data needs a full vobject parse
+    """
+    if not _VCARD_RE.match(vcard_data):
+        return None
+
+    # Every line between the outer BEGIN/END must be a well-formed property
+    # or a folded continuation of one; anything else is left to vobject
+    lines = vcard_data.strip().split("\n")
+    continuable = False
+    for line in lines[1:-1]:
+        line = line.removesuffix("\r")
+        if line[:1] in (" ", "\t"):
+            if not continuable:
+                return None
+            continue
+        if _COMPONENT_LINE_RE.match(line) or not _CONTENT_LINE_RE.fullmatch(line):
+            return None
+        continuable = True
+
+    uids: list[str] = _UID_RE.findall(vcard_data)
+    # Escaped values are left to vobject
+    if len(uids) != 1 or "\\" in uids[0]:
+        return None
+    return uids[0]
+
+
+def _content_etag(encoded: bytes) -> str:
+    """Compute a content-hash ETag.
+
+    BLAKE2b with a 16-byte digest is faster than MD5 and keeps the familiar
+    32 hex character ETag length.
+
+    Args:
+        encoded: Serialized vCard data
+
+    Returns:
+        Hex digest of the data
+    """
+    # Copying a prepared hasher skips constructor setup for every vCard
+    hasher = _ETAG_SEED.copy()
+    hasher.update(encoded)
+    return hasher.hexdigest()
+
+
+@lru_cache(maxsize=4096)
+def _split_path(path: str) -> tuple[str, str]:
+    """Split a CardDAV path into address book and object name.
+
+    Empty and "contacts" segments are ignored; missing parts are returned as "".
+
+    Args:
+        path: Address book or object path (e.g., "/contacts/personal/contact.vcf")
+
+    Returns:
+        Tuple of (addressbook_name, object_name)
+    """
+    rest = path.removeprefix("/contacts/").strip("/")
+    if "//" in rest or "contacts" in rest:
+        # Unusual paths take the general route
+        parts = [p for p in rest.split("/") if p and p != "contacts"] + ["", ""]
+        return parts[0], parts[1]
+
+    addressbook_name, _, object_name = rest.partition("/")
+    return addressbook_name, object_name.partition("/")[0]
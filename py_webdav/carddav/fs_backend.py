@@ -2,16 +2,83 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+import os
+import shutil
+import threading
+from collections import OrderedDict
 from datetime import UTC, datetime
-from hashlib import md5
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 from starlette.requests import Request
 
-from ..internal import HTTPError
-from .carddav import AddressBook, AddressBookQuery, AddressObject, validate_address_object
+from ..internal import HTTPError, is_not_found
+from .carddav import (
+    AddressBook,
+    AddressBookQuery,
+    AddressObject,
+    AddressObjectIndex,
+    _content_etag,
+    _split_path,
+    validate_address_object,
+)
+
+# Maximum number of files whose ETag (and vCard data) is kept between listings
+OBJECT_CACHE_SIZE = 10_000
+
+
+def _vcard_entries(addressbook_dir: Path) -> list[os.DirEntry[str]]:
+    """List the regular .vcf files of an address book directory."""
+    with os.scandir(addressbook_dir) as it:
+        return [
+            entry
+            for entry in it
+            if entry.name.endswith(".vcf") and entry.is_file(follow_symlinks=False)
+        ]
+
+
+def _decode_vcard(raw: bytes) -> str:
+    """Decode vCard file contents like text-mode reads do, including universal newlines."""
+    return raw.decode().replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _address_object(
+    path: str, vcard_data: str, etag: str, stat: os.stat_result, file_path: str
+) -> AddressObject:
+    """Build an address object from vCard data and the file's stat result."""
+    return AddressObject(
+        path=path,
+        data=vcard_data,
+        mod_time=datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+        content_length=stat.st_size,
+        etag=etag,
+        raw_path=file_path,
+    )
+
+
+def _write_file(file_path: Path, raw: bytes) -> os.stat_result:
+    """Write a file, creating its directory if needed, and return its stat result."""
+    # Ensure address book directory exists
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(raw)
+    return file_path.stat()
+
+
+@lru_cache(maxsize=4096)
+def _resolve_object_file(addressbooks_dir: Path, path: str) -> Path:
+    """Resolve an address object path below the address books directory."""
+    # Extract address book and object name from path like "/contacts/personal/contact.vcf"
+    addressbook_name, object_name = _split_path(path)
+    if not object_name:
+        raise HTTPError(404, Exception("Invalid object path"))
+
+    if not object_name.endswith(".vcf"):
+        object_name += ".vcf"
+
+    return addressbooks_dir / addressbook_name / object_name
 
 
 class LocalCardDAVBackend:
@@ -42,6 +109,12 @@ class LocalCardDAVBackend:
         self.addressbooks_dir: Path = self.root_dir / "contacts"
         self.addressbooks_dir.mkdir(parents=True, exist_ok=True)
 
+        # File contents keyed by file path. Values are (st_mtime_ns, st_size, etag,
+        # vcard_data); data is None when only the ETag was needed. Entries are
+        # reused while the stat pair is unchanged; oldest entries are evicted first.
+        self._object_cache: OrderedDict[str, tuple[int, int, str, str | None]] = OrderedDict()
+        self._object_cache_lock = threading.Lock()
+
     async def addressbook_home_set_path(self, request: Request) -> str:
         """Get address book home set path."""
         return self.home_set_path
@@ -53,19 +126,22 @@ class LocalCardDAVBackend:
     def _addressbook_dir(self, addressbook_path: str) -> Path:
         """Get filesystem directory for address book path."""
         # Extract address book name from path like "/contacts/personal/"
-        parts = [p for p in addressbook_path.split("/") if p and p != "contacts"]
-        if not parts:
+        addressbook_name, _ = _split_path(addressbook_path)
+        if not addressbook_name:
             raise HTTPError(404, Exception("Invalid address book path"))
-        addressbook_name = parts[0]
         return self.addressbooks_dir / addressbook_name
 
     def _read_addressbook_metadata(self, addressbook_dir: Path) -> AddressBook:
         """Read address book metadata from directory."""
         metadata_file: Path = addressbook_dir / ".metadata.json"
 
-        if metadata_file.exists():
-            with open(metadata_file) as f:
-                data: dict[str, Any] = json.load(f)
+        try:
+            # One read of the raw bytes; json.loads detects the UTF encoding itself
+            data: dict[str, Any] | None = json.loads(metadata_file.read_bytes())
+        except FileNotFoundError:
+            data = None
+
+        if data is not None:
             return AddressBook(
                 path=f"{self.home_set_path}{addressbook_dir.name}/",
                 name=str(data.get("name", addressbook_dir.name)),
@@ -91,24 +167,29 @@ class LocalCardDAVBackend:
             "description": addressbook.description,
             "max_resource_size": addressbook.max_resource_size,
         }
-        with open(metadata_file, "w") as f:
-            json.dump(data, f, indent=2)
+        metadata_file.write_text(json.dumps(data, indent=2))
 
     async def list_addressbooks(self, request: Request) -> list[AddressBook]:
         """List all address books."""
-        addressbooks = []
+        return await asyncio.to_thread(self._read_addressbooks)
+
+    def _read_addressbooks(self) -> list[AddressBook]:
+        """Read the metadata of all address book directories."""
+        addressbooks: list[AddressBook] = []
 
         if not self.addressbooks_dir.exists():
             return addressbooks
 
-        for item in self.addressbooks_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                try:
-                    addressbook = self._read_addressbook_metadata(item)
-                    addressbooks.append(addressbook)
-                except Exception:
-                    # Skip invalid address books
-                    continue
+        with os.scandir(self.addressbooks_dir) as it:
+            entries = [entry for entry in it if not entry.name.startswith(".") and entry.is_dir()]
+
+        for entry in entries:
+            try:
+                addressbook = self._read_addressbook_metadata(Path(entry.path))
+                addressbooks.append(addressbook)
+            except Exception:
+                # Skip invalid address books
+                continue
 
         return addressbooks
 
@@ -116,92 +197,205 @@ class LocalCardDAVBackend:
         """Get address book by path."""
         addressbook_dir = self._addressbook_dir(path)
 
-        if not addressbook_dir.exists() or not addressbook_dir.is_dir():
+        if not await asyncio.to_thread(addressbook_dir.is_dir):
             raise HTTPError(404, Exception(f"Address book not found: {path}"))
 
-        return self._read_addressbook_metadata(addressbook_dir)
+        return await asyncio.to_thread(self._read_addressbook_metadata, addressbook_dir)
 
     async def create_addressbook(self, request: Request, addressbook: AddressBook) -> None:
         """Create a new address book."""
         addressbook_dir = self._addressbook_dir(addressbook.path)
 
-        if addressbook_dir.exists():
+        if await asyncio.to_thread(addressbook_dir.exists):
             raise HTTPError(409, Exception(f"Address book already exists: {addressbook.path}"))
 
-        self._write_addressbook_metadata(addressbook)
+        await asyncio.to_thread(self._write_addressbook_metadata, addressbook)
 
     async def delete_addressbook(self, request: Request, path: str) -> None:
         """Delete an address book."""
-        import shutil
-
         addressbook_dir = self._addressbook_dir(path)
 
-        if not addressbook_dir.exists():
-            raise HTTPError(404, Exception(f"Address book not found: {path}"))
-
-        shutil.rmtree(addressbook_dir)
+        try:
+            # Removing a large address book takes a while; keep it off the event loop
+            await asyncio.to_thread(shutil.rmtree, addressbook_dir)
+        except FileNotFoundError as e:
+            raise HTTPError(404, Exception(f"Address book not found: {path}")) from e
+        self._invalidate_cached_contents(addressbook_dir)
 
     def _object_file(self, path: str) -> Path:
         """Get filesystem path for address object."""
-        # Extract address book and object name from path like "/contacts/personal/contact.vcf"
-        parts = [p for p in path.split("/") if p and p != "contacts"]
-        if len(parts) < 2:
-            raise HTTPError(404, Exception("Invalid object path"))
-
-        addressbook_name = parts[0]
-        object_name = parts[1]
-
-        if not object_name.endswith(".vcf"):
-            object_name += ".vcf"
-
-        return self.addressbooks_dir / addressbook_name / object_name
+        return _resolve_object_file(self.addressbooks_dir, path)
 
     async def get_address_object(self, request: Request, path: str) -> AddressObject:
         """Get an address object."""
         file_path = self._object_file(path)
 
-        if not file_path.exists() or not file_path.is_file():
-            raise HTTPError(404, Exception(f"Address object not found: {path}"))
-
-        # Read vCard data
-        vcard_data = file_path.read_text()
-
-        # Get file stats
-        stat = file_path.stat()
-        mod_time = datetime.fromtimestamp(stat.st_mtime, tz=UTC)
-
-        # Generate ETag from content
-        etag = md5(vcard_data.encode()).hexdigest()
-
-        return AddressObject(
-            path=path,
-            data=vcard_data,
-            mod_time=mod_time,
-            content_length=stat.st_size,
-            etag=etag,
-        )
+        try:
+            return await asyncio.to_thread(self._read_address_object, file_path, path)
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError) as e:
+            raise HTTPError(404, Exception(f"Address object not found: {path}")) from e
+
+    async def get_address_objects(
+        self, request: Request, paths: list[str]
+    ) -> tuple[list[AddressObject], list[str]]:
+        """Get several address objects at once, skipping missing ones."""
+        return await asyncio.to_thread(self._read_address_objects_at, paths)
+
+    def _read_address_objects_at(self, paths: list[str]) -> tuple[list[AddressObject], list[str]]:
+        """Read the address objects at the given paths in a single worker thread."""
+        objects = []
+        not_found = []
+        for path in paths:
+            try:
+                objects.append(self._read_address_object(self._object_file(path), path))
+            except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+                not_found.append(path)
+            except HTTPError as e:
+                if is_not_found(e):
+                    not_found.append(path)
+            except OSError:
+                # e.g. permission errors; the object may well exist
+                continue
+        return objects, not_found
+
+    def _read_address_object(self, file_path: Path, path: str) -> AddressObject:
+        """Read an address object file, reusing cached contents while it is unchanged."""
+        file_str = str(file_path)
+        with open(file_path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            cached = self._cached_contents(file_str, stat)
+            if cached is not None and cached[3] is not None:
+                return _address_object(path, cached[3], cached[2], stat, file_str)
+            raw = f.read()
+
+        # ETag is computed over the stored bytes
+        vcard_data = _decode_vcard(raw)
+        etag = _content_etag(raw)
+        self._cache_contents(file_str, stat, etag, vcard_data)
+
+        return _address_object(path, vcard_data, etag, stat, file_str)
+
+    def _read_object_fast(self, entry: os.DirEntry[str], object_path: str) -> AddressObject:
+        """Read an address object from a directory entry.
+
+        The entry's stat result is reused, so no extra lookups of the path are made,
+        and unchanged files are served from the object cache without being read.
+        """
+        stat = entry.stat()
+        cached = self._cached_contents(entry.path, stat)
+        if cached is not None and cached[3] is not None:
+            return _address_object(object_path, cached[3], cached[2], stat, entry.path)
+
+        with open(entry.path, "rb") as f:
+            raw = f.read()
+        vcard_data = _decode_vcard(raw)
+        etag = _content_etag(raw)
+        self._cache_contents(entry.path, stat, etag, vcard_data)
+
+        return _address_object(object_path, vcard_data, etag, stat, entry.path)
+
+    def _cached_contents(
+        self, file_path: str, stat: os.stat_result
+    ) -> tuple[int, int, str, str | None] | None:
+        """Look up cached file contents that are still current for the stat result."""
+        with self._object_cache_lock:
+            cached = self._object_cache.get(file_path)
+            if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+                return None
+            self._object_cache.move_to_end(file_path)
+            return cached
+
+    def _cache_contents(
+        self, file_path: str, stat: os.stat_result, etag: str, vcard_data: str | None
+    ) -> None:
+        """Remember file contents for the given stat result."""
+        with self._object_cache_lock:
+            self._object_cache[file_path] = (stat.st_mtime_ns, stat.st_size, etag, vcard_data)
+            self._object_cache.move_to_end(file_path)
+            if len(self._object_cache) > OBJECT_CACHE_SIZE:
+                self._object_cache.popitem(last=False)
+
+    def _invalidate_cached_contents(self, path: Path) -> None:
+        """Drop cached contents of a file, or of all files below a directory."""
+        file_path = str(path)
+        prefix = f"{file_path}{os.sep}"
+        with self._object_cache_lock:
+            for key in [k for k in self._object_cache if k == file_path or k.startswith(prefix)]:
+                del self._object_cache[key]
 
     async def list_address_objects(
         self, request: Request, addressbook_path: str
     ) -> list[AddressObject]:
-        """List all address objects in an address book."""
+        """List all address objects in an address book.
+
+        All files are read in one worker thread, so a large address book
+        neither blocks the event loop nor pays a thread hop per vCard.
+        """
         addressbook_dir = self._addressbook_dir(addressbook_path)
 
         if not addressbook_dir.exists():
             raise HTTPError(404, Exception(f"Address book not found: {addressbook_path}"))
 
+        return await asyncio.to_thread(
+            self._read_address_objects, addressbook_dir, addressbook_path
+        )
+
+    def _read_address_objects(
+        self, addressbook_dir: Path, addressbook_path: str
+    ) -> list[AddressObject]:
+        """Read all address objects of an address book directory."""
         objects = []
-        for file_path in addressbook_dir.glob("*.vcf"):
+        for entry in _vcard_entries(addressbook_dir):
             try:
-                object_path = f"{addressbook_path}{file_path.name}"
-                obj = await self.get_address_object(request, object_path)
-                objects.append(obj)
+                object_path = f"{addressbook_path}{entry.name}"
+                objects.append(self._read_object_fast(entry, object_path))
             except Exception:
                 # Skip invalid objects
                 continue
 
         return objects
 
+    async def list_address_objects_index(
+        self, request: Request, addressbook_path: str
+    ) -> AddressObjectIndex:
+        """List address object metadata without keeping the vCards in memory."""
+        addressbook_dir = self._addressbook_dir(addressbook_path)
+
+        if not addressbook_dir.exists():
+            raise HTTPError(404, Exception(f"Address book not found: {addressbook_path}"))
+
+        return await asyncio.to_thread(
+            self._index_address_objects, addressbook_dir, addressbook_path
+        )
+
+    def _index_address_objects(
+        self, addressbook_dir: Path, addressbook_path: str
+    ) -> AddressObjectIndex:
+        """Index all address objects of an address book directory."""
+        index = AddressObjectIndex()
+        for entry in _vcard_entries(addressbook_dir):
+            try:
+                stat = entry.stat()
+                cached = self._cached_contents(entry.path, stat)
+                if cached is not None:
+                    etag = cached[2]
+                else:
+                    # Same ETag as get_address_object; the data is dropped right away
+                    with open(entry.path, "rb") as f:
+                        etag = _content_etag(f.read())
+                    self._cache_contents(entry.path, stat, etag, None)
+            except OSError:
+                # Skip unreadable objects
+                continue
+            index.append(
+                f"{addressbook_path}{entry.name}",
+                etag,
+                datetime.fromtimestamp(stat.st_mtime, tz=UTC),
+                stat.st_size,
+            )
+
+        return index
+
     async def query_address_objects(
         self, request: Request, addressbook_path: str, query: AddressBookQuery
     ) -> list[AddressObject]:
@@ -222,11 +416,13 @@ class LocalCardDAVBackend:
         file_path = self._object_file(path)
 
         # Check preconditions
-        if if_none_match and file_path.exists():
+        exists = await asyncio.to_thread(file_path.exists)
+        if if_none_match and exists:
             raise HTTPError(412, Exception("Precondition failed: resource already exists"))
 
+        existing: AddressObject | None = None
         if if_match is not None:
-            if not file_path.exists():
+            if not exists:
                 raise HTTPError(412, Exception("Precondition failed: resource does not exist"))
 
             # Check ETag
@@ -234,26 +430,38 @@ class LocalCardDAVBackend:
             if existing.etag != if_match:
                 raise HTTPError(412, Exception("Precondition failed: ETag mismatch"))
 
+        raw = vcard_data.encode()
+        etag = _content_etag(raw)
+
+        if exists:
+            if existing is None:
+                try:
+                    existing = await self.get_address_object(request, path)
+                except HTTPError:
+                    existing = None
+            if existing is not None and existing.etag == etag:
+                # Same bytes as stored: nothing to validate or write
+                return existing
+
         # Validate vCard data
         try:
             validate_address_object(vcard_data)
         except Exception as e:
             raise HTTPError(400, Exception(f"Invalid vCard data: {e}")) from e
 
-        # Ensure address book directory exists
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-
         # Write file
-        file_path.write_text(vcard_data)
+        stat = await asyncio.to_thread(_write_file, file_path, raw)
+        self._invalidate_cached_contents(file_path)
 
-        # Return the created/updated object
-        return await self.get_address_object(request, path)
+        # Return the created/updated object from the bytes just written
+        return _address_object(path, _decode_vcard(raw), etag, stat, str(file_path))
 
     async def delete_address_object(self, request: Request, path: str) -> None:
         """Delete an address object."""
         file_path = self._object_file(path)
 
-        if not file_path.exists():
-            raise HTTPError(404, Exception(f"Address object not found: {path}"))
-
-        file_path.unlink()
+        try:
+            await asyncio.to_thread(file_path.unlink)
+        except FileNotFoundError as e:
+            raise HTTPError(404, Exception(f"Address object not found: {path}")) from e
+        self._invalidate_cached_contents(file_path)
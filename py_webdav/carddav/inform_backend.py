@@ -6,15 +6,24 @@ via CardDAV protocol. It is read-only and ignores any write operations.
 
 from __future__ import annotations
 
+import re
+import time
 from datetime import UTC, datetime
-from hashlib import md5
 from typing import Any
 
+import httpx
 from starlette.requests import Request
 
 from ..inform_api_client import InformAPIClient, InformConfig
-from ..internal import HTTPError
-from .carddav import AddressBook, AddressBookQuery, AddressObject
+from ..internal import HTTPError, is_not_found
+from .carddav import (
+    AddressBook,
+    AddressBookQuery,
+    AddressObject,
+    AddressObjectIndex,
+    _content_etag,
+    _split_path,
+)
 
 # Address book names for each INFORM address type
 ADDRESS_BOOK_MAPPING = {
@@ -24,6 +33,52 @@ ADDRESS_BOOK_MAPPING = {
     "other": {"name": "Other", "description": "Other addresses from INFORM"},
 }
 
+# Address listings reused by multiget lookups for ADDRESS_MAP_TTL seconds
+ADDRESS_MAP_TTL = 30.0
+
+# Maximum vCard content line length in octets before folding
+VCARD_LINE_LENGTH = 75
+
+
+# Characters that need escaping in vCard text values
+_TEXT_SPECIALS_RE = re.compile(r"[\\;,\r\n]")
+
+
+def _escape_text(value: str) -> str:
+    """Escape a vCard text value (backslash, semicolon, comma and newlines)."""
+    if _TEXT_SPECIALS_RE.search(value) is None:
+        # Most names, numbers and addresses need no escaping
+        return value
+
+    value = value.replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+    return value.replace("\r\n", "\\n").replace("\n", "\\n").replace("\r", "\\n")
+
+
+def _fold_line(line: str) -> str:
+    """Fold a content line without splitting multi-byte characters, ending it with CRLF."""
+    if len(line) < VCARD_LINE_LENGTH:
+        return f"{line}\r\n"
+
+    if line.isascii():
+        # One octet per character: fold by slicing instead of measuring characters
+        step = VCARD_LINE_LENGTH - 1
+        chunks = [line[:VCARD_LINE_LENGTH]]
+        chunks.extend(line[i : i + step] for i in range(VCARD_LINE_LENGTH, len(line), step))
+        return "\r\n ".join(chunks) + "\r\n"
+
+    chunks = []
+    start = 0
+    size = 0
+    for i, char in enumerate(line):
+        char_size = len(char.encode())
+        if size + char_size > VCARD_LINE_LENGTH:
+            chunks.append(line[start:i])
+            start = i
+            size = 1  # continuation lines start with a space
+        size += char_size
+    chunks.append(line[start:])
+    return "\r\n ".join(chunks) + "\r\n"
+
 
 class InformCardDAVBackend:
     """INFORM API-based CardDAV backend.
@@ -58,6 +113,20 @@ class InformCardDAVBackend:
         self.principal_path = principal_path
         self._company_name: str | None = None
 
+        # Address books are fixed by ADDRESS_BOOK_MAPPING, so build them once
+        self._addressbooks: dict[str, AddressBook] = {
+            address_type: AddressBook(
+                path=self._get_addressbook_path(address_type),
+                name=info["name"],
+                description=info["description"],
+            )
+            for address_type, info in ADDRESS_BOOK_MAPPING.items()
+        }
+
+        # Addresses of the last listing per (company, address_type), keyed by
+        # address key. Values are (monotonic timestamp, addresses by key).
+        self._address_maps: dict[tuple[str, str], tuple[float, dict[str, dict[str, Any]]]] = {}
+
     async def _get_company_name(self) -> str:
         """Get the first available company name from INFORM API.
 
@@ -99,10 +168,10 @@ class InformCardDAVBackend:
         Raises:
             HTTPError: If path is invalid
         """
-        parts = [p for p in path.split("/") if p and p != "contacts"]
-        if not parts or parts[0] not in ADDRESS_BOOK_MAPPING:
+        address_type, _ = _split_path(path)
+        if address_type not in ADDRESS_BOOK_MAPPING:
             raise HTTPError(404, Exception(f"Invalid address book path: {path}"))
-        return parts[0]
+        return address_type
 
     def _parse_object_path(self, path: str) -> tuple[str, str]:
         """Parse object path to extract address book type and object ID.
@@ -116,44 +185,34 @@ class InformCardDAVBackend:
         Raises:
             HTTPError: If path is invalid
         """
-        parts = [p for p in path.split("/") if p and p != "contacts"]
-        if len(parts) < 2:
+        address_type, address_key = _split_path(path)
+        if not address_key:
             raise HTTPError(404, Exception(f"Invalid object path: {path}"))
 
-        address_type = parts[0]
         if address_type not in ADDRESS_BOOK_MAPPING:
             raise HTTPError(404, Exception(f"Invalid address book type: {address_type}"))
 
         # Remove .vcf extension if present
-        address_key = parts[1]
-        if address_key.endswith(".vcf"):
-            address_key = address_key[:-4]
+        address_key = address_key.removesuffix(".vcf")
 
         return address_type, address_key
 
     async def list_addressbooks(self, request: Request) -> list[AddressBook]:
         """List all address books (one per address type)."""
-        addressbooks = []
-
-        for address_type, info in ADDRESS_BOOK_MAPPING.items():
-            addressbook = AddressBook(
-                path=self._get_addressbook_path(address_type),
-                name=info["name"],
-                description=info["description"],
-            )
-            addressbooks.append(addressbook)
-
-        return addressbooks
+        return list(self._addressbooks.values())
 
     async def get_addressbook(self, request: Request, path: str) -> AddressBook:
         """Get address book by path."""
         address_type = self._parse_addressbook_path(path)
-        info = ADDRESS_BOOK_MAPPING[address_type]
+        addressbook = self._addressbooks[address_type]
+        if addressbook.path == path:
+            return addressbook
 
+        # Non-canonical spelling of the path; report it as requested
         return AddressBook(
             path=path,
-            name=info["name"],
-            description=info["description"],
+            name=addressbook.name,
+            description=addressbook.description,
         )
 
     async def create_addressbook(self, request: Request, addressbook: AddressBook) -> None:
@@ -167,24 +226,23 @@ class InformCardDAVBackend:
     def _inform_address_to_vcard(self, address_data: dict[str, Any]) -> str:
         """Convert INFORM address data to vCard format.
 
+        The vCard 3.0 text is built directly instead of through a vobject
+        component; properties are emitted in the order vobject serializes them.
+
         Args:
             address_data: Address data from INFORM API
 
         Returns:
             vCard data as string
         """
-        import vobject
-
-        vcard = vobject.vCard()
-
         # Required: UID (use INFORM key)
         address_key = address_data.get("key", "")
-        vcard.add("uid")
-        vcard.uid.value = address_key
+        lines = ["BEGIN:VCARD", "VERSION:3.0", f"UID:{_escape_text(address_key)}"]
 
         # Required: FN (formatted name)
         # Use first post address line1 or key as fallback
         fn = address_key
+        post_addr: dict[str, Any] = {}
         post_addresses = address_data.get("postAddresses", [])
         if post_addresses and len(post_addresses) > 0:
             post_addr = post_addresses[0].get("postAddress", {})
@@ -192,112 +250,72 @@ class InformCardDAVBackend:
             if line1:
                 fn = line1
 
-        vcard.add("fn")
-        vcard.fn.value = fn
-
-        # N (name) - try to parse from line1 or use key
-        vcard.add("n")
-        if fn != address_key:
-            # Simple parsing: assume "Company Name" format
-            vcard.n.value = vobject.vcard.Name(family=fn)
-        else:
-            vcard.n.value = vobject.vcard.Name(family=address_key)
-
-        # ORG (organization)
-        vcard.add("org")
-        vcard.org.value = [fn]
+        # Postal address from first postAddress
+        street = post_addr.get("street", "")
+        zip_city = post_addr.get("zipCodeAndCity", "")
+
+        # Try to parse zip code and city
+        city = ""
+        postal_code = ""
+        if zip_city:
+            # Simple parsing: assume "12345 City Name" format
+            parts = zip_city.split(" ", 1)
+            if len(parts) == 2:
+                postal_code = parts[0]
+                city = parts[1]
+            else:
+                city = zip_city
+
+        if street or city or postal_code:
+            lines.append(
+                f"ADR;TYPE=WORK:;;{_escape_text(street)};{_escape_text(city)};;"
+                f"{_escape_text(postal_code)};"
+            )
 
         # Add address type as category
         address_type = address_data.get("addressType", "")
         if address_type:
-            vcard.add("categories")
-            vcard.categories.value = [address_type.upper()]
+            lines.append(f"CATEGORIES:{_escape_text(address_type.upper())}")
 
-        # Add postal address from first postAddress
-        if post_addresses and len(post_addresses) > 0:
-            post_addr = post_addresses[0].get("postAddress", {})
+        email = post_addr.get("email", "")
+        if email:
+            lines.append(f"EMAIL;TYPE=WORK:{_escape_text(email)}")
 
-            # Extract address components
-            street = post_addr.get("street", "")
-            zip_city = post_addr.get("zipCodeAndCity", "")
-            line1 = post_addr.get("line1", "")
+        # N (name) uses the formatted name as family name, ORG as organization
+        escaped_fn = _escape_text(fn)
+        lines.append(f"FN:{escaped_fn}")
+        lines.append(f"N:{escaped_fn};;;;")
 
-            # Try to parse zip code and city
-            city = ""
-            postal_code = ""
-            if zip_city:
-                # Simple parsing: assume "12345 City Name" format
-                parts = zip_city.split(" ", 1)
-                if len(parts) == 2:
-                    postal_code = parts[0]
-                    city = parts[1]
-                else:
-                    city = zip_city
-
-            if street or city or postal_code:
-                adr = vcard.add("adr")
-                adr.type_param = "WORK"
-                adr.value = vobject.vcard.Address(
-                    street=street,
-                    city=city,
-                    code=postal_code,
-                )
-
-            # Add phone if available
-            phone = post_addr.get("phone", "")
-            if phone:
-                tel = vcard.add("tel")
-                tel.type_param = "WORK"
-                tel.value = phone
-
-            # Add mobile if available
-            mobile = post_addr.get("mobile", "")
-            if mobile:
-                tel = vcard.add("tel")
-                tel.type_param = "CELL"
-                tel.value = mobile
-
-            # Add fax if available
-            fax = post_addr.get("fax", "")
-            if fax:
-                tel = vcard.add("tel")
-                tel.type_param = "FAX"
-                tel.value = fax
-
-            # Add email if available
-            email = post_addr.get("email", "")
-            if email:
-                email_obj = vcard.add("email")
-                email_obj.type_param = "WORK"
-                email_obj.value = email
-
-            # Add website if available
-            website = post_addr.get("website", "")
-            if website:
-                url = vcard.add("url")
-                url.value = website
-
-        # Add note if available
         note = address_data.get("note", "")
         if note:
-            vcard.add("note")
-            vcard.note.value = note
+            lines.append(f"NOTE:{_escape_text(note)}")
 
-        # Add tax ID as custom field
-        tax_id = address_data.get("taxId", "")
-        if tax_id:
-            x_taxid = vcard.add("x-taxid")
-            x_taxid.value = tax_id
+        lines.append(f"ORG:{escaped_fn}")
 
-        # Add client number as custom field
+        # Phone, mobile and fax numbers
+        for key, tel_type in (("phone", "WORK"), ("mobile", "CELL"), ("fax", "FAX")):
+            number = post_addr.get(key, "")
+            if number:
+                lines.append(f"TEL;TYPE={tel_type}:{_escape_text(number)}")
+
+        website = post_addr.get("website", "")
+        if website:
+            lines.append(f"URL:{_escape_text(website)}")
+
+        # Client number and tax ID as custom fields
         client_number = address_data.get("clientNumber", "")
         if client_number:
-            x_client = vcard.add("x-clientnumber")
-            x_client.value = client_number
+            lines.append(f"X-CLIENTNUMBER:{_escape_text(client_number)}")
+
+        tax_id = address_data.get("taxId", "")
+        if tax_id:
+            lines.append(f"X-TAXID:{_escape_text(tax_id)}")
 
-        # Serialize to string
-        vcard_str: str = vcard.serialize()
-        return vcard_str
+        lines.append("END:VCARD")
+        if max(map(len, lines)) < VCARD_LINE_LENGTH:
+            # Nothing to fold
+            return "\r\n".join(lines) + "\r\n"
+        return "".join(_fold_line(line) for line in lines)
 
     async def get_address_object(self, request: Request, path: str) -> AddressObject:
         """Get an address object (vCard)."""
@@ -308,31 +326,99 @@ class InformCardDAVBackend:
         try:
             address_data = await self.api_client.get_address(company, address_key)
         except Exception as e:
-            raise HTTPError(404, Exception(f"Address not found: {address_key}")) from e
+            # Only a 404 from INFORM means the address doesn't exist
+            if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 404:
+                raise HTTPError(404, Exception(f"Address not found: {address_key}")) from e
+            raise HTTPError(502, Exception(f"INFORM API error: {e}")) from e
 
         # Verify address type matches
         if address_data.get("addressType") != address_type:
             raise HTTPError(404, Exception(f"Address type mismatch for: {address_key}"))
 
+        return self._address_to_object(path, address_data, datetime.now(UTC))
+
+    def _address_to_object(
+        self, path: str, address_data: dict[str, Any], mod_time: datetime
+    ) -> AddressObject:
+        """Convert INFORM address data to an address object.
+
+        Args:
+            path: Address object path
+            address_data: Address data from INFORM API
+            mod_time: Modification time to report
+
+        Returns:
+            AddressObject with vCard data and content ETag
+        """
         # Convert to vCard
         vcard_data = self._inform_address_to_vcard(address_data)
 
         # Generate ETag from content
-        etag = md5(vcard_data.encode()).hexdigest()
+        encoded = vcard_data.encode()
 
         return AddressObject(
             path=path,
             data=vcard_data,
-            mod_time=datetime.now(UTC),
-            content_length=len(vcard_data.encode()),
-            etag=etag,
+            mod_time=mod_time,
+            content_length=len(encoded),
+            etag=_content_etag(encoded),
         )
 
-    async def list_address_objects(
-        self, request: Request, addressbook_path: str
-    ) -> list[AddressObject]:
-        """List all address objects in an address book."""
-        address_type = self._parse_addressbook_path(addressbook_path)
+    async def get_address_objects(
+        self, request: Request, paths: list[str]
+    ) -> tuple[list[AddressObject], list[str]]:
+        """Get several address objects at once (addressbook-multiget).
+
+        Addresses are looked up in one listing per address type, reused for
+        ADDRESS_MAP_TTL seconds; only keys missing from it are fetched one by
+        one. Missing objects are skipped and returned as not found, and
+        addresses that cannot be converted are skipped; INFORM API failures
+        are raised.
+        """
+        resolved = []
+        not_found = []
+        for path in paths:
+            try:
+                address_type, address_key = self._parse_object_path(path)
+            except HTTPError:
+                not_found.append(path)
+                continue
+            resolved.append((path, address_type, address_key))
+
+        address_maps = {}
+        for address_type in dict.fromkeys(address_type for _, address_type, _ in resolved):
+            address_maps[address_type] = await self._get_addresses_map(address_type)
+
+        objects = []
+        mod_time = datetime.now(UTC)
+        for path, address_type, address_key in resolved:
+            try:
+                address_data = address_maps[address_type].get(address_key)
+                if address_data is None:
+                    # Not part of the listing; ask INFORM for the single address
+                    objects.append(await self.get_address_object(request, path))
+                else:
+                    objects.append(self._address_to_object(path, address_data, mod_time))
+            except HTTPError as e:
+                # Only a 404 means the address doesn't exist
+                if not is_not_found(e):
+                    raise
+                not_found.append(path)
+            except Exception:
+                # Skip unconvertible addresses
+                continue
+
+        return objects, not_found
+
+    async def _fetch_addresses(self, address_type: str) -> list[dict[str, Any]]:
+        """Fetch the addresses of one type and remember them for multiget lookups.
+
+        Args:
+            address_type: INFORM address type
+
+        Returns:
+            Address data from INFORM API
+        """
         company = await self._get_company_name()
 
         # Fetch addresses from INFORM API (limit to 1000)
@@ -342,8 +428,49 @@ class InformCardDAVBackend:
             limit=1000,
         )
 
-        addresses = response.get("addresses", [])
+        addresses: list[dict[str, Any]] = response.get("addresses", [])
+        by_key = {address["key"]: address for address in addresses if address.get("key")}
+        self._address_maps[(company, address_type)] = (time.monotonic(), by_key)
+        return addresses
+
+    async def _get_addresses_map(self, address_type: str) -> dict[str, dict[str, Any]]:
+        """Get addresses of one type by key, fetching them if the last listing is stale.
+
+        Args:
+            address_type: INFORM address type
+
+        Returns:
+            Address data by address key
+        """
+        key = (await self._get_company_name(), address_type)
+        cached = self._address_maps.get(key)
+        if cached is None or time.monotonic() - cached[0] > ADDRESS_MAP_TTL:
+            await self._fetch_addresses(address_type)
+            cached = self._address_maps[key]
+        return cached[1]
+
+    async def list_address_objects(
+        self, request: Request, addressbook_path: str
+    ) -> list[AddressObject]:
+        """List all address objects in an address book."""
+        address_type = self._parse_addressbook_path(addressbook_path)
+        addresses = await self._fetch_addresses(address_type)
+        return self._build_address_objects(addresses, addressbook_path)
+
+    def _build_address_objects(
+        self, addresses: list[dict[str, Any]], addressbook_path: str
+    ) -> list[AddressObject]:
+        """Convert INFORM addresses to address objects.
+
+        Args:
+            addresses: Address data from INFORM API
+            addressbook_path: Path of the address book containing the objects
+
+        Returns:
+            Address objects for all convertible addresses
+        """
         objects = []
+        mod_time = datetime.now(UTC)
 
         for address_data in addresses:
             address_key = address_data.get("key", "")
@@ -351,29 +478,21 @@ class InformCardDAVBackend:
                 continue
 
             try:
-                # Convert to vCard
-                vcard_data = self._inform_address_to_vcard(address_data)
-
-                # Generate ETag
-                etag = md5(vcard_data.encode()).hexdigest()
-
-                # Create object path
                 object_path = f"{addressbook_path}{address_key}.vcf"
-
-                obj = AddressObject(
-                    path=object_path,
-                    data=vcard_data,
-                    mod_time=datetime.now(UTC),
-                    content_length=len(vcard_data.encode()),
-                    etag=etag,
-                )
-                objects.append(obj)
+                objects.append(self._address_to_object(object_path, address_data, mod_time))
             except Exception:
                 # Skip invalid addresses
                 continue
 
         return objects
 
+    async def list_address_objects_index(
+        self, request: Request, addressbook_path: str
+    ) -> AddressObjectIndex:
+        """List address object metadata in an address book."""
+        objects = await self.list_address_objects(request, addressbook_path)
+        return AddressObjectIndex.from_objects(objects)
+
     async def query_address_objects(
         self, request: Request, addressbook_path: str, query: AddressBookQuery
     ) -> list[AddressObject]:
@@ -10,6 +10,18 @@ from lxml import etree
 NAMESPACE = "DAV:"
 CARDDAV_NAMESPACE = "urn:ietf:params:xml:ns:carddav"
 
+# Common XML names
+PROP = f"{{{NAMESPACE}}}prop"
+ALLPROP = f"{{{NAMESPACE}}}allprop"
+PROPNAME = f"{{{NAMESPACE}}}propname"
+HREF = f"{{{NAMESPACE}}}href"
+FILTER = f"{{{CARDDAV_NAMESPACE}}}filter"
+ADDRESSBOOK_QUERY = f"{{{CARDDAV_NAMESPACE}}}addressbook-query"
+ADDRESSBOOK_MULTIGET = f"{{{CARDDAV_NAMESPACE}}}addressbook-multiget"
+
+# Upper bound on REPORT child elements (hrefs, props, filters)
+MAX_REPORT_CHILDREN = 10_000
+
 
 @dataclass
 class AddressBookQueryReport:
@@ -43,11 +55,14 @@ def parse_addressbook_report(root: etree._Element) -> AddressBookQueryReport | A
     Raises:
         ValueError: If the REPORT request is invalid
     """
+    if len(root) > MAX_REPORT_CHILDREN:
+        raise ValueError(f"CardDAV REPORT has more than {MAX_REPORT_CHILDREN} elements")
+
     # Check if it's addressbook-query
-    if root.tag == f"{{{CARDDAV_NAMESPACE}}}addressbook-query":
+    if root.tag == ADDRESSBOOK_QUERY:
         return _parse_addressbook_query(root)
     # Check if it's addressbook-multiget
-    elif root.tag == f"{{{CARDDAV_NAMESPACE}}}addressbook-multiget":
+    elif root.tag == ADDRESSBOOK_MULTIGET:
         return _parse_addressbook_multiget(root)
     else:
         raise ValueError(f"Unknown CardDAV REPORT type: {root.tag}")
@@ -59,13 +74,14 @@ def _parse_addressbook_query(root: etree._Element) -> AddressBookQueryReport:
 
     # Parse prop/allprop/propname
     for child in root:
-        if child.tag == f"{{{NAMESPACE}}}prop":
+        tag = child.tag
+        if tag == PROP:
             report.prop = [prop.tag for prop in child]
-        elif child.tag == f"{{{NAMESPACE}}}allprop":
+        elif tag == ALLPROP:
             report.allprop = True
-        elif child.tag == f"{{{NAMESPACE}}}propname":
+        elif tag == PROPNAME:
             report.propname = True
-        elif child.tag == f"{{{CARDDAV_NAMESPACE}}}filter":
+        elif tag == FILTER:
             # For now, we'll just note that there's a filter
             # Full filter parsing would go here
             report.filter = child
@@ -75,26 +91,16 @@ def _parse_addressbook_query(root: etree._Element) -> AddressBookQueryReport:
 
 def _parse_addressbook_multiget(root: etree._Element) -> AddressBookMultigetReport:
     """Parse addressbook-multiget REPORT."""
-    hrefs: list[str] = []
-    prop: list[str] | None = None
-    allprop = False
-    propname = False
+    # Let lxml walk the (potentially long) href list; drop duplicates but
+    # keep the client's order (dicts preserve insertion order)
+    hrefs = list(dict.fromkeys(href.text for href in root.iterfind(HREF) if href.text))
 
-    # Parse hrefs and prop/allprop/propname
-    for child in root:
-        if child.tag == f"{{{NAMESPACE}}}href":
-            if child.text:
-                hrefs.append(child.text)
-        elif child.tag == f"{{{NAMESPACE}}}prop":
-            prop = [p.tag for p in child]
-        elif child.tag == f"{{{NAMESPACE}}}allprop":
-            allprop = True
-        elif child.tag == f"{{{NAMESPACE}}}propname":
-            propname = True
+    prop_el = root.find(PROP)
+    prop = [p.tag for p in prop_el] if prop_el is not None else None
 
     return AddressBookMultigetReport(
         hrefs=hrefs,
         prop=prop,
-        allprop=allprop,
-        propname=propname,
+        allprop=root.find(ALLPROP) is not None,
+        propname=root.find(PROPNAME) is not None,
     )
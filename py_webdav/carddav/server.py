@@ -2,26 +2,105 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import datetime
+import asyncio
+import copy
+import itertools
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import IntEnum
+from functools import lru_cache
+from typing import Any, TypeVar
+from weakref import WeakKeyDictionary
 
 from lxml import etree
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.responses import FileResponse, Response
 
 from ..internal import (
     CurrentUserPrincipal,
     Depth,
     Href,
-    MultiStatus,
     PropFind,
+    is_not_found,
 )
 from ..internal import Response as WebDAVResponse
-from ..internal.elements import COLLECTION, NAMESPACE
-from ..internal.server import serve_multistatus
+from ..internal.elements import (
+    COLLECTION,
+    CURRENT_USER_PRINCIPAL,
+    CURRENT_USER_PRIVILEGE_SET,
+    DISPLAY_NAME,
+    GET_CONTENT_LENGTH,
+    GET_CONTENT_TYPE,
+    GET_ETAG,
+    GET_LAST_MODIFIED,
+    NAMESPACE,
+    RESOURCE_TYPE,
+    Prop,
+    PropStat,
+    Status,
+)
+from ..internal.server import serve_multistatus_stream
+from ..webdav import ConditionalMatch
 from .backend import CardDAVBackend
-from .report import AddressBookMultigetReport, AddressBookQueryReport
+from .carddav import AddressBook, AddressBookQuery, AddressObject
+from .report import (
+    CARDDAV_NAMESPACE,
+    HREF,
+    PROP,
+    AddressBookMultigetReport,
+    AddressBookQueryReport,
+    parse_addressbook_report,
+)
+
+# Common XML names
+ADDRESSBOOK = f"{{{CARDDAV_NAMESPACE}}}addressbook"
+ADDRESSBOOK_HOME_SET = f"{{{CARDDAV_NAMESPACE}}}addressbook-home-set"
+ADDRESS_DATA = f"{{{CARDDAV_NAMESPACE}}}address-data"
+ADDRESS_DATA_TYPE = f"{{{CARDDAV_NAMESPACE}}}address-data-type"
+SUPPORTED_ADDRESS_DATA = f"{{{CARDDAV_NAMESPACE}}}supported-address-data"
+PRIVILEGE = f"{{{NAMESPACE}}}privilege"
+READ = f"{{{NAMESPACE}}}read"
+WRITE = f"{{{NAMESPACE}}}write"
+RESPONSE = f"{{{NAMESPACE}}}response"
+PROPSTAT = f"{{{NAMESPACE}}}propstat"
+STATUS = f"{{{NAMESPACE}}}status"
+
+# Shared propstat statuses
+STATUS_OK = Status(code=200, text="OK")
+STATUS_NOT_FOUND = Status(code=404, text="Not Found")
+_STATUS_OK_LINE = STATUS_OK.to_string()
+_STATUS_NOT_FOUND_LINE = STATUS_NOT_FOUND.to_string()
+
+# Names of the properties built for every address object, split into
+# namespace and local name once so lxml does not parse them per element
+_RESOURCE_TYPE_QNAME = etree.QName(RESOURCE_TYPE)
+_GET_ETAG_QNAME = etree.QName(GET_ETAG)
+_GET_CONTENT_LENGTH_QNAME = etree.QName(GET_CONTENT_LENGTH)
+_GET_CONTENT_TYPE_QNAME = etree.QName(GET_CONTENT_TYPE)
+_GET_LAST_MODIFIED_QNAME = etree.QName(GET_LAST_MODIFIED)
+_ADDRESS_DATA_QNAME = etree.QName(ADDRESS_DATA)
+
+# Day and month names of HTTP dates, which are never localized
+_WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+# Value handed to the property builders of a table: a _CollectionContext for
+# collections, the AddressObject itself for address objects
+_Ctx = TypeVar("_Ctx")
+
+# Concurrent lookups for backends without get_address_objects
+MULTIGET_CONCURRENCY = 16
+
+# Seconds a multiget href that was not found is skipped without a lookup
+MISSING_HREF_TTL = 30.0
+MISSING_HREF_CACHE_SIZE = 4096
+
+# Multiget hrefs that were not found, mapped to when they were last looked up,
+# kept separately for each backend
+_missing_hrefs: WeakKeyDictionary[Any, OrderedDict[str, float]] = WeakKeyDictionary()
 
 
 class ResourceType(IntEnum):
@@ -33,9 +112,12 @@ class ResourceType(IntEnum):
     ADDRESS_OBJECT = 3
 
 
+@lru_cache(maxsize=4096)
 def detect_resource_type(path: str, prefix: str = "") -> ResourceType:
     """Detect resource type based on path depth.
 
+    Clients poll the same few paths, so results are cached per path and prefix.
+
     Args:
         path: Request path
         prefix: Path prefix to strip
@@ -53,8 +135,11 @@ def detect_resource_type(path: str, prefix: str = "") -> ResourceType:
     if p == "/":
         return ResourceType.ROOT
 
-    # Count path segments (depth)
-    depth = len([s for s in p.split("/") if s])
+    # Count path segments (depth); p starts with "/" so each other "/" adds one
+    depth = p.count("/") - p.endswith("/")
+    if "//" in p:
+        # Empty segments don't add depth
+        depth = len([s for s in p.split("/") if s])
     return ResourceType(min(depth, ResourceType.ADDRESS_OBJECT))
 
 
@@ -79,48 +164,155 @@ async def handle_carddav_propfind(
     Returns:
         Multi-status response
     """
-    resource_type = detect_resource_type(request.url.path)
-    responses = []
-
-    if resource_type == ResourceType.ADDRESSBOOK_HOME_SET:
-        if request.url.path == addressbook_home_path:
-            # This is the addressbook home set
-            resp = _propfind_addressbook_home_set(
-                addressbook_home_path, propfind, principal_path, addressbook_home_path
+    handler = _PROPFIND_HANDLERS.get((detect_resource_type(request.url.path), depth))
+    responses: list[WebDAVResponse] = []
+    objects: list[AddressObject] = []
+    if handler is not None:
+        responses, objects = await handler(
+            request, propfind, backend, addressbook_home_path, principal_path
+        )
+
+    # Object responses are built one at a time while the multistatus is sent
+    object_responses = (_address_object_response_xml(obj, propfind) for obj in objects)
+    return serve_multistatus_stream(
+        itertools.chain((resp.to_xml() for resp in responses), object_responses)
+    )
+
+
+async def _propfind_home_set_depth_zero(
+    request: Request,
+    propfind: PropFind,
+    backend: CardDAVBackend | None,
+    addressbook_home_path: str,
+    principal_path: str,
+) -> tuple[list[WebDAVResponse], list[AddressObject]]:
+    """List the addressbook home set itself."""
+    if request.url.path != addressbook_home_path:
+        return [], []
+    resp = _propfind_addressbook_home_set(
+        addressbook_home_path, propfind, principal_path, addressbook_home_path
+    )
+    return [resp], []
+
+
+async def _propfind_home_set_depth_one(
+    request: Request,
+    propfind: PropFind,
+    backend: CardDAVBackend | None,
+    addressbook_home_path: str,
+    principal_path: str,
+) -> tuple[list[WebDAVResponse], list[AddressObject]]:
+    """List the addressbook home set and all addressbooks within it."""
+    responses, objects = await _propfind_home_set_depth_zero(
+        request, propfind, backend, addressbook_home_path, principal_path
+    )
+    if responses and backend is not None:
+        addressbooks = await backend.list_addressbooks(request)
+        for addressbook in addressbooks:
+            resp = _propfind_addressbook(
+                addressbook, propfind, principal_path, addressbook_home_path
             )
             responses.append(resp)
+    return responses, objects
 
-            # If depth > 0, list all addressbooks within the home set
-            if depth == Depth.ONE and backend is not None:
-                addressbooks = await backend.list_addressbooks(request)
-                for addressbook in addressbooks:
-                    resp = _propfind_addressbook(
-                        addressbook, propfind, principal_path, addressbook_home_path
-                    )
-                    responses.append(resp)
-
-    elif resource_type == ResourceType.ADDRESSBOOK:
-        # Individual addressbook PROPFIND
-        if backend is not None:
-            try:
-                addressbook = await backend.get_addressbook(request, request.url.path)
-                resp = _propfind_addressbook(
-                    addressbook, propfind, principal_path, addressbook_home_path
-                )
-                responses.append(resp)
-
-                # If depth > 0, list address objects
-                if depth == Depth.ONE:
-                    objects = await backend.list_address_objects(request, addressbook.path)
-                    for obj in objects:
-                        resp = _propfind_address_object(obj, propfind)
-                        responses.append(resp)
-            except Exception:
-                # Addressbook not found or error
-                pass
 
-    ms = MultiStatus(responses=responses)
-    return serve_multistatus(ms)
+async def _propfind_addressbook_depth_zero(
+    request: Request,
+    propfind: PropFind,
+    backend: CardDAVBackend | None,
+    addressbook_home_path: str,
+    principal_path: str,
+) -> tuple[list[WebDAVResponse], list[AddressObject]]:
+    """List an individual addressbook."""
+    addressbook = await _find_addressbook(request, backend)
+    if addressbook is None:
+        return [], []
+    resp = _propfind_addressbook(addressbook, propfind, principal_path, addressbook_home_path)
+    return [resp], []
+
+
+async def _propfind_addressbook_depth_one(
+    request: Request,
+    propfind: PropFind,
+    backend: CardDAVBackend | None,
+    addressbook_home_path: str,
+    principal_path: str,
+) -> tuple[list[WebDAVResponse], list[AddressObject]]:
+    """List an individual addressbook and its address objects."""
+    if backend is None:
+        return [], []
+    addressbook = await _find_addressbook(request, backend)
+    if addressbook is None:
+        return [], []
+    resp = _propfind_addressbook(addressbook, propfind, principal_path, addressbook_home_path)
+    try:
+        objects = await _list_propfind_objects(request, backend, addressbook.path, propfind)
+    except Exception:
+        # Listing failed; answer with the addressbook alone
+        objects = []
+    return [resp], objects
+
+
+async def _find_addressbook(request: Request, backend: CardDAVBackend | None) -> AddressBook | None:
+    """Look up the addressbook at the request path, or None if there is none."""
+    if backend is None:
+        return None
+    try:
+        return await backend.get_addressbook(request, request.url.path)
+    except Exception:
+        # Addressbook not found or error
+        return None
+
+
+# PROPFIND handlers by resource type and depth; Depth: infinity is not
+# supported and is answered like Depth: 0
+_PROPFIND_HANDLERS = {
+    (ResourceType.ADDRESSBOOK_HOME_SET, Depth.ZERO): _propfind_home_set_depth_zero,
+    (ResourceType.ADDRESSBOOK_HOME_SET, Depth.ONE): _propfind_home_set_depth_one,
+    (ResourceType.ADDRESSBOOK_HOME_SET, Depth.INFINITY): _propfind_home_set_depth_zero,
+    (ResourceType.ADDRESSBOOK, Depth.ZERO): _propfind_addressbook_depth_zero,
+    (ResourceType.ADDRESSBOOK, Depth.ONE): _propfind_addressbook_depth_one,
+    (ResourceType.ADDRESSBOOK, Depth.INFINITY): _propfind_addressbook_depth_zero,
+}
+
+
+async def _list_propfind_objects(
+    request: Request, backend: CardDAVBackend, addressbook_path: str, propfind: PropFind
+) -> list[AddressObject]:
+    """List the address objects of a Depth: 1 PROPFIND.
+
+    Unless the vCards themselves are requested, objects are built from the
+    backend's metadata-only index so no vCard data is loaded.
+
+    Args:
+        request: Starlette request
+        backend: CardDAV backend instance
+        addressbook_path: Address book path
+        propfind: PropFind request
+
+    Returns:
+        Address objects, with empty data when listed from the index
+    """
+    list_index = getattr(backend, "list_address_objects_index", None)
+    if list_index is None or _requests_address_data(propfind):
+        return await backend.list_address_objects(request, addressbook_path)
+
+    index = await list_index(request, addressbook_path)
+    return [
+        AddressObject(path=path, data="", mod_time=mod_time, content_length=length, etag=etag)
+        for path, etag, mod_time, length in zip(
+            index.paths, index.etags, index.mod_times, index.content_lengths, strict=True
+        )
+    ]
+
+
+def _requests_address_data(propfind: PropFind) -> bool:
+    """Check whether a PROPFIND needs the address-data property."""
+    if propfind.allprop or propfind.propname:
+        return True
+    if not propfind.prop:
+        return False
+    return any(prop_elem.tag == ADDRESS_DATA for prop_elem in propfind.prop.raw)
 
 
 def _propfind_addressbook_home_set(
@@ -137,110 +329,171 @@ def _propfind_addressbook_home_set(
     Returns:
         WebDAV Response
     """
-    from ..internal.elements import Prop, PropStat, Status
-
-    # Build property functions
-    props: dict[str, Callable] = {}
-
-    # Resource type - collection
-    props[f"{{{NAMESPACE}}}resourcetype"] = lambda: _create_resource_type_collection()
-
-    # Current user principal
-    props[f"{{{NAMESPACE}}}current-user-principal"] = lambda: _create_current_user_principal(
-        principal_path
-    )
-
-    # Addressbook home set - self-reference
-    props["{urn:ietf:params:xml:ns:carddav}addressbook-home-set"] = (
-        lambda: _create_addressbook_home_set(home_set_path)
-    )
+    ctx = _CollectionContext(principal_path=principal_path, home_set_path=home_set_path)
+    return _propfind_response(path, propfind, _HOME_SET_PROPS, ctx)
 
-    # Display name
-    props[f"{{{NAMESPACE}}}displayname"] = lambda: _create_displayname("Contacts")
 
-    # Determine which properties to return
-    requested_props = []
-    if propfind.allprop:
-        requested_props = list(props.keys())
-    elif propfind.propname:
-        requested_props = list(props.keys())
-    elif propfind.prop:
-        for prop_elem in propfind.prop.raw:
-            # Get the full qualified name
-            if "}" in prop_elem.tag:
-                prop_name = prop_elem.tag
-            else:
-                ns = prop_elem.nsmap.get(prop_elem.prefix) if prop_elem.prefix else ""
-                tag = prop_elem.tag.split("}")[-1]
-                prop_name = f"{{{ns}}}{tag}" if ns else tag
-            requested_props.append(prop_name)
+def _propfind_response(
+    path: str,
+    propfind: PropFind,
+    props: Mapping[str, Callable[[_Ctx], etree._Element | None]],
+    ctx: _Ctx,
+) -> WebDAVResponse:
+    """Create PROPFIND response from a property table.
 
-    # Build prop element with found properties
-    found_props = []
-    not_found_props = []
+    Args:
+        path: Resource path
+        propfind: PropFind request
+        props: Property builders keyed by qualified name
+        ctx: Value passed to each builder
 
-    for prop_name in requested_props:
-        if prop_name in props:
-            try:
-                prop_value = props[prop_name]()
-                found_props.append(prop_value)
-            except Exception:
-                not_found_props.append(prop_name)
-        else:
-            not_found_props.append(prop_name)
+    Returns:
+        WebDAV Response
+    """
+    found_props, not_found_props = _resolve_props(propfind, props, ctx)
 
     # Create propstats
     propstats = []
 
     if found_props:
         prop = Prop(raw=found_props)
-        propstat = PropStat(prop=prop, status=Status(code=200, text="OK"), response_description="")
+        propstat = PropStat(prop=prop, status=STATUS_OK, response_description="")
         propstats.append(propstat)
 
     if not_found_props:
-        not_found_elements = []
-        for prop_name in not_found_props:
-            elem = etree.Element(prop_name)
-            not_found_elements.append(elem)
+        # Copying a cached parent is cheaper than creating each element
+        not_found_elements = list(copy.deepcopy(_not_found_prop(tuple(not_found_props))))
 
         prop = Prop(raw=not_found_elements)
-        propstat = PropStat(
-            prop=prop, status=Status(code=404, text="Not Found"), response_description=""
-        )
+        propstat = PropStat(prop=prop, status=STATUS_NOT_FOUND, response_description="")
         propstats.append(propstat)
 
     return WebDAVResponse(
-        hrefs=[Href.from_string(path)],
+        hrefs=[_href(path)],
         propstats=propstats,
         status=None,
     )
 
 
-def _create_resource_type_collection() -> etree._Element:
+@lru_cache(maxsize=256)
+def _not_found_prop(prop_names: tuple[str, ...]) -> etree._Element:
+    """Build a prop element holding empty elements for the given property names.
+
+    Clients request the same unsupported properties on every sync, so the
+    elements are built once per set of names and copied for each response.
+    """
+    prop = etree.Element(PROP)
+    for prop_name in prop_names:
+        etree.SubElement(prop, prop_name)
+    return prop
+
+
+def _resolve_props(
+    propfind: PropFind,
+    props: Mapping[str, Callable[[_Ctx], etree._Element | None]],
+    ctx: _Ctx,
+) -> tuple[list[etree._Element], list[str]]:
+    """Build the requested properties from a property table.
+
+    Builders may return None for properties the resource does not have; those
+    are left out of allprop/propname listings and reported as not found when
+    requested explicitly.
+
+    Args:
+        propfind: PropFind request
+        props: Property builders keyed by qualified name
+        ctx: Value passed to each builder
+
+    Returns:
+        Tuple of (found property elements, names of properties not found)
+    """
+    found_props: list[etree._Element] = []
+    not_found_props: list[str] = []
+
+    if propfind.allprop or propfind.propname:
+        # Every property is listed, so no names need resolving
+        for prop_name, build in props.items():
+            try:
+                prop_value = build(ctx)
+            except Exception:
+                not_found_props.append(prop_name)
+                continue
+            if prop_value is not None:
+                found_props.append(prop_value)
+    elif propfind.prop:
+        for prop_name in propfind.qualified_prop_names():
+            builder = props.get(prop_name)
+            if builder is None:
+                not_found_props.append(prop_name)
+                continue
+            try:
+                prop_value = builder(ctx)
+            except Exception:
+                not_found_props.append(prop_name)
+                continue
+            if prop_value is not None:
+                found_props.append(prop_value)
+            else:
+                not_found_props.append(prop_name)
+
+    return found_props, not_found_props
+
+
+@lru_cache(maxsize=4096)
+def _href(path: str) -> Href:
+    """Parse an href, reusing the result for paths seen before.
+
+    Hrefs are only read once built, so responses can share them.
+    """
+    return Href.from_string(path)
+
+
+def _create_resource_type_collection(ctx: _CollectionContext) -> etree._Element:
     """Create resourcetype XML element for collection."""
-    rt = etree.Element(f"{{{NAMESPACE}}}resourcetype")
+    return copy.deepcopy(_RESOURCE_TYPE_COLLECTION)
+
+
+def _build_resource_type_collection() -> etree._Element:
+    """Build the resourcetype prototype for collections."""
+    rt = etree.Element(RESOURCE_TYPE)
     etree.SubElement(rt, COLLECTION)
     return rt
 
 
-def _create_current_user_principal(path: str) -> etree._Element:
+def _create_current_user_principal(ctx: _CollectionContext) -> etree._Element:
     """Create current-user-principal XML element."""
-    cup = CurrentUserPrincipal(href=Href.from_string(path))
+    cup = CurrentUserPrincipal(href=_href(ctx.principal_path))
     return cup.to_xml()
 
 
-def _create_addressbook_home_set(path: str) -> etree._Element:
+def _create_addressbook_home_set(ctx: _CollectionContext) -> etree._Element:
     """Create addressbook-home-set XML element."""
-    elem = etree.Element("{urn:ietf:params:xml:ns:carddav}addressbook-home-set")
-    href = etree.SubElement(elem, f"{{{NAMESPACE}}}href")
+    elem = copy.deepcopy(_ADDRESSBOOK_HOME_SET)
+    elem[0].text = ctx.home_set_path
+    return elem
+
+
+def _build_addressbook_home_set(path: str) -> etree._Element:
+    """Build the addressbook-home-set prototype."""
+    elem = etree.Element(ADDRESSBOOK_HOME_SET)
+    href = etree.SubElement(elem, HREF)
     href.text = path
     return elem
 
 
-def _create_displayname(name: str) -> etree._Element:
-    """Create displayname XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}displayname")
-    elem.text = name
+def _create_home_set_displayname(ctx: _CollectionContext) -> etree._Element:
+    """Create displayname XML element for the home set."""
+    elem = etree.Element(DISPLAY_NAME)
+    elem.text = "Contacts"
+    return elem
+
+
+def _create_addressbook_displayname(ctx: _CollectionContext) -> etree._Element | None:
+    """Create displayname XML element for an addressbook, if one is in the context."""
+    if ctx.addressbook is None:
+        return None
+    elem = etree.Element(DISPLAY_NAME)
+    elem.text = ctx.addressbook.name
     return elem
 
 
@@ -258,92 +511,10 @@ def _propfind_addressbook(
     Returns:
         WebDAV Response
     """
-    from ..internal.elements import Prop, PropStat, Status
-
-    # Build property functions
-    props: dict[str, Callable] = {}
-
-    # Resource type - collection with addressbook
-    props[f"{{{NAMESPACE}}}resourcetype"] = lambda: _create_addressbook_resourcetype()
-
-    # Current user principal
-    props[f"{{{NAMESPACE}}}current-user-principal"] = lambda: _create_current_user_principal(
-        principal_path
-    )
-
-    # Addressbook home set
-    props["{urn:ietf:params:xml:ns:carddav}addressbook-home-set"] = (
-        lambda: _create_addressbook_home_set(home_set_path)
-    )
-
-    # Display name
-    props[f"{{{NAMESPACE}}}displayname"] = lambda: _create_displayname(addressbook.name)
-
-    # Supported address data (vCard versions)
-    props["{urn:ietf:params:xml:ns:carddav}supported-address-data"] = (
-        lambda: _create_supported_address_data()
-    )
-
-    # Current user privilege set (read/write)
-    props[f"{{{NAMESPACE}}}current-user-privilege-set"] = (
-        lambda: _create_current_user_privilege_set()
-    )
-
-    # Determine which properties to return
-    requested_props = []
-    if propfind.allprop:
-        requested_props = list(props.keys())
-    elif propfind.propname:
-        requested_props = list(props.keys())
-    elif propfind.prop:
-        for prop_elem in propfind.prop.raw:
-            if "}" in prop_elem.tag:
-                prop_name = prop_elem.tag
-            else:
-                ns = prop_elem.nsmap.get(prop_elem.prefix) if prop_elem.prefix else ""
-                tag = prop_elem.tag.split("}")[-1]
-                prop_name = f"{{{ns}}}{tag}" if ns else tag
-            requested_props.append(prop_name)
-
-    # Build prop element with found properties
-    found_props = []
-    not_found_props = []
-
-    for prop_name in requested_props:
-        if prop_name in props:
-            try:
-                prop_value = props[prop_name]()
-                found_props.append(prop_value)
-            except Exception:
-                not_found_props.append(prop_name)
-        else:
-            not_found_props.append(prop_name)
-
-    # Create propstats
-    propstats = []
-
-    if found_props:
-        prop = Prop(raw=found_props)
-        propstat = PropStat(prop=prop, status=Status(code=200, text="OK"), response_description="")
-        propstats.append(propstat)
-
-    if not_found_props:
-        not_found_elements = []
-        for prop_name in not_found_props:
-            elem = etree.Element(prop_name)
-            not_found_elements.append(elem)
-
-        prop = Prop(raw=not_found_elements)
-        propstat = PropStat(
-            prop=prop, status=Status(code=404, text="Not Found"), response_description=""
-        )
-        propstats.append(propstat)
-
-    return WebDAVResponse(
-        hrefs=[Href.from_string(addressbook.path)],
-        propstats=propstats,
-        status=None,
+    ctx = _CollectionContext(
+        principal_path=principal_path, home_set_path=home_set_path, addressbook=addressbook
     )
+    return _propfind_response(addressbook.path, propfind, _ADDRESSBOOK_PROPS, ctx)
 
 
 def _propfind_address_object(obj, propfind: PropFind) -> WebDAVResponse:
@@ -356,167 +527,221 @@ def _propfind_address_object(obj, propfind: PropFind) -> WebDAVResponse:
     Returns:
         WebDAV Response
     """
-    from ..internal.elements import Prop, PropStat, Status
-
-    # Build property functions
-    props: dict[str, Callable] = {}
-
-    # Resource type - empty for non-collections
-    props[f"{{{NAMESPACE}}}resourcetype"] = lambda: etree.Element(f"{{{NAMESPACE}}}resourcetype")
-
-    # ETag
-    props[f"{{{NAMESPACE}}}getetag"] = lambda: _create_etag(obj.etag)
+    return _propfind_response(obj.path, propfind, _ADDRESS_OBJECT_PROPS, obj)
 
-    # Content length
-    props[f"{{{NAMESPACE}}}getcontentlength"] = lambda: _create_content_length(obj.content_length)
 
-    # Content type
-    props[f"{{{NAMESPACE}}}getcontenttype"] = lambda: _create_content_type("text/vcard")
+def _address_object_response_xml(obj: AddressObject, propfind: PropFind) -> etree._Element:
+    """Create the PROPFIND response element for an address object directly.
 
-    # Last modified
-    if obj.mod_time:
-        props[f"{{{NAMESPACE}}}getlastmodified"] = lambda: _create_last_modified(obj.mod_time)
+    Address objects are the bulk of most multistatus responses, so their
+    properties go straight into the XML instead of through Response, PropStat
+    and Prop.
 
-    # Address data (the actual vCard content)
-    CARDDAV_NS = "urn:ietf:params:xml:ns:carddav"
-    props[f"{{{CARDDAV_NS}}}address-data"] = lambda: _create_address_data(obj.data)
-
-    # Determine which properties to return
-    requested_props = []
-    if propfind.allprop:
-        requested_props = list(props.keys())
-    elif propfind.propname:
-        requested_props = list(props.keys())
-    elif propfind.prop:
-        for prop_elem in propfind.prop.raw:
-            if "}" in prop_elem.tag:
-                prop_name = prop_elem.tag
-            else:
-                ns = prop_elem.nsmap.get(prop_elem.prefix) if prop_elem.prefix else ""
-                tag = prop_elem.tag.split("}")[-1]
-                prop_name = f"{{{ns}}}{tag}" if ns else tag
-            requested_props.append(prop_name)
-
-    # Build prop element with found properties
-    found_props = []
-    not_found_props = []
-
-    for prop_name in requested_props:
-        if prop_name in props:
-            try:
-                prop_value = props[prop_name]()
-                found_props.append(prop_value)
-            except Exception:
-                not_found_props.append(prop_name)
-        else:
-            not_found_props.append(prop_name)
+    Args:
+        obj: AddressObject
+        propfind: PropFind request
 
-    # Create propstats
-    propstats = []
+    Returns:
+        DAV:response element
+    """
+    found_props, not_found_props = _resolve_props(propfind, _ADDRESS_OBJECT_PROPS, obj)
 
+    resp = etree.Element(RESPONSE)
+    etree.SubElement(resp, HREF).text = str(_href(obj.path))
     if found_props:
-        prop = Prop(raw=found_props)
-        propstat = PropStat(prop=prop, status=Status(code=200, text="OK"), response_description="")
-        propstats.append(propstat)
-
+        propstat = etree.SubElement(resp, PROPSTAT)
+        etree.SubElement(propstat, PROP).extend(found_props)
+        etree.SubElement(propstat, STATUS).text = _STATUS_OK_LINE
     if not_found_props:
-        not_found_elements = []
-        for prop_name in not_found_props:
-            elem = etree.Element(prop_name)
-            not_found_elements.append(elem)
+        propstat = etree.SubElement(resp, PROPSTAT)
+        propstat.append(copy.deepcopy(_not_found_prop(tuple(not_found_props))))
+        etree.SubElement(propstat, STATUS).text = _STATUS_NOT_FOUND_LINE
+    return resp
 
-        prop = Prop(raw=not_found_elements)
-        propstat = PropStat(
-            prop=prop, status=Status(code=404, text="Not Found"), response_description=""
-        )
-        propstats.append(propstat)
 
-    return WebDAVResponse(
-        hrefs=[Href.from_string(obj.path)],
-        propstats=propstats,
-        status=None,
-    )
+def _create_addressbook_resourcetype(ctx: _CollectionContext) -> etree._Element:
+    """Create resourcetype XML element for addressbook."""
+    return copy.deepcopy(_ADDRESSBOOK_RESOURCE_TYPE)
 
 
-def _create_addressbook_resourcetype() -> etree._Element:
-    """Create resourcetype XML element for addressbook."""
-    rt = etree.Element(f"{{{NAMESPACE}}}resourcetype")
+def _build_addressbook_resourcetype() -> etree._Element:
+    """Build the resourcetype prototype for address books."""
+    rt = etree.Element(RESOURCE_TYPE)
     etree.SubElement(rt, COLLECTION)
-    etree.SubElement(rt, "{urn:ietf:params:xml:ns:carddav}addressbook")
+    etree.SubElement(rt, ADDRESSBOOK)
     return rt
 
 
-def _create_etag(etag: str) -> etree._Element:
+def _create_object_resourcetype(obj: AddressObject) -> etree._Element:
+    """Create the empty resourcetype XML element of a non-collection."""
+    return etree.Element(_RESOURCE_TYPE_QNAME)
+
+
+def _create_etag(obj: AddressObject) -> etree._Element:
     """Create getetag XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}getetag")
-    elem.text = f'"{etag}"'
+    elem = etree.Element(_GET_ETAG_QNAME)
+    elem.text = f'"{obj.etag}"'
     return elem
 
 
-def _create_content_length(length: int) -> etree._Element:
+def _create_content_length(obj: AddressObject) -> etree._Element:
     """Create getcontentlength XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}getcontentlength")
-    elem.text = str(length)
+    elem = etree.Element(_GET_CONTENT_LENGTH_QNAME)
+    elem.text = str(obj.content_length)
     return elem
 
 
-def _create_content_type(content_type: str) -> etree._Element:
+def _create_content_type(obj: AddressObject) -> etree._Element:
     """Create getcontenttype XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}getcontenttype")
-    elem.text = content_type
+    elem = etree.Element(_GET_CONTENT_TYPE_QNAME)
+    elem.text = "text/vcard"
     return elem
 
 
-def _create_last_modified(dt: datetime) -> etree._Element:
-    """Create getlastmodified XML element."""
-    from email.utils import format_datetime
-
-    elem = etree.Element(f"{{{NAMESPACE}}}getlastmodified")
-    elem.text = format_datetime(dt, usegmt=True)
+def _create_last_modified(obj: AddressObject) -> etree._Element | None:
+    """Create getlastmodified XML element, or None without a modification time."""
+    if not obj.mod_time:
+        return None
+    elem = etree.Element(_GET_LAST_MODIFIED_QNAME)
+    elem.text = _http_date(obj.mod_time)
     return elem
 
 
-def _create_supported_address_data() -> etree._Element:
+def _http_date(dt: datetime) -> str:
+    """Format a datetime as an RFC 1123 HTTP date; naive datetimes are taken as UTC."""
+    if dt.tzinfo is not None and dt.tzinfo is not UTC:
+        dt = dt.astimezone(UTC)
+    return (
+        f"{_WEEKDAYS[dt.weekday()]}, {dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year:04d} "
+        f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d} GMT"
+    )
+
+
+def _create_supported_address_data(ctx: _CollectionContext) -> etree._Element:
     """Create supported-address-data XML element."""
-    CARDDAV_NS = "urn:ietf:params:xml:ns:carddav"
-    elem = etree.Element(f"{{{CARDDAV_NS}}}supported-address-data")
+    return copy.deepcopy(_SUPPORTED_ADDRESS_DATA)
+
+
+def _build_supported_address_data() -> etree._Element:
+    """Build the supported-address-data prototype."""
+    elem = etree.Element(SUPPORTED_ADDRESS_DATA)
 
     # Add vCard 3.0 support
-    addr_data_type = etree.SubElement(elem, f"{{{CARDDAV_NS}}}address-data-type")
+    addr_data_type = etree.SubElement(elem, ADDRESS_DATA_TYPE)
     addr_data_type.set("content-type", "text/vcard")
     addr_data_type.set("version", "3.0")
 
     # Add vCard 4.0 support
-    addr_data_type = etree.SubElement(elem, f"{{{CARDDAV_NS}}}address-data-type")
+    addr_data_type = etree.SubElement(elem, ADDRESS_DATA_TYPE)
     addr_data_type.set("content-type", "text/vcard")
     addr_data_type.set("version", "4.0")
 
     return elem
 
 
-def _create_current_user_privilege_set() -> etree._Element:
+def _create_current_user_privilege_set(ctx: _CollectionContext) -> etree._Element:
     """Create current-user-privilege-set XML element."""
-    elem = etree.Element(f"{{{NAMESPACE}}}current-user-privilege-set")
+    return copy.deepcopy(_CURRENT_USER_PRIVILEGE_SET)
+
+
+def _build_current_user_privilege_set() -> etree._Element:
+    """Build the current-user-privilege-set prototype."""
+    elem = etree.Element(CURRENT_USER_PRIVILEGE_SET)
 
     # Add read privilege
-    privilege = etree.SubElement(elem, f"{{{NAMESPACE}}}privilege")
-    etree.SubElement(privilege, f"{{{NAMESPACE}}}read")
+    privilege = etree.SubElement(elem, PRIVILEGE)
+    etree.SubElement(privilege, READ)
 
     # Add write privilege
-    privilege = etree.SubElement(elem, f"{{{NAMESPACE}}}privilege")
-    etree.SubElement(privilege, f"{{{NAMESPACE}}}write")
+    privilege = etree.SubElement(elem, PRIVILEGE)
+    etree.SubElement(privilege, WRITE)
 
     return elem
 
 
-def _create_address_data(vcard_data: str) -> etree._Element:
+def _create_address_data(obj: AddressObject) -> etree._Element:
     """Create address-data XML element with vCard content."""
-    CARDDAV_NS = "urn:ietf:params:xml:ns:carddav"
-    elem = etree.Element(f"{{{CARDDAV_NS}}}address-data")
-    elem.text = vcard_data
+    elem = etree.Element(_ADDRESS_DATA_QNAME)
+    elem.text = obj.data
     return elem
 
 
+@dataclass
+class _CollectionContext:
+    """Values read by the home set and address book property builders."""
+
+    principal_path: str
+    home_set_path: str
+    addressbook: AddressBook | None = None
+
+
+# Property builders, in the order they are listed for allprop/propname
+_HOME_SET_PROPS: dict[str, Callable[[_CollectionContext], etree._Element]] = {
+    RESOURCE_TYPE: _create_resource_type_collection,
+    CURRENT_USER_PRINCIPAL: _create_current_user_principal,
+    ADDRESSBOOK_HOME_SET: _create_addressbook_home_set,
+    DISPLAY_NAME: _create_home_set_displayname,
+}
+
+_ADDRESSBOOK_PROPS: dict[str, Callable[[_CollectionContext], etree._Element | None]] = {
+    RESOURCE_TYPE: _create_addressbook_resourcetype,
+    CURRENT_USER_PRINCIPAL: _create_current_user_principal,
+    ADDRESSBOOK_HOME_SET: _create_addressbook_home_set,
+    DISPLAY_NAME: _create_addressbook_displayname,
+    # Supported address data (vCard versions)
+    SUPPORTED_ADDRESS_DATA: _create_supported_address_data,
+    # Current user privilege set (read/write)
+    CURRENT_USER_PRIVILEGE_SET: _create_current_user_privilege_set,
+}
+
+_ADDRESS_OBJECT_PROPS: dict[str, Callable[[AddressObject], etree._Element | None]] = {
+    # Resource type - empty for non-collections
+    RESOURCE_TYPE: _create_object_resourcetype,
+    GET_ETAG: _create_etag,
+    GET_CONTENT_LENGTH: _create_content_length,
+    GET_CONTENT_TYPE: _create_content_type,
+    GET_LAST_MODIFIED: _create_last_modified,
+    # Address data (the actual vCard content)
+    ADDRESS_DATA: _create_address_data,
+}
+
+
+# Static property elements are built once and copied for each response, as
+# serializing a response moves its elements into the multistatus tree
+_RESOURCE_TYPE_COLLECTION = _build_resource_type_collection()
+_ADDRESSBOOK_RESOURCE_TYPE = _build_addressbook_resourcetype()
+_ADDRESSBOOK_HOME_SET = _build_addressbook_home_set("")
+_SUPPORTED_ADDRESS_DATA = _build_supported_address_data()
+_CURRENT_USER_PRIVILEGE_SET = _build_current_user_privilege_set()
+
+
+async def serve_address_object(request: Request, backend: CardDAVBackend) -> Response:
+    """Serve an address object for a GET or HEAD request.
+
+    Objects stored in a file are sent from disk with FileResponse (zero-copy
+    where the ASGI server supports it) instead of re-encoding the vCard string.
+
+    Args:
+        request: Starlette request
+        backend: CardDAV backend instance
+
+    Returns:
+        vCard response, or 304 if If-None-Match matches the object's ETag
+    """
+    obj = await backend.get_address_object(request, request.url.path)
+
+    headers: dict[str, str] = {}
+    if obj.etag:
+        headers["ETag"] = f'"{obj.etag}"'
+        if ConditionalMatch(request.headers.get("if-none-match", "")).match_etag(obj.etag):
+            return Response(status_code=304, headers=headers)
+
+    if obj.raw_path is not None:
+        return FileResponse(obj.raw_path, headers=headers, media_type="text/vcard")
+
+    return Response(content=obj.data, headers=headers, media_type="text/vcard")
+
+
 async def handle_carddav_report(
     request: Request,
     addressbook_home_path: str,
@@ -534,18 +759,10 @@ async def handle_carddav_report(
     Returns:
         Multi-status response
     """
-    from .report import AddressBookMultigetReport, AddressBookQueryReport, parse_addressbook_report
-
-    # Parse REPORT request body
-    body = await request.body()
-    root = etree.fromstring(body)
-
     try:
-        report = parse_addressbook_report(root)
-    except ValueError as e:
-        from starlette.responses import Response as StarletteResponse
-
-        return StarletteResponse(content=str(e), status_code=400)
+        report = parse_addressbook_report(await _parse_report_body(request))
+    except (etree.XMLSyntaxError, ValueError) as e:
+        return Response(content=str(e), status_code=400)
 
     if isinstance(report, AddressBookQueryReport):
         return await _handle_addressbook_query(
@@ -556,9 +773,33 @@ async def handle_carddav_report(
             request, report, addressbook_home_path, principal_path, backend
         )
     else:
-        from starlette.responses import Response as StarletteResponse
+        return Response(content="Unknown REPORT type", status_code=400)
+
+
+async def _parse_report_body(request: Request) -> etree._Element:
+    """Parse a REPORT request body as its chunks arrive.
+
+    The body is fed to the parser chunk by chunk, so it is never held as one
+    bytes object next to the parsed tree.
+
+    Args:
+        request: Starlette request
+
+    Returns:
+        Root element of the REPORT body
 
-        return StarletteResponse(content="Unknown REPORT type", status_code=400)
+    Raises:
+        etree.XMLSyntaxError: If the body is not well-formed XML
+    """
+    # Feed parsers keep per-document state, so each request gets its own;
+    # entities are never expanded
+    parser = etree.XMLParser(
+        remove_blank_text=True, collect_ids=False, resolve_entities=False, no_network=True
+    )
+    async for chunk in request.stream():
+        if chunk:
+            parser.feed(chunk)
+    return parser.close()
 
 
 async def _handle_addressbook_query(
@@ -569,9 +810,6 @@ async def _handle_addressbook_query(
     backend,  # CardDAVBackend
 ) -> Response:
     """Handle addressbook-query REPORT."""
-    from ..internal.elements import Prop
-    from .carddav import AddressBookQuery
-
     # Build AddressBookQuery from the parsed report
     # For now, we'll return all objects (filtering not yet implemented)
     ab_query = AddressBookQuery()
@@ -596,14 +834,8 @@ async def _handle_addressbook_query(
         propname=query.propname,
     )
 
-    # Build responses for each object
-    responses = []
-    for obj in objects:
-        resp = _propfind_address_object(obj, propfind)
-        responses.append(resp)
-
-    ms = MultiStatus(responses=responses)
-    return serve_multistatus(ms)
+    # Build responses for each object while the multistatus is sent
+    return serve_multistatus_stream(_address_object_response_xml(obj, propfind) for obj in objects)
 
 
 async def _handle_addressbook_multiget(
@@ -611,11 +843,14 @@ async def _handle_addressbook_multiget(
     multiget: AddressBookMultigetReport,
     addressbook_home_path: str,
     principal_path: str,
-    backend,  # CardDAVBackend
+    backend: CardDAVBackend,
 ) -> Response:
-    """Handle addressbook-multiget REPORT."""
-    from ..internal.elements import Prop
+    """Handle addressbook-multiget REPORT.
 
+    Backend failures other than missing objects propagate, so they are answered
+    with an error status instead of a multistatus that looks like every
+    requested contact was deleted.
+    """
     # Build PropFind from multiget
     prop_obj = None
     if multiget.prop:
@@ -629,16 +864,84 @@ async def _handle_addressbook_multiget(
         propname=multiget.propname,
     )
 
-    # Fetch each requested href
-    responses = []
-    for href in multiget.hrefs:
-        try:
-            obj = await backend.get_address_object(request, href)
-            resp = _propfind_address_object(obj, propfind)
-            responses.append(resp)
-        except Exception:
-            # If object not found, skip it
-            continue
+    # Hrefs that were just found missing are not looked up again
+    now = time.monotonic()
+    missing_hrefs = _missing_hrefs.setdefault(backend, OrderedDict())
+    hrefs = [href for href in multiget.hrefs if not _known_missing(missing_hrefs, href, now)]
+
+    # Fetch all requested hrefs at once (missing ones are skipped)
+    objects, not_found = await _fetch_address_objects(request, backend, hrefs)
+    _remember_missing_hrefs(missing_hrefs, not_found, now)
 
-    ms = MultiStatus(responses=responses)
-    return serve_multistatus(ms)
+    return serve_multistatus_stream(_address_object_response_xml(obj, propfind) for obj in objects)
+
+
+def _known_missing(missing_hrefs: OrderedDict[str, float], href: str, now: float) -> bool:
+    """Check whether an href was found missing less than MISSING_HREF_TTL ago."""
+    last_lookup = missing_hrefs.get(href)
+    return last_lookup is not None and now - last_lookup < MISSING_HREF_TTL
+
+
+def _remember_missing_hrefs(
+    missing_hrefs: OrderedDict[str, float], not_found: list[str], now: float
+) -> None:
+    """Record the multiget hrefs the backend reported as not found."""
+    for href in not_found:
+        missing_hrefs[href] = now
+        missing_hrefs.move_to_end(href)
+    while len(missing_hrefs) > MISSING_HREF_CACHE_SIZE:
+        missing_hrefs.popitem(last=False)
+
+
+def forget_missing_address_object(backend: CardDAVBackend, path: str) -> None:
+    """Let multigets look up an address object again, e.g. after it was created.
+
+    Args:
+        backend: CardDAV backend instance
+        path: Address object path
+    """
+    missing_hrefs = _missing_hrefs.get(backend)
+    if missing_hrefs is not None:
+        missing_hrefs.pop(path, None)
+
+
+async def _fetch_address_objects(
+    request: Request, backend: CardDAVBackend, paths: list[str]
+) -> tuple[list[AddressObject], list[str]]:
+    """Fetch address objects for a multiget, skipping missing ones.
+
+    Backends without a batch lookup are queried concurrently, one object per call.
+
+    Args:
+        request: Starlette request
+        backend: CardDAV backend instance
+        paths: Address object paths
+
+    Returns:
+        Address objects that exist, in request order, and the paths that were
+        not found
+
+    Raises:
+        Exception: If a lookup fails for a reason other than a missing object
+    """
+    get_address_objects = getattr(backend, "get_address_objects", None)
+    if get_address_objects is not None:
+        result: tuple[list[AddressObject], list[str]] = await get_address_objects(request, paths)
+        return result
+
+    semaphore = asyncio.Semaphore(MULTIGET_CONCURRENCY)
+    not_found: list[str] = []
+
+    async def fetch(path: str) -> AddressObject | None:
+        async with semaphore:
+            try:
+                return await backend.get_address_object(request, path)
+            except Exception as e:
+                # Only a 404 means the object doesn't exist
+                if not is_not_found(e):
+                    raise
+                not_found.append(path)
+                return None
+
+    objects = await asyncio.gather(*(fetch(path) for path in paths))
+    return [obj for obj in objects if obj is not None], not_found
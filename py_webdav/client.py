@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
 from io import BytesIO
 from typing import BinaryIO
 
 import httpx
+from lxml import etree
 
 from .internal import Client as InternalClient
 from .internal import Depth, PropFind
 from .internal import elements as elem
 from .webdav import CopyOptions, FileInfo, MoveOptions
 
+# Properties read by file_info_from_response
+_FILE_INFO_PROPS = frozenset(
+    {
+        elem.RESOURCE_TYPE,
+        elem.GET_CONTENT_LENGTH,
+        elem.GET_CONTENT_TYPE,
+        elem.GET_ETAG,
+        elem.GET_LAST_MODIFIED,
+    }
+)
+
 
-async def file_info_from_response(resp: elem.Response) -> FileInfo:
+def file_info_from_response(resp: elem.Response) -> FileInfo:
     """Convert internal Response to FileInfo.
 
     Args:
@@ -31,77 +47,151 @@ async def file_info_from_response(resp: elem.Response) -> FileInfo:
 
     fi = FileInfo(path=path)
 
-    # Get resource type
-    res_type_elem = None
+    # Collect all file info properties in one pass over the propstats
+    found: dict[str, etree._Element] = {}
     for propstat in resp.propstats:
-        res_type_elem = propstat.prop.get(elem.RESOURCE_TYPE)
-        if res_type_elem is not None:
+        for prop_elem in propstat.prop.raw:
+            tag = prop_elem.tag
+            if tag in _FILE_INFO_PROPS and tag not in found:
+                # Empty values (as listed in a 404 propstat) are skipped, except
+                # for the resource type, which is empty for plain files
+                if prop_elem.text or tag == elem.RESOURCE_TYPE:
+                    found[tag] = prop_elem
+        if len(found) == len(_FILE_INFO_PROPS):
             break
 
+    res_type_elem = found.get(elem.RESOURCE_TYPE)
     if res_type_elem is not None:
         res_type = elem.ResourceType.from_xml(res_type_elem)
         if res_type.is_type(elem.COLLECTION):
             fi.is_dir = True
 
     if not fi.is_dir:
-        # Get content length
-        for propstat in resp.propstats:
-            len_elem = propstat.prop.get(elem.GET_CONTENT_LENGTH)
-            if len_elem is not None and len_elem.text:
-                fi.size = int(len_elem.text)
-                break
-
-        # Get content type
-        for propstat in resp.propstats:
-            type_elem = propstat.prop.get(elem.GET_CONTENT_TYPE)
-            if type_elem is not None and type_elem.text:
-                fi.mime_type = type_elem.text
-                break
+        len_elem = found.get(elem.GET_CONTENT_LENGTH)
+        if len_elem is not None and len_elem.text:
+            fi.size = int(len_elem.text)
+
+        type_elem = found.get(elem.GET_CONTENT_TYPE)
+        if type_elem is not None and type_elem.text:
+            fi.mime_type = type_elem.text
+
+        etag_elem = found.get(elem.GET_ETAG)
+        if etag_elem is not None and etag_elem.text:
+            # Remove the quotes around the entity tag
+            etag = etag_elem.text
+            if len(etag) >= 2 and etag[0] == '"' and etag[-1] == '"':
+                etag = etag[1:-1]
+            fi.etag = etag
+
+    mod_elem = found.get(elem.GET_LAST_MODIFIED)
+    if mod_elem is not None and mod_elem.text:
+        fi.mod_time = parsedate_to_datetime(mod_elem.text)
 
-        # Get ETag
-        for propstat in resp.propstats:
-            etag_elem = propstat.prop.get(elem.GET_ETAG)
-            if etag_elem is not None and etag_elem.text:
-                # Remove quotes
-                fi.etag = etag_elem.text.strip('"')
-                break
+    return fi
 
-    # Get last modified
-    for propstat in resp.propstats:
-        mod_elem = propstat.prop.get(elem.GET_LAST_MODIFIED)
-        if mod_elem is not None and mod_elem.text:
-            from datetime import datetime
 
-            fi.mod_time = datetime.strptime(mod_elem.text, "%a, %d %b %Y %H:%M:%S %Z")
-            break
+# Connection pool for clients created by Client itself; keeping connections
+# alive lets a read_dir followed by stat/open calls reuse one TLS handshake
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=15.0)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0)
 
-    return fi
+# Multiplex concurrent requests over one connection when h2 is installed
+HTTP2 = find_spec("h2") is not None
 
 
 # PROPFIND request for file info
 FILE_INFO_PROPFIND = PropFind(
     prop=elem.Prop(
         raw=[
-            elem.etree.Element(elem.RESOURCE_TYPE),
-            elem.etree.Element(elem.GET_CONTENT_LENGTH),
-            elem.etree.Element(elem.GET_LAST_MODIFIED),
-            elem.etree.Element(elem.GET_CONTENT_TYPE),
-            elem.etree.Element(elem.GET_ETAG),
+            etree.Element(elem.RESOURCE_TYPE),
+            etree.Element(elem.GET_CONTENT_LENGTH),
+            etree.Element(elem.GET_LAST_MODIFIED),
+            etree.Element(elem.GET_CONTENT_TYPE),
+            etree.Element(elem.GET_ETAG),
         ]
     )
 )
 
+# The file info request body never changes, so it is serialized only once
+FILE_INFO_PROPFIND_BODY = etree.tostring(
+    FILE_INFO_PROPFIND.to_xml(), encoding="utf-8", xml_declaration=True
+)
+
+
+# Bytes requested from the connection per read by Client.open_stream
+OPEN_CHUNK_SIZE = 64 * 1024
+
+
+class ResponseBody:
+    """Streamed body of a GET response, read asynchronously in chunks.
+
+    The response is closed as soon as the body has been read to the end;
+    Client.open_stream also closes it when its context exits early.
+    """
+
+    def __init__(self, resp: httpx.Response):
+        """Initialize response body.
+
+        Args:
+            resp: HTTP response opened in streaming mode
+        """
+        self._resp = resp
+        self._chunks = resp.aiter_bytes(OPEN_CHUNK_SIZE)
+        self._buffer = bytearray()
+        self._eof = False
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, or the rest of the body if size is negative.
+
+        Args:
+            size: Maximum number of bytes to read
+
+        Returns:
+            Bytes read; empty at the end of the body
+        """
+        while not self._eof and (size < 0 or len(self._buffer) < size):
+            # aiter_bytes never yields empty chunks, so b"" marks the end
+            chunk = await anext(self._chunks, b"")
+            if not chunk:
+                self._eof = True
+                await self._resp.aclose()
+                break
+            self._buffer += chunk
+
+        if 0 <= size < len(self._buffer):
+            data = bytes(self._buffer[:size])
+            del self._buffer[:size]
+            return data
+
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+    async def aclose(self) -> None:
+        """Close the underlying response."""
+        await self._resp.aclose()
+
 
 class Client:
-    """WebDAV client for accessing remote WebDAV servers."""
+    """WebDAV client for accessing remote WebDAV servers.
+
+    The client owns the HTTP client only when it creates one itself. Since
+    pooled connections were introduced, close() no longer closes an HTTP client
+    passed in by the caller; earlier versions closed it in either case.
+    """
 
     def __init__(self, http_client: httpx.AsyncClient | None = None, endpoint: str = ""):
         """Initialize WebDAV client.
 
         Args:
-            http_client: HTTP client to use
+            http_client: HTTP client to use (creates a pooled client if None).
+                A supplied client stays open after close() and must be closed
+                by the caller.
             endpoint: WebDAV server endpoint URL
         """
+        self._owns_client = http_client is None
+        if http_client is None:
+            http_client = httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT, http2=HTTP2)
         self.internal_client = InternalClient(http_client, endpoint)
 
     async def find_current_user_principal(self) -> str:
@@ -113,7 +203,7 @@ class Client:
         Raises:
             Exception: If unauthenticated or error occurs
         """
-        propfind = PropFind(prop=elem.Prop(raw=[elem.etree.Element(elem.CURRENT_USER_PRINCIPAL)]))
+        propfind = PropFind(prop=elem.Prop(raw=[etree.Element(elem.CURRENT_USER_PRINCIPAL)]))
 
         resp = await self.internal_client.propfind_flat("", propfind)
 
@@ -139,12 +229,14 @@ class Client:
         Returns:
             FileInfo object
         """
-        resp = await self.internal_client.propfind_flat(name, FILE_INFO_PROPFIND)
-        return await file_info_from_response(resp)
+        resp = await self.internal_client.propfind_flat(name, FILE_INFO_PROPFIND_BODY)
+        return file_info_from_response(resp)
 
     async def open(self, name: str) -> BinaryIO:
         """Open a file for reading.
 
+        The whole file is read into memory; use open_stream for large files.
+
         Args:
             name: File path
 
@@ -155,6 +247,25 @@ class Client:
         # Return BytesIO with content
         return BytesIO(resp.content)
 
+    @asynccontextmanager
+    async def open_stream(self, name: str) -> AsyncIterator[ResponseBody]:
+        """Open a file for streamed reading.
+
+        The body is read from the connection in chunks as it is consumed, and
+        the connection is released when the context exits.
+
+        Args:
+            name: File path
+
+        Yields:
+            ResponseBody with async reads
+        """
+        resp = await self.internal_client.stream_request("GET", name)
+        try:
+            yield ResponseBody(resp)
+        finally:
+            await resp.aclose()
+
     async def read_dir(self, name: str, recursive: bool = False) -> list[FileInfo]:
         """List directory contents.
 
@@ -167,23 +278,10 @@ class Client:
         """
         depth = Depth.INFINITY if recursive else Depth.ONE
 
-        ms = await self.internal_client.propfind(name, depth, FILE_INFO_PROPFIND)
-
-        files: list[FileInfo] = []
-        errors: list[Exception] = []
-
-        for resp in ms.responses:
-            try:
-                fi = await file_info_from_response(resp)
-                files.append(fi)
-            except Exception as e:
-                errors.append(e)
+        ms = await self.internal_client.propfind(name, depth, FILE_INFO_PROPFIND_BODY)
 
-        if errors:
-            # For now, just raise the first error
-            raise errors[0]
-
-        return files
+        # Conversion is CPU-only; the first failing response raises
+        return [file_info_from_response(resp) for resp in ms.responses]
 
     async def create(self, name: str, content: bytes) -> None:
         """Create or update a file.
@@ -254,5 +352,11 @@ class Client:
         await self.internal_client.request("MOVE", name, headers=headers)
 
     async def close(self) -> None:
-        """Close the client."""
-        await self.internal_client.close()
+        """Close the client.
+
+        Closes the HTTP client created by this client. A caller-supplied HTTP
+        client is left open for its owner to close; before pooling was added,
+        it was closed here as well.
+        """
+        if self._owns_client:
+            await self.internal_client.close()
@@ -173,9 +173,17 @@ Endpoints:
     )
 
     # Run with uvicorn
+    from importlib.util import find_spec
+
     import uvicorn
 
+    # uvloop and httptools come with uvicorn[standard] where the platform
+    # supports them (not on Windows); fall back to the pure-Python stack
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+
     print(f"WebDAV server listening on {args.addr}:{args.port}")
+    print(f"Event loop: {loop}, HTTP parser: {http}")
     print(f"Serving directory: {directory}")
     if args.caldav:
         print(f"CalDAV enabled: http://{args.addr}:{args.port}/.well-known/caldav")
@@ -192,6 +200,8 @@ Endpoints:
         host=args.addr,
         port=args.port,
         log_level="info",
+        loop=loop,
+        http=http,
     )
 
 
@@ -4,36 +4,87 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from typing import Any
 
 from lxml import etree
 
+try:
+    import orjson
+except ImportError:  # optional, see the "speedups" extra
+    orjson = None  # type: ignore[assignment]
+
 logger = logging.getLogger("py_webdav")
 inform_logger = logging.getLogger("py_webdav.inform")
 
+# Bodies larger than this are logged without pretty-printing
+FORMAT_XML_MAX_SIZE = 1_000_000
+
+# Formatted bodies up to this size are cached
+FORMAT_XML_CACHE_MAX_SIZE = 64 * 1024
+
+# Media types whose bodies are logged as formatted XML
+_XML_CONTENT_TYPES = ("application/xml", "text/xml", "application/x-www-form-urlencoded")
+
+# Headers worth logging, with their lowercase names for the lookup
+_REQUEST_HEADERS = tuple(
+    (name, name.lower())
+    for name in (
+        "Content-Type",
+        "Content-Length",
+        "Depth",
+        "Destination",
+        "Overwrite",
+        "If-Match",
+        "If-None-Match",
+        "Authorization",
+    )
+)
+_RESPONSE_HEADERS = tuple(
+    (name, name.lower()) for name in ("Content-Type", "Content-Length", "ETag", "DAV", "Allow")
+)
+
+# Parser for pretty-printing, reused across log calls
+_PRETTY_PARSER = etree.XMLParser(remove_blank_text=True)
+
 
-def format_xml(xml_bytes: bytes | str) -> str:
+def format_xml(xml_bytes: bytes | bytearray | str) -> str:
     """Format XML with proper indentation.
 
     Args:
         xml_bytes: XML content as bytes or string
 
     Returns:
-        Pretty-formatted XML string
+        Pretty-formatted XML string, or the content as-is if it is not
+        well-formed or larger than FORMAT_XML_MAX_SIZE
     """
+    # Bodies normally arrive as bytes and are parsed as they are; strings are
+    # encoded because lxml rejects strings with an encoding declaration
+    if isinstance(xml_bytes, str):
+        xml_bytes = xml_bytes.encode("utf-8")
+    elif not isinstance(xml_bytes, bytes):
+        # The formatting cache needs a hashable key
+        xml_bytes = bytes(xml_bytes)
+    if len(xml_bytes) > FORMAT_XML_MAX_SIZE:
+        return xml_bytes.decode("utf-8", errors="replace")
+    if len(xml_bytes) <= FORMAT_XML_CACHE_MAX_SIZE:
+        return _pretty_xml_cached(xml_bytes)
+    return _pretty_xml(xml_bytes)
+
+
+def _pretty_xml(xml_bytes: bytes) -> str:
+    """Pretty-print XML, returning the content as-is if it is not well-formed."""
     try:
-        if isinstance(xml_bytes, str):
-            xml_bytes = xml_bytes.encode("utf-8")
-
-        # Parse and pretty-print XML
-        parser = etree.XMLParser(remove_blank_text=True)
-        root = etree.fromstring(xml_bytes, parser)
+        root = etree.fromstring(xml_bytes, _PRETTY_PARSER)
         return etree.tostring(root, pretty_print=True, encoding="unicode")
     except Exception:
-        # If parsing fails, return as-is
-        if isinstance(xml_bytes, bytes):
-            return xml_bytes.decode("utf-8", errors="replace")
-        return str(xml_bytes)
+        return xml_bytes.decode("utf-8", errors="replace")
+
+
+@lru_cache(maxsize=64)
+def _pretty_xml_cached(xml_bytes: bytes) -> str:
+    """Pretty-print small XML bodies, which repeat often (e.g. sync polling)."""
+    return _pretty_xml(xml_bytes)
 
 
 def is_xml_content(content_type: str | None) -> bool:
@@ -48,106 +99,122 @@ def is_xml_content(content_type: str | None) -> bool:
     if not content_type:
         return False
 
-    xml_types = ["application/xml", "text/xml", "application/x-www-form-urlencoded"]
-    return any(xml_type in content_type.lower() for xml_type in xml_types)
+    # Parameters such as "; charset=utf-8" follow the media type
+    return content_type.lstrip().lower().startswith(_XML_CONTENT_TYPES)
+
+
+def _body_lines(body: bytes, content_type: str) -> list[str]:
+    """Format a request or response body as indented log lines.
+
+    Args:
+        body: Body content
+        content_type: Content-Type header value
+
+    Returns:
+        Log lines
+    """
+    if is_xml_content(content_type):
+        return [f"  {line}" for line in format_xml(body).split("\n") if line.strip()]
+
+    # Log non-XML bodies with size info
+    body_preview = body[:200].decode("utf-8", errors="replace")
+    lines = [f"  [{len(body)} bytes] {body_preview}"]
+    if len(body) > 200:
+        lines.append(f"  ... ({len(body) - 200} more bytes)")
+    return lines
 
 
 def log_request(method: str, path: str, headers: dict[str, str], body: bytes | None) -> None:
     """Log an incoming HTTP request.
 
+    The request is logged as a single message, so the handler is only
+    invoked once per request.
+
     Args:
         method: HTTP method
         path: Request path
         headers: Request headers
         body: Request body (if any)
     """
-    logger.info("=" * 80)
-    logger.info(f">>> INCOMING REQUEST: {method} {path}")
-    logger.info("-" * 80)
+    # Skip formatting the bodies when the messages would be dropped anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
 
-    # Log interesting headers
-    interesting_headers = [
-        "Content-Type",
-        "Content-Length",
-        "Depth",
-        "Destination",
-        "Overwrite",
-        "If-Match",
-        "If-None-Match",
-        "Authorization",
-    ]
+    lines = ["=" * 80, f">>> INCOMING REQUEST: {method} {path}", "-" * 80]
+
+    # Starlette already lowercases header names; normalize other mappings once
+    lower_headers = {name.lower(): value for name, value in headers.items()}
 
-    logger.info("Headers:")
-    for header in interesting_headers:
-        value = headers.get(header.lower(), headers.get(header))
+    lines.append("Headers:")
+    for header, lower_name in _REQUEST_HEADERS:
+        value = lower_headers.get(lower_name)
         if value:
             # Redact authorization
-            if header == "Authorization":
+            if lower_name == "authorization":
                 value = "[REDACTED]"
-            logger.info(f"  {header}: {value}")
+            lines.append(f"  {header}: {value}")
 
     # Log body if present
     if body:
-        content_type = headers.get("content-type", "")
-        logger.info("-" * 80)
-        logger.info("Request Body:")
+        lines += ["-" * 80, "Request Body:"]
+        lines += _body_lines(body, lower_headers.get("content-type", ""))
 
-        if is_xml_content(content_type):
-            formatted = format_xml(body)
-            for line in formatted.split("\n"):
-                if line.strip():
-                    logger.info(f"  {line}")
-        else:
-            # Log non-XML bodies with size info
-            body_preview = body[:200].decode("utf-8", errors="replace")
-            logger.info(f"  [{len(body)} bytes] {body_preview}")
-            if len(body) > 200:
-                logger.info(f"  ... ({len(body) - 200} more bytes)")
-
-    logger.info("=" * 80)
+    lines.append("=" * 80)
+    logger.info("\n".join(lines))
 
 
 def log_response(status_code: int, headers: dict[str, Any], body: bytes | None) -> None:
     """Log an outgoing HTTP response.
 
+    The response is logged as a single message, so the handler is only
+    invoked once per response.
+
     Args:
         status_code: HTTP status code
         headers: Response headers
         body: Response body (if any)
     """
-    logger.info("=" * 80)
-    logger.info(f"<<< OUTGOING RESPONSE: {status_code}")
-    logger.info("-" * 80)
+    # Skip formatting the bodies when the messages would be dropped anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
+    lines = ["=" * 80, f"<<< OUTGOING RESPONSE: {status_code}", "-" * 80]
 
-    # Log interesting headers
-    interesting_headers = ["Content-Type", "Content-Length", "ETag", "DAV", "Allow"]
+    # Starlette already lowercases header names; normalize other mappings once
+    lower_headers = {name.lower(): value for name, value in headers.items()}
 
-    logger.info("Headers:")
-    for header in interesting_headers:
-        value = headers.get(header.lower(), headers.get(header))
+    lines.append("Headers:")
+    for header, lower_name in _RESPONSE_HEADERS:
+        value = lower_headers.get(lower_name)
         if value:
-            logger.info(f"  {header}: {value}")
+            lines.append(f"  {header}: {value}")
 
     # Log body if present
     if body:
-        content_type = headers.get("content-type", "")
-        logger.info("-" * 80)
-        logger.info("Response Body:")
-
-        if is_xml_content(content_type):
-            formatted = format_xml(body)
-            for line in formatted.split("\n"):
-                if line.strip():
-                    logger.info(f"  {line}")
-        else:
-            # Log non-XML bodies with size info
-            body_preview = body[:200].decode("utf-8", errors="replace")
-            logger.info(f"  [{len(body)} bytes] {body_preview}")
-            if len(body) > 200:
-                logger.info(f"  ... ({len(body) - 200} more bytes)")
-
-    logger.info("=" * 80)
-    logger.info("")  # Empty line for readability
+        lines += ["-" * 80, "Response Body:"]
+        lines += _body_lines(body, lower_headers.get("content-type", ""))
+
+    lines.append("=" * 80)
+    lines.append("")  # Empty line for readability
+    logger.info("\n".join(lines))
+
+
+def _dumps(data: Any) -> str:
+    """Serialize log data as indented JSON, with orjson when it is installed.
+
+    Args:
+        data: JSON-serializable data
+
+    Returns:
+        JSON string indented by two spaces
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # e.g. integers beyond 64 bits, which the standard library handles
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False)
 
 
 def log_inform_request(method: str, url: str, headers: dict[str, Any], body: Any) -> None:
@@ -169,7 +236,7 @@ def log_inform_request(method: str, url: str, headers: dict[str, Any], body: Any
     if body is not None:
         request_data["body"] = body
 
-    inform_logger.info(json.dumps(request_data, indent=2, ensure_ascii=False))
+    inform_logger.info(_dumps(request_data))
 
 
 def log_inform_response(status_code: int, body: Any) -> None:
@@ -188,7 +255,7 @@ def log_inform_response(status_code: int, body: Any) -> None:
     if body is not None:
         response_data["body"] = body
 
-    inform_logger.info(json.dumps(response_data, indent=2, ensure_ascii=False))
+    inform_logger.info(_dumps(response_data))
 
 
 def setup_debug_logging() -> None:
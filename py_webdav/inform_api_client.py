@@ -252,6 +252,7 @@ class InformAPIClient:
         self,
         method: str,
         path: str,
+        check_status: bool = True,
         **kwargs: Any,
     ) -> httpx.Response:
         """Make authenticated request to INFORM API.
@@ -259,6 +260,7 @@ class InformAPIClient:
         Args:
             method: HTTP method (GET, POST, etc.)
             path: API path (e.g., "/companies")
+            check_status: Raise for 4xx/5xx responses (default: True)
             **kwargs: Additional arguments for httpx request
 
         Returns:
@@ -303,7 +305,8 @@ class InformAPIClient:
 
             log_inform_response(response.status_code, response_body)
 
-        response.raise_for_status()
+        if check_status:
+            response.raise_for_status()
 
         return response
 
@@ -468,6 +471,31 @@ class InformAPIClient:
         data: dict[str, Any] = response.json()
         return data
 
+    async def event_exists(self, event_key: str) -> bool:
+        """Check whether a calendar event exists.
+
+        Args:
+            event_key: Calendar event identification key
+
+        Returns:
+            True if the event exists, False if INFORM answers 404
+
+        Raises:
+            httpx.HTTPError: If the request fails for another reason
+        """
+        response = await self._make_request(
+            "GET",
+            f"/calendarEvents/{event_key}",
+            check_status=False,
+            params={"fields": "key"},
+        )
+
+        if response.status_code == 404:
+            return False
+
+        response.raise_for_status()
+        return True
+
     async def create_calendar_event(
         self,
         event_data: dict[str, Any],
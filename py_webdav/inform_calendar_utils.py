@@ -11,6 +11,7 @@ and ICS feed endpoint. All INFORM API quirks are handled here including:
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -20,6 +21,19 @@ from icalendar import Calendar as iCalendar
 from icalendar import Event as iEvent
 
 
+@lru_cache(maxsize=1024)
+def _format_inform_datetime(dt: datetime) -> str:
+    """Format datetime as YYYY-MM-DDTHH:MM:SSZ in UTC (cached)."""
+    # Ensure datetime is in UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=UTC)
+    elif dt.tzinfo != UTC:
+        dt = dt.astimezone(UTC)
+
+    # Format without microseconds, with Z suffix
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 class InformCalendarConverter:
     """Shared utilities for converting INFORM events to iCalendar format.
 
@@ -43,15 +57,19 @@ class InformCalendarConverter:
     def get_sync_date_range(self, weeks: int = 2) -> tuple[datetime, datetime]:
         """Get date range for syncing events (N weeks before/after current date).
 
+        The current time is truncated to the full hour (and the end extended
+        by one hour), so the range only changes hourly and repeated requests
+        produce identical INFORM query parameters.
+
         Args:
             weeks: Number of weeks before and after current date (default: 2)
 
         Returns:
             Tuple of (start_date, end_date) in UTC
         """
-        now = datetime.now(UTC)
+        now = datetime.now(UTC).replace(minute=0, second=0, microsecond=0)
         start = now - timedelta(weeks=weeks)
-        end = now + timedelta(weeks=weeks)
+        end = now + timedelta(weeks=weeks, hours=1)
         return start, end
 
     def format_datetime_for_inform(self, dt: datetime) -> str:
@@ -67,14 +85,7 @@ class InformCalendarConverter:
         Returns:
             Formatted datetime string (e.g., "2026-01-13T14:30:00Z")
         """
-        # Ensure datetime is in UTC
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        elif dt.tzinfo != UTC:
-            dt = dt.astimezone(UTC)
-
-        # Format without microseconds, with Z suffix
-        return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+        return _format_inform_datetime(dt)
 
     def occurrence_time_to_utc(self, date_str: str, seconds_from_midnight: float) -> datetime:
         """Convert INFORM occurrence time to UTC datetime.
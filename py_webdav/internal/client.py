@@ -63,6 +63,35 @@ async def discover_context_url(service: str, domain: str) -> str:
         raise ValueError(f"webdav: DNS discovery failed: {e}") from e
 
 
+def _http_error(resp: httpx.Response) -> HTTPError:
+    """Build the error for a non-2xx response.
+
+    Args:
+        resp: HTTP response with a read body
+
+    Returns:
+        HTTPError wrapping the start of a text response body
+    """
+    content_type = resp.headers.get("content-type", "text/plain")
+
+    wrapped_err: Exception | None = None
+    if "application/xml" in content_type or "text/xml" in content_type:
+        try:
+            # Try to parse error
+            # For now, just use the response text
+            wrapped_err = Exception(resp.text[:1024])
+        except Exception:
+            wrapped_err = Exception(resp.text[:1024])
+    elif content_type.startswith("text/"):
+        text = resp.text[:1024].strip()
+        if text:
+            if len(resp.text) > 1024:
+                text += " […]"
+            wrapped_err = Exception(text)
+
+    return HTTPError(resp.status_code, wrapped_err)
+
+
 class Client:
     """WebDAV HTTP client."""
 
@@ -143,46 +172,64 @@ class Client:
         resp = await self.http_client.request(method, url, content=content, headers=headers or {})
 
         if resp.status_code // 100 != 2:
-            # Handle error
-            content_type = resp.headers.get("content-type", "text/plain")
-
-            wrapped_err: Exception | None = None
-            if "application/xml" in content_type or "text/xml" in content_type:
-                try:
-                    # Try to parse error
-                    # For now, just use the response text
-                    wrapped_err = Exception(resp.text[:1024])
-                except Exception:
-                    wrapped_err = Exception(resp.text[:1024])
-            elif content_type.startswith("text/"):
-                text = resp.text[:1024].strip()
-                if text:
-                    if len(resp.text) > 1024:
-                        text += " […]"
-                    wrapped_err = Exception(text)
-
-            raise HTTPError(resp.status_code, wrapped_err)
+            raise _http_error(resp)
+
+        return resp
+
+    async def stream_request(
+        self, method: str, path: str, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        """Make an HTTP request without reading the response body.
+
+        The caller reads the body from the returned response and must close it.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            headers: Request headers
+
+        Returns:
+            HTTP response with an unread body
+        """
+        url = self.resolve_href(path)
+        req = self.http_client.build_request(method, url, headers=headers or {})
+        resp = await self.http_client.send(req, stream=True)
+
+        if resp.status_code // 100 != 2:
+            # Error bodies are short; read them for the error message
+            try:
+                await resp.aread()
+            finally:
+                await resp.aclose()
+            raise _http_error(resp)
 
         return resp
 
     async def xml_request(
-        self, method: str, path: str, xml_obj: etree._Element, headers: dict[str, str] | None = None
+        self,
+        method: str,
+        path: str,
+        xml_obj: etree._Element | bytes,
+        headers: dict[str, str] | None = None,
     ) -> httpx.Response:
         """Make an XML HTTP request.
 
         Args:
             method: HTTP method
             path: Request path
-            xml_obj: XML object to send
+            xml_obj: XML object to send, or its already serialized bytes
             headers: Additional request headers
 
         Returns:
             HTTP response
         """
-        # Serialize to bytes directly with XML declaration
-        xml_bytes = etree.tostring(
-            xml_obj, encoding="utf-8", xml_declaration=True, pretty_print=False
-        )
+        if isinstance(xml_obj, bytes):
+            xml_bytes = xml_obj
+        else:
+            # Serialize to bytes directly with XML declaration
+            xml_bytes = etree.tostring(
+                xml_obj, encoding="utf-8", xml_declaration=True, pretty_print=False
+            )
 
         req_headers = headers or {}
         req_headers["Content-Type"] = "text/xml; charset=utf-8"
@@ -209,18 +256,18 @@ class Client:
         xml_elem = etree.fromstring(resp.content)
         return MultiStatus.from_xml(xml_elem)
 
-    async def propfind(self, path: str, depth: Depth, propfind: PropFind) -> MultiStatus:
+    async def propfind(self, path: str, depth: Depth, propfind: PropFind | bytes) -> MultiStatus:
         """Perform a PROPFIND request.
 
         Args:
             path: Resource path
             depth: Depth header value
-            propfind: PROPFIND request
+            propfind: PROPFIND request, or its serialized request body
 
         Returns:
             Multistatus response
         """
-        xml_elem = propfind.to_xml()
+        xml_elem = propfind if isinstance(propfind, bytes) else propfind.to_xml()
 
         headers = {"Depth": depth_to_string(depth)}
 
@@ -233,12 +280,12 @@ class Client:
         ms_elem = etree.fromstring(resp.content)
         return MultiStatus.from_xml(ms_elem)
 
-    async def propfind_flat(self, path: str, propfind: PropFind) -> Response:
+    async def propfind_flat(self, path: str, propfind: PropFind | bytes) -> Response:
         """Perform a PROPFIND request with depth 0.
 
         Args:
             path: Resource path
-            propfind: PROPFIND request
+            propfind: PROPFIND request, or its serialized request body
 
         Returns:
             Single response
@@ -29,7 +29,7 @@ CURRENT_USER_PRINCIPAL = "{DAV:}current-user-principal"
 CURRENT_USER_PRIVILEGE_SET = "{DAV:}current-user-privilege-set"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Status:
     """HTTP status for WebDAV responses."""
 
@@ -347,6 +347,23 @@ class PropFind:
     allprop: bool = False
     include: list[str] = field(default_factory=list)
     propname: bool = False
+    _qualified_names: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def qualified_prop_names(self) -> tuple[str, ...]:
+        """Return the Clark-notation names of the requested properties.
+
+        The names are resolved once per request and reused for every resource
+        in the response.
+        """
+        if self._qualified_names is None:
+            raw = self.prop.raw if self.prop else []
+            # lxml tags are already in Clark notation; comments and PIs have no name
+            self._qualified_names = tuple(
+                prop_elem.tag for prop_elem in raw if isinstance(prop_elem.tag, str)
+            )
+        return self._qualified_names
 
     @staticmethod
     def from_xml(element: etree._Element) -> PropFind:
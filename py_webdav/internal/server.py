@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import io
+import logging
+from collections.abc import AsyncIterator, Iterable, Iterator
 from typing import Protocol
 
 from lxml import etree
 from starlette.requests import Request
 from starlette.responses import Response as StarletteResponse
+from starlette.responses import StreamingResponse
 
 from .elements import (
     NAMESPACE,
@@ -17,6 +21,11 @@ from .elements import (
 )
 from .internal import Depth, HTTPError, parse_depth, parse_overwrite
 
+logger = logging.getLogger(__name__)
+
+# Serialized bytes buffered before a streamed multistatus chunk is sent
+MULTISTATUS_CHUNK_SIZE = 64 * 1024
+
 
 def serve_error(err: Exception) -> StarletteResponse:
     """Serve an error response."""
@@ -77,7 +86,11 @@ def serve_xml(content: etree._Element) -> StarletteResponse:
 
 def serve_multistatus(ms: MultiStatus) -> StarletteResponse:
     """Serve a multistatus response."""
-    xml_elem = ms.to_xml()
+    return serve_multistatus_xml(ms.to_xml())
+
+
+def serve_multistatus_xml(xml_elem: etree._Element) -> StarletteResponse:
+    """Serve an already built multistatus element."""
     # Serialize to bytes with XML declaration
     xml_bytes = etree.tostring(xml_elem, encoding="utf-8", xml_declaration=True, pretty_print=True)
     return StarletteResponse(
@@ -87,6 +100,58 @@ def serve_multistatus(ms: MultiStatus) -> StarletteResponse:
     )
 
 
+def serve_multistatus_stream(responses: Iterable[etree._Element]) -> StreamingResponse:
+    """Serve a multistatus response, serializing responses as they are produced.
+
+    Only one response tree is alive at a time, so large listings are not built
+    up in memory before being sent. The first response is built before the 207
+    status is committed, so errors raised while producing it still reach the
+    caller and can be served as a regular error response.
+
+    Args:
+        responses: DAV:response elements to list, typically a generator
+
+    Returns:
+        Streaming multi-status response
+    """
+    rest = iter(responses)
+    first = next(rest, None)
+    return StreamingResponse(
+        _multistatus_chunks(first, rest),
+        status_code=207,  # Multi-Status
+        media_type="application/xml; charset=utf-8",
+    )
+
+
+async def _multistatus_chunks(
+    first: etree._Element | None, rest: Iterator[etree._Element]
+) -> AsyncIterator[bytes]:
+    """Serialize a multistatus incrementally, in chunks of about MULTISTATUS_CHUNK_SIZE.
+
+    A failure after the status line has been sent cannot be reported to the
+    client any more. It is logged and re-raised so that the server aborts the
+    connection instead of completing a truncated document.
+    """
+    buf = io.BytesIO()
+    try:
+        with etree.xmlfile(buf, encoding="utf-8") as xf:
+            xf.write_declaration()
+            with xf.element(f"{{{NAMESPACE}}}multistatus"):
+                if first is not None:
+                    xf.write(first, pretty_print=True)
+                for resp in rest:
+                    xf.write(resp, pretty_print=True)
+                    xf.flush()
+                    if buf.tell() >= MULTISTATUS_CHUNK_SIZE:
+                        yield buf.getvalue()
+                        buf.seek(0)
+                        buf.truncate()
+    except Exception:
+        logger.exception("webdav: failed to stream multistatus response")
+        raise
+    yield buf.getvalue()
+
+
 class Backend(Protocol):
     """WebDAV backend interface."""
 
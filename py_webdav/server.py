@@ -696,6 +696,8 @@ class Handler:
                 and request.url.path.startswith(self.addressbook_home_path)
                 and self.carddav_backend is not None
             ):
+                from .carddav.server import forget_missing_address_object
+
                 try:
                     # Read request body
                     vcard_data = (await request.body()).decode("utf-8")
@@ -708,6 +710,7 @@ class Handler:
                     address_object = await self.carddav_backend.put_address_object(
                         request, request.url.path, vcard_data, if_none_match, if_match
                     )
+                    forget_missing_address_object(self.carddav_backend, request.url.path)
 
                     # Prepare response headers
                     headers: dict[str, str] = {}
@@ -754,6 +757,31 @@ class Handler:
                         await self._log_response(response)
                     return response
 
+            # Handle GET/HEAD requests for CardDAV address objects
+            if (
+                request.method in ("GET", "HEAD")
+                and request.url.path.startswith(self.addressbook_home_path)
+                and request.url.path.endswith(".vcf")
+                and self.carddav_backend is not None
+            ):
+                from .carddav.server import serve_address_object
+
+                try:
+                    response = await serve_address_object(request, self.carddav_backend)
+                    if self.debug:
+                        await self._log_response(response)
+                    return response
+                except HTTPError as e:
+                    response = StarletteResponse(content=str(e), status_code=e.code)
+                    if self.debug:
+                        await self._log_response(response)
+                    return response
+                except Exception as e:
+                    response = StarletteResponse(content=f"Internal error: {e}", status_code=500)
+                    if self.debug:
+                        await self._log_response(response)
+                    return response
+
         response = await self.internal_handler.handle(request)
 
         # Log outgoing response if debug is enabled
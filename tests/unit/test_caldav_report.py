@@ -0,0 +1,69 @@
+"""Tests for CalDAV REPORT parsing."""
+
+import pytest
+from lxml import etree
+
+from py_webdav.caldav.report import (
+    MAX_REPORT_CHILDREN,
+    CalendarMultigetReport,
+    CalendarQueryReport,
+    parse_calendar_report,
+)
+
+
+def test_parse_calendar_query():
+    """Test parsing a calendar-query REPORT."""
+    body = b"""<?xml version="1.0" encoding="utf-8"?>
+<C:calendar-query xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">
+  <D:prop>
+    <D:getetag/>
+    <C:calendar-data/>
+  </D:prop>
+  <C:filter>
+    <C:comp-filter name="VCALENDAR"/>
+  </C:filter>
+</C:calendar-query>"""
+
+    report = parse_calendar_report(etree.fromstring(body))
+
+    assert isinstance(report, CalendarQueryReport)
+    assert report.prop == ["{DAV:}getetag", "{urn:ietf:params:xml:ns:caldav}calendar-data"]
+    assert report.filter is not None
+    assert not report.allprop
+
+
+def test_parse_calendar_multiget():
+    """Test parsing a calendar-multiget REPORT."""
+    body = b"""<?xml version="1.0" encoding="utf-8"?>
+<C:calendar-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">
+  <D:prop>
+    <D:getetag/>
+  </D:prop>
+  <D:href>/calendars/default/a.ics</D:href>
+  <D:href>/calendars/default/b.ics</D:href>
+  <D:href>/calendars/default/a.ics</D:href>
+</C:calendar-multiget>"""
+
+    report = parse_calendar_report(etree.fromstring(body))
+
+    assert isinstance(report, CalendarMultigetReport)
+    assert report.hrefs == ["/calendars/default/a.ics", "/calendars/default/b.ics"]
+    assert report.prop == ["{DAV:}getetag"]
+
+
+def test_parse_unknown_report_fails():
+    """Test that unknown REPORT types are rejected."""
+    root = etree.fromstring(b'<D:sync-collection xmlns:D="DAV:"/>')
+
+    with pytest.raises(ValueError, match="Unknown CalDAV REPORT type"):
+        parse_calendar_report(root)
+
+
+def test_parse_oversized_report_fails():
+    """Test that REPORT bodies with too many elements are rejected."""
+    root = etree.Element("{urn:ietf:params:xml:ns:caldav}calendar-multiget")
+    for i in range(MAX_REPORT_CHILDREN + 1):
+        etree.SubElement(root, "{DAV:}href").text = f"/calendars/default/{i}.ics"
+
+    with pytest.raises(ValueError, match="more than"):
+        parse_calendar_report(root)
@@ -0,0 +1,210 @@
+"""Tests for CalDAV PROPFIND response building."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from lxml import etree
+from starlette.requests import Request
+
+from py_webdav.caldav import Calendar, CalendarObject
+from py_webdav.caldav.server import (
+    CALENDAR_DESCRIPTION,
+    ResourceType,
+    _calendar_object_response_xml,
+    _calendar_object_row,
+    _fetch_calendar_objects,
+    _http_date,
+    _prop_signature,
+    _propfind_calendar,
+    _propfind_calendar_home_set,
+    _propfind_calendar_object,
+    _qualified_tag,
+    _serve_calendar_objects,
+    detect_resource_type,
+    handle_caldav_propfind,
+    handle_caldav_report,
+)
+from py_webdav.internal import Depth, HTTPError, MultiStatus, PropFind
+from py_webdav.internal.elements import DISPLAY_NAME, GET_ETAG, GET_LAST_MODIFIED, Prop
+
+
+def _propstats(resp):
+    """Map status codes to the property names reported under them."""
+    return {
+        propstat.status.code: [elem.tag for elem in propstat.prop.raw]
+        for propstat in resp.propstats
+    }
+
+
+def test_propfind_calendar_allprop_skips_missing_description():
+    """Test that allprop only lists properties the calendar has."""
+    calendar = Calendar(path="/calendars/default/", name="Work")
+
+    resp = _propfind_calendar(calendar, PropFind(allprop=True), "/principal/", "/calendars/")
+
+    found = _propstats(resp)
+    assert DISPLAY_NAME in found[200]
+    assert CALENDAR_DESCRIPTION not in found[200]
+    assert 404 not in found
+
+
+def test_propfind_calendar_object_requested_props():
+    """Test that requested but unavailable properties are reported as not found."""
+    obj = CalendarObject(path="/calendars/default/a.ics", data="", etag="abc")
+    prop = Prop(raw=[etree.Element(GET_ETAG), etree.Element(GET_LAST_MODIFIED)])
+
+    resp = _propfind_calendar_object(obj, PropFind(prop=prop))
+
+    assert _propstats(resp) == {200: [GET_ETAG], 404: [GET_LAST_MODIFIED]}
+    assert resp.propstats[0].prop.raw[0].text == '"abc"'
+
+
+def test_qualified_tag():
+    """Test qualified names for namespaced and plain property elements."""
+    assert _qualified_tag(etree.Element(GET_ETAG)) == GET_ETAG
+    assert _qualified_tag(etree.Element("getetag")) == "getetag"
+
+
+def test_propfind_home_set_is_reused_safely():
+    """Test that home set responses are independent of earlier serializations."""
+    first = _propfind_calendar_home_set("/calendars/", PropFind(allprop=True), "/p/", "/calendars/")
+    etree.tostring(MultiStatus(responses=[first]).to_xml())
+
+    second = _propfind_calendar_home_set(
+        "/calendars/", PropFind(allprop=True), "/p/", "/calendars/"
+    )
+
+    assert second is not first
+    assert DISPLAY_NAME in _propstats(second)[200]
+    assert second.propstats[0].prop.raw[-1].text == "Calendars"
+
+
+def test_detect_resource_type():
+    """Test resource type detection from path depth."""
+    assert detect_resource_type("/") == ResourceType.ROOT
+    assert detect_resource_type("/calendars/") == ResourceType.CALENDAR_HOME_SET
+    assert detect_resource_type("/calendars/default") == ResourceType.CALENDAR
+    assert detect_resource_type("/calendars//default/") == ResourceType.CALENDAR
+    assert detect_resource_type("/calendars/default/a.ics") == ResourceType.CALENDAR_OBJECT
+    assert detect_resource_type("/dav/calendars/", prefix="/dav/") == ResourceType.CALENDAR_HOME_SET
+
+
+async def test_report_rejects_malformed_body():
+    """Test that unparsable REPORT bodies are answered with 400."""
+
+    async def receive():
+        return {"type": "http.request", "body": b"<C:calendar-query", "more_body": False}
+
+    scope = {"type": "http", "method": "REPORT", "path": "/calendars/default/", "headers": []}
+    resp = await handle_caldav_report(Request(scope, receive), "/calendars/", "/p/", backend=None)
+
+    assert resp.status_code == 400
+
+
+async def test_fetch_calendar_objects_without_batch_lookup():
+    """Test the per-object multiget fallback for backends without a batch lookup."""
+
+    class SingleObjectBackend:
+        async def get_calendar_object(self, request, path):
+            if path.endswith("missing.ics"):
+                raise HTTPError(404, Exception("not found"))
+            return CalendarObject(path=path, data="")
+
+    paths = ["/calendars/default/b.ics", "/calendars/default/missing.ics", "/c/a.ics"]
+    objects = await _fetch_calendar_objects(None, SingleObjectBackend(), paths)
+
+    assert [obj.path for obj in objects] == [paths[0], paths[2]]
+
+
+async def test_multiget_reports_backend_failures():
+    """Test that a failing backend is not answered as if the objects were deleted."""
+
+    class FlakyBackend:
+        async def get_calendar_object(self, request, path):
+            if path.endswith("missing.ics"):
+                raise HTTPError(404, Exception("not found"))
+            raise HTTPError(502, Exception("upstream timeout"))
+
+    body = (
+        b'<C:calendar-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">'
+        b"<D:prop><D:getetag/></D:prop>"
+        b"<D:href>/calendars/default/missing.ics</D:href><D:href>/calendars/default/a.ics</D:href>"
+        b"</C:calendar-multiget>"
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {"type": "http", "method": "REPORT", "path": "/calendars/default/", "headers": []}
+    with pytest.raises(HTTPError) as excinfo:
+        await handle_caldav_report(Request(scope, receive), "/calendars/", "/p/", FlakyBackend())
+
+    assert excinfo.value.code == 502
+
+
+async def test_serve_calendar_objects():
+    """Test that calendar object rows are streamed straight into the multistatus."""
+    home_set = _propfind_calendar_home_set(
+        "/calendars/", PropFind(allprop=True), "/p/", "/calendars/"
+    )
+    obj = CalendarObject(path="/calendars/default/a.ics", data="", etag="abc")
+    prop = Prop(raw=[etree.Element(GET_ETAG), etree.Element(GET_LAST_MODIFIED)])
+
+    resp = _serve_calendar_objects([home_set], [obj], PropFind(prop=prop))
+    ms = MultiStatus.from_xml(etree.fromstring(b"".join([c async for c in resp.body_iterator])))
+
+    assert resp.status_code == 207
+    assert [str(r.hrefs[0]) for r in ms.responses] == ["/calendars/", obj.path]
+    assert _propstats(ms.responses[1]) == {200: [GET_ETAG], 404: [GET_LAST_MODIFIED]}
+
+
+async def test_propfind_calendar_streams_objects(monkeypatch):
+    """Test that a Depth: 1 PROPFIND streams a complete multistatus in chunks."""
+    monkeypatch.setattr("py_webdav.internal.server.MULTISTATUS_CHUNK_SIZE", 256)
+    calendar = Calendar(path="/calendars/default/", name="Work")
+
+    class ListingBackend:
+        async def get_calendar(self, request, path):
+            return calendar
+
+        async def list_calendar_objects(self, request, path):
+            return [CalendarObject(path=f"{path}{i}.ics", data="", etag=str(i)) for i in range(20)]
+
+    scope = {"type": "http", "method": "PROPFIND", "path": "/calendars/default/", "headers": []}
+    resp = await handle_caldav_propfind(
+        Request(scope), PropFind(allprop=True), Depth.ONE, "/calendars/", "/p/", ListingBackend()
+    )
+    chunks = [chunk async for chunk in resp.body_iterator]
+    ms = MultiStatus.from_xml(etree.fromstring(b"".join(chunks)))
+
+    assert resp.status_code == 207
+    assert len(chunks) > 1
+    assert len(ms.responses) == 21
+    assert str(ms.responses[-1].hrefs[0]) == "/calendars/default/19.ics"
+
+
+def test_calendar_object_row_matches_direct_build():
+    """Test that template rows match responses built property by property."""
+    objects = [
+        CalendarObject(path="/c/a.ics", data="BEGIN:VCALENDAR", etag="a", content_length=15),
+        CalendarObject(
+            path="/c/b.ics", data="", etag="b", mod_time=datetime(2026, 1, 1, tzinfo=UTC)
+        ),
+        CalendarObject(path="/c/c.ics", data="not xml \x00", etag="c"),
+    ]
+    prop = Prop(raw=[etree.Element(GET_ETAG), etree.Element(GET_LAST_MODIFIED)])
+
+    for propfind in (PropFind(allprop=True), PropFind(prop=prop)):
+        for obj in objects:
+            row = _calendar_object_row(obj, propfind, _prop_signature(propfind))
+            expected = _calendar_object_response_xml(obj, propfind)
+            assert etree.tostring(row) == etree.tostring(expected)
+
+
+def test_http_date():
+    """Test HTTP date formatting of aware datetimes."""
+    dt = datetime(2026, 1, 13, 14, 0, 5, 900_000, tzinfo=UTC)
+    berlin = dt.astimezone(timezone(timedelta(hours=1)))
+
+    assert _http_date(dt) == "Tue, 13 Jan 2026 14:00:05 GMT"
+    assert _http_date(berlin) == _http_date(dt)
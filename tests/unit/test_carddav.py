@@ -1,7 +1,12 @@
 """Tests for CardDAV functionality."""
+import os
+from datetime import UTC, datetime
+
 import pytest
 
-from py_webdav.carddav import validate_address_object
+from py_webdav.carddav import AddressBook, LocalCardDAVBackend, validate_address_object
+from py_webdav.carddav.carddav import _fast_uid, _split_path
+from py_webdav.internal import HTTPError
 
 
 def test_validate_address_object_valid():
@@ -54,3 +59,242 @@ def test_validate_address_object_invalid_format():
 
     with pytest.raises(ValueError):
         validate_address_object(vcard_data)
+
+
+def test_validate_address_object_crlf():
+    """Test validating a vCard with CRLF line endings."""
+    vcard_data = "BEGIN:VCARD\r\nVERSION:3.0\r\nUID:urn:uuid:1234\r\nFN:A\r\nEND:VCARD\r\n"
+
+    uid = validate_address_object(vcard_data)
+
+    assert uid == "urn:uuid:1234", f"Expected urn:uuid:1234, got {uid}"
+
+
+def test_validate_address_object_folded_uid():
+    """Test that folded and escaped UIDs are unfolded and unescaped."""
+    folded = "BEGIN:VCARD\nVERSION:3.0\nUID:test-\n contact\nEND:VCARD"
+    escaped = "BEGIN:VCARD\nVERSION:3.0\nUID:a\\,b\nEND:VCARD"
+
+    assert validate_address_object(folded) == "test-contact"
+    assert validate_address_object(escaped) == "a,b"
+
+
+async def test_list_address_objects_index(tmp_path):
+    """Test that the metadata index matches the full address object listing."""
+    backend = LocalCardDAVBackend(tmp_path)
+    addressbook = tmp_path / "contacts" / "personal"
+    addressbook.mkdir(parents=True)
+    (addressbook / "a.vcf").write_text("BEGIN:VCARD\nVERSION:3.0\nUID:a\nEND:VCARD\n")
+    (addressbook / "b.vcf").write_text("BEGIN:VCARD\nVERSION:3.0\nUID:b\nEND:VCARD\n")
+
+    objects = await backend.list_address_objects(None, "/contacts/personal/")
+    index = await backend.list_address_objects_index(None, "/contacts/personal/")
+
+    assert len(index) == 2
+    assert sorted(zip(index.paths, index.etags, index.content_lengths, strict=True)) == sorted(
+        (obj.path, obj.etag, obj.content_length) for obj in objects
+    )
+
+
+async def test_list_address_objects_matches_get(tmp_path):
+    """Test that listed objects match single lookups and skip non-vCard entries."""
+    backend = LocalCardDAVBackend(tmp_path)
+    addressbook = tmp_path / "contacts" / "personal"
+    addressbook.mkdir(parents=True)
+    (addressbook / "a.vcf").write_bytes(b"BEGIN:VCARD\r\nVERSION:3.0\r\nUID:a\r\nEND:VCARD\r\n")
+    (addressbook / "notes.txt").write_text("not a vCard")
+    (addressbook / "dir.vcf").mkdir()
+
+    objects = await backend.list_address_objects(None, "/contacts/personal/")
+    obj = await backend.get_address_object(None, "/contacts/personal/a.vcf")
+
+    assert objects == [obj]
+    assert obj.data == "BEGIN:VCARD\nVERSION:3.0\nUID:a\nEND:VCARD\n"
+    assert obj.content_length == 44
+
+
+async def test_list_address_objects_reuses_unchanged_files(tmp_path):
+    """Test that listings reuse cached contents until a file's stat pair changes."""
+    backend = LocalCardDAVBackend(tmp_path)
+    addressbook = tmp_path / "contacts" / "personal"
+    addressbook.mkdir(parents=True)
+    vcard = addressbook / "a.vcf"
+    vcard.write_text("BEGIN:VCARD\nVERSION:3.0\nUID:a\nEND:VCARD\n")
+    stat = vcard.stat()
+
+    [first] = await backend.list_address_objects(None, "/contacts/personal/")
+
+    # Same size and mtime: the cached contents are served without reading the file
+    vcard.write_text("BEGIN:VCARD\nVERSION:3.0\nUID:b\nEND:VCARD\n")
+    os.utime(vcard, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    [cached] = await backend.list_address_objects(None, "/contacts/personal/")
+    assert cached.data == first.data
+
+    vcard.write_text("BEGIN:VCARD\nVERSION:3.0\nUID:changed\nEND:VCARD\n")
+    [changed] = await backend.list_address_objects(None, "/contacts/personal/")
+    assert "UID:changed" in changed.data
+    assert changed.etag != first.etag
+
+    await backend.delete_address_object(None, "/contacts/personal/a.vcf")
+    assert not backend._object_cache
+
+
+async def test_put_address_object_matches_get(tmp_path):
+    """Test that the object returned by a PUT matches a later lookup."""
+    backend = LocalCardDAVBackend(tmp_path)
+    vcard_data = "BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Jane\r\nUID:jane\r\nEND:VCARD\r\n"
+
+    created = await backend.put_address_object(None, "/contacts/personal/jane.vcf", vcard_data)
+    fetched = await backend.get_address_object(None, "/contacts/personal/jane.vcf")
+
+    assert created == fetched
+    assert created.content_length == len(vcard_data.encode())
+
+
+async def test_addressbook_metadata_round_trip(tmp_path):
+    """Test that address book metadata is written and read back, with defaults."""
+    backend = LocalCardDAVBackend(tmp_path)
+    addressbook = AddressBook(
+        path="/contacts/work/", name="Work", description="Colleagues", max_resource_size=1024
+    )
+    (tmp_path / "contacts" / "plain").mkdir()
+
+    await backend.create_addressbook(None, addressbook)
+    books = {book.path: book for book in await backend.list_addressbooks(None)}
+
+    assert books["/contacts/work/"] == addressbook
+    assert books["/contacts/plain/"].name == "plain"
+
+
+def test_split_path():
+    """Test splitting address book and object paths."""
+    assert _split_path("/contacts/personal/") == ("personal", "")
+    assert _split_path("/contacts/personal/jane.vcf") == ("personal", "jane.vcf")
+    assert _split_path("/contacts//personal//jane.vcf") == ("personal", "jane.vcf")
+    assert _split_path("/contacts/") == ("", "")
+
+
+async def test_missing_address_object_is_not_found(tmp_path):
+    """Test that lookups and deletes of missing objects answer 404."""
+    backend = LocalCardDAVBackend(tmp_path)
+    (tmp_path / "contacts" / "personal" / "dir.vcf").mkdir(parents=True)
+
+    for path in ("/contacts/personal/missing.vcf", "/contacts/personal/dir.vcf"):
+        with pytest.raises(HTTPError) as excinfo:
+            await backend.get_address_object(None, path)
+        assert excinfo.value.code == 404
+
+    with pytest.raises(HTTPError) as excinfo:
+        await backend.delete_address_object(None, "/contacts/personal/missing.vcf")
+    assert excinfo.value.code == 404
+
+
+async def test_get_address_object_over_http(tmp_path):
+    """Test that GET serves the stored vCard and honours If-None-Match."""
+    import httpx
+    from starlette.applications import Starlette
+    from starlette.routing import Route
+
+    from py_webdav import Handler, LocalFileSystem
+
+    handler = Handler(LocalFileSystem(tmp_path), carddav_backend=LocalCardDAVBackend(tmp_path))
+    app = Starlette(routes=[Route("/{path:path}", handler.handle, methods=["GET", "HEAD"])])
+    addressbook = tmp_path / "contacts" / "personal"
+    addressbook.mkdir(parents=True)
+    vcard = b"BEGIN:VCARD\r\nVERSION:3.0\r\nUID:a\r\nEND:VCARD\r\n"
+    (addressbook / "a.vcf").write_bytes(vcard)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        resp = await client.get("/contacts/personal/a.vcf")
+        cached = await client.get(
+            "/contacts/personal/a.vcf", headers={"If-None-Match": resp.headers["etag"]}
+        )
+        missing = await client.get("/contacts/personal/missing.vcf")
+
+    assert resp.status_code == 200
+    assert resp.content == vcard
+    assert resp.headers["content-type"].startswith("text/vcard")
+    assert cached.status_code == 304
+    assert missing.status_code == 404
+
+
+async def test_delete_addressbook(tmp_path):
+    """Test that deleting an address book removes it and its cached objects."""
+    backend = LocalCardDAVBackend(tmp_path)
+    addressbook = tmp_path / "contacts" / "personal"
+    addressbook.mkdir(parents=True)
+    (addressbook / "a.vcf").write_text("BEGIN:VCARD\nVERSION:3.0\nUID:a\nEND:VCARD\n")
+    await backend.list_address_objects(None, "/contacts/personal/")
+
+    await backend.delete_addressbook(None, "/contacts/personal/")
+
+    assert not addressbook.exists()
+    assert not backend._object_cache
+    with pytest.raises(HTTPError) as excinfo:
+        await backend.delete_addressbook(None, "/contacts/personal/")
+    assert excinfo.value.code == 404
+
+
+async def test_put_unchanged_address_object_skips_write(tmp_path):
+    """Test that re-uploading identical content keeps the stored file untouched."""
+    backend = LocalCardDAVBackend(tmp_path)
+    path = "/contacts/personal/jane.vcf"
+    vcard_data = "BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Jane\r\nUID:jane\r\nEND:VCARD\r\n"
+
+    created = await backend.put_address_object(None, path, vcard_data)
+    file_path = tmp_path / "contacts" / "personal" / "jane.vcf"
+    os.utime(file_path, ns=(0, 0))
+    again = await backend.put_address_object(None, path, vcard_data, if_match=created.etag)
+    changed = await backend.put_address_object(None, path, vcard_data.replace("Jane", "Janet"))
+
+    assert again.etag == created.etag
+    assert again.mod_time == datetime.fromtimestamp(0, tz=UTC)
+    assert changed.etag != created.etag
+    assert "FN:Janet" in file_path.read_text()
+
+
+async def test_get_address_objects_skips_missing(tmp_path):
+    """Test that batch lookups match single lookups and skip missing objects."""
+    backend = LocalCardDAVBackend(tmp_path)
+    addressbook = tmp_path / "contacts" / "personal"
+    addressbook.mkdir(parents=True)
+    (addressbook / "a.vcf").write_text("BEGIN:VCARD\nVERSION:3.0\nUID:a\nEND:VCARD\n")
+    (addressbook / "b.vcf").write_text("BEGIN:VCARD\nVERSION:3.0\nUID:b\nEND:VCARD\n")
+    paths = [
+        "/contacts/personal/b.vcf",
+        "/contacts/personal/missing.vcf",
+        "/contacts/personal/a.vcf",
+    ]
+
+    objects, not_found = await backend.get_address_objects(None, paths)
+
+    assert objects == [
+        await backend.get_address_object(None, paths[0]),
+        await backend.get_address_object(None, paths[2]),
+    ]
+    assert not_found == [paths[1]]
+
+
+@pytest.mark.parametrize(
+    "vcard_data",
+    [
+        "BEGIN:VCARD\nUID:x\nthis line is garbage\nEND:VCARD",
+        "BEGIN:VCARD\nVERSION:3.0\nUID:x\nBEGIN:VEVENT\nEND:VCARD",
+    ],
+)
+def test_validate_address_object_malformed(vcard_data):
+    """Test that malformed vCards are rejected even when they have a plain UID."""
+    with pytest.raises(ValueError):
+        validate_address_object(vcard_data)
+
+
+def test_fast_uid_accepts_grouped_and_parameterized_properties():
+    """Test that well-formed cards are still read without a vobject parse."""
+    vcard_data = (
+        "BEGIN:VCARD\r\nVERSION:3.0\r\nUID:abc\r\nTEL;TYPE=work,voice:+1-555\r\n"
+        'item1.EMAIL;TYPE="INTERNET":a@example.com\r\nNOTE:long\r\n  note\r\nEND:VCARD\r\n'
+    )
+
+    assert _fast_uid(vcard_data) == "abc"
+    assert _fast_uid("BEGIN:VCARD\nUID:x\n\nEND:VCARD") is None
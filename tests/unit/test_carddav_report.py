@@ -0,0 +1,76 @@
+"""Tests for CardDAV REPORT parsing."""
+
+import pytest
+from lxml import etree
+
+from py_webdav.carddav.report import (
+    MAX_REPORT_CHILDREN,
+    AddressBookMultigetReport,
+    AddressBookQueryReport,
+    parse_addressbook_report,
+)
+
+
+def test_parse_addressbook_query():
+    """Test parsing an addressbook-query REPORT."""
+    body = b"""<?xml version="1.0" encoding="utf-8"?>
+<C:addressbook-query xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
+  <D:prop>
+    <D:getetag/>
+    <C:address-data/>
+  </D:prop>
+  <C:filter/>
+</C:addressbook-query>"""
+
+    report = parse_addressbook_report(etree.fromstring(body))
+
+    assert isinstance(report, AddressBookQueryReport)
+    assert report.prop == ["{DAV:}getetag", "{urn:ietf:params:xml:ns:carddav}address-data"]
+    assert report.filter is not None
+    assert not report.allprop
+
+
+def test_parse_addressbook_multiget():
+    """Test parsing an addressbook-multiget REPORT."""
+    body = b"""<?xml version="1.0" encoding="utf-8"?>
+<C:addressbook-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
+  <D:allprop/>
+  <D:href>/contacts/personal/a.vcf</D:href>
+  <D:href>/contacts/personal/b.vcf</D:href>
+</C:addressbook-multiget>"""
+
+    report = parse_addressbook_report(etree.fromstring(body))
+
+    assert isinstance(report, AddressBookMultigetReport)
+    assert report.hrefs == ["/contacts/personal/a.vcf", "/contacts/personal/b.vcf"]
+    assert report.allprop
+    assert report.prop is None
+
+
+def test_parse_unknown_report_fails():
+    """Test that unknown REPORT types are rejected."""
+    root = etree.fromstring(b'<D:sync-collection xmlns:D="DAV:"/>')
+
+    with pytest.raises(ValueError, match="Unknown CardDAV REPORT type"):
+        parse_addressbook_report(root)
+
+
+def test_parse_multiget_drops_duplicate_hrefs():
+    """Test that repeated hrefs are fetched once, in the client's order."""
+    root = etree.Element("{urn:ietf:params:xml:ns:carddav}addressbook-multiget")
+    for name in ("b", "a", "b"):
+        etree.SubElement(root, "{DAV:}href").text = f"/contacts/personal/{name}.vcf"
+
+    report = parse_addressbook_report(root)
+
+    assert report.hrefs == ["/contacts/personal/b.vcf", "/contacts/personal/a.vcf"]
+
+
+def test_parse_oversized_report_fails():
+    """Test that REPORT bodies with too many elements are rejected."""
+    root = etree.Element("{urn:ietf:params:xml:ns:carddav}addressbook-multiget")
+    for i in range(MAX_REPORT_CHILDREN + 1):
+        etree.SubElement(root, "{DAV:}href").text = f"/contacts/personal/{i}.vcf"
+
+    with pytest.raises(ValueError, match="more than"):
+        parse_addressbook_report(root)
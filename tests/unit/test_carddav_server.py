@@ -0,0 +1,342 @@
+"""Tests for CardDAV PROPFIND response building."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from lxml import etree
+from starlette.requests import Request
+
+from py_webdav.carddav import AddressBook, AddressObject, LocalCardDAVBackend
+from py_webdav.carddav.server import (
+    MULTIGET_CONCURRENCY,
+    ResourceType,
+    _address_object_response_xml,
+    _fetch_address_objects,
+    _href,
+    _http_date,
+    _propfind_address_object,
+    _propfind_addressbook,
+    detect_resource_type,
+    forget_missing_address_object,
+    handle_carddav_propfind,
+    handle_carddav_report,
+)
+from py_webdav.internal import Depth, HTTPError, MultiStatus, PropFind
+from py_webdav.internal.elements import GET_ETAG, GET_LAST_MODIFIED, Prop
+from py_webdav.internal.server import serve_multistatus_stream
+
+
+def _propstats(resp):
+    """Map status codes to the property names reported under them."""
+    return {
+        propstat.status.code: [elem.tag for elem in propstat.prop.raw]
+        for propstat in resp.propstats
+    }
+
+
+def test_propfind_addressbook_prototypes_are_reused_safely():
+    """Test that static property elements survive being serialized."""
+    addressbook = AddressBook(path="/contacts/default/", name="Work")
+
+    first = _propfind_addressbook(addressbook, PropFind(allprop=True), "/p/", "/contacts/")
+    etree.tostring(MultiStatus(responses=[first]).to_xml())
+    second = _propfind_addressbook(addressbook, PropFind(allprop=True), "/p/", "/contacts/")
+
+    assert _propstats(second) == _propstats(first)
+    for elem in second.propstats[0].prop.raw:
+        assert elem.getparent() is None
+    home_set = second.propstats[0].prop.raw[2]
+    assert home_set[0].text == "/contacts/"
+    assert len(second.propstats[0].prop.raw[-1]) == 2
+
+
+def test_propfind_address_object_without_mod_time():
+    """Test that a missing modification time is only reported when requested."""
+    obj = AddressObject(path="/contacts/default/a.vcf", data="", etag="abc")
+    prop = Prop(raw=[etree.Element(GET_ETAG), etree.Element(GET_LAST_MODIFIED)])
+
+    listed = _propfind_address_object(obj, PropFind(allprop=True))
+    requested = _propfind_address_object(obj, PropFind(prop=prop))
+
+    assert GET_LAST_MODIFIED not in _propstats(listed)[200]
+    assert 404 not in _propstats(listed)
+    assert _propstats(requested) == {200: [GET_ETAG], 404: [GET_LAST_MODIFIED]}
+
+
+def test_detect_resource_type():
+    """Test resource type detection from path depth."""
+    assert detect_resource_type("/") == ResourceType.ROOT
+    assert detect_resource_type("/contacts/") == ResourceType.ADDRESSBOOK_HOME_SET
+    assert detect_resource_type("/contacts/default/") == ResourceType.ADDRESSBOOK
+    assert detect_resource_type("/contacts/default/a.vcf") == ResourceType.ADDRESS_OBJECT
+    assert detect_resource_type("/contacts//default/") == ResourceType.ADDRESSBOOK
+    assert detect_resource_type("/contacts/default") == ResourceType.ADDRESSBOOK
+    assert detect_resource_type("/contacts/default/a/b.vcf") == ResourceType.ADDRESS_OBJECT
+    assert detect_resource_type("/dav/contacts/", prefix="/dav/") == (
+        ResourceType.ADDRESSBOOK_HOME_SET
+    )
+
+
+async def test_fetch_address_objects_without_batch_lookup():
+    """Test the per-object multiget fallback for backends without a batch lookup."""
+
+    class SingleObjectBackend:
+        async def get_address_object(self, request, path):
+            if path.endswith("missing.vcf"):
+                raise HTTPError(404, Exception("not found"))
+            return AddressObject(path=path, data="")
+
+    paths = ["/contacts/default/b.vcf", "/contacts/default/missing.vcf", "/c/a.vcf"]
+    objects, not_found = await _fetch_address_objects(None, SingleObjectBackend(), paths)
+
+    assert [obj.path for obj in objects] == [paths[0], paths[2]]
+    assert not_found == [paths[1]]
+
+
+async def test_fetch_address_objects_runs_lookups_concurrently():
+    """Test that fallback lookups overlap but stay within the concurrency limit."""
+    in_flight = []
+    peak = []
+
+    class SlowBackend:
+        async def get_address_object(self, request, path):
+            in_flight.append(path)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0)
+            in_flight.remove(path)
+            return AddressObject(path=path, data="")
+
+    paths = [f"/contacts/default/{i}.vcf" for i in range(MULTIGET_CONCURRENCY * 2)]
+    objects, _ = await _fetch_address_objects(None, SlowBackend(), paths)
+
+    assert [obj.path for obj in objects] == paths
+    assert max(peak) == MULTIGET_CONCURRENCY
+
+
+async def test_propfind_addressbook_streams_objects(tmp_path, monkeypatch):
+    """Test that a Depth: 1 PROPFIND streams a complete multistatus in chunks."""
+    monkeypatch.setattr("py_webdav.internal.server.MULTISTATUS_CHUNK_SIZE", 256)
+    backend = LocalCardDAVBackend(tmp_path)
+    await backend.create_addressbook(None, AddressBook(path="/contacts/default/", name="Work"))
+    for i in range(20):
+        vcard = f"BEGIN:VCARD\nVERSION:3.0\nUID:{i}\nFN:Contact {i}\nEND:VCARD\n"
+        await backend.put_address_object(None, f"/contacts/default/{i}.vcf", vcard)
+    scope = {"type": "http", "method": "PROPFIND", "path": "/contacts/default/", "headers": []}
+
+    resp = await handle_carddav_propfind(
+        Request(scope), PropFind(allprop=True), Depth.ONE, "/contacts/", "/p/", backend
+    )
+    chunks = [chunk async for chunk in resp.body_iterator]
+    ms = MultiStatus.from_xml(etree.fromstring(b"".join(chunks)))
+
+    assert resp.status_code == 207
+    assert len(chunks) > 1
+    assert len(ms.responses) == 21
+    assert str(ms.responses[0].hrefs[0]) == "/contacts/default/"
+
+
+def _failing_responses(fail_at):
+    """Yield DAV:response elements, raising when the given one is due."""
+    for i in range(3):
+        if i == fail_at:
+            raise RuntimeError("backend exploded")
+        yield etree.Element("{DAV:}response")
+
+
+def test_multistatus_stream_raises_before_committing_status():
+    """Test that a failure building the first response reaches the caller."""
+    with pytest.raises(RuntimeError, match="backend exploded"):
+        serve_multistatus_stream(_failing_responses(0))
+
+
+async def test_multistatus_stream_aborts_on_later_failure(caplog):
+    """Test that a failure mid-stream is logged and not turned into a closed document."""
+    resp = serve_multistatus_stream(_failing_responses(2))
+    chunks = []
+
+    with pytest.raises(RuntimeError, match="backend exploded"):
+        async for chunk in resp.body_iterator:
+            chunks.append(chunk)
+
+    assert b"</D:multistatus>" not in b"".join(chunks)
+    assert "failed to stream multistatus response" in caplog.text
+
+
+def test_href_is_reused():
+    """Test that hrefs of repeated paths are parsed once."""
+    assert _href("/contacts/default/a.vcf") is _href("/contacts/default/a.vcf")
+    assert str(_href("/contacts/default/a.vcf")) == "/contacts/default/a.vcf"
+
+
+def test_http_date():
+    """Test HTTP date formatting of aware and naive datetimes."""
+    dt = datetime(2026, 1, 3, 14, 0, 5, 900_000, tzinfo=UTC)
+    berlin = dt.astimezone(timezone(timedelta(hours=1)))
+
+    assert _http_date(dt) == "Sat, 03 Jan 2026 14:00:05 GMT"
+    assert _http_date(dt) == format_datetime(dt, usegmt=True)
+    assert _http_date(berlin) == _http_date(dt)
+    assert _http_date(dt.replace(tzinfo=None)) == _http_date(dt)
+
+
+async def test_multiget_skips_recently_missing_hrefs():
+    """Test that hrefs found missing are not looked up again until forgotten."""
+    lookups = []
+
+    class CountingBackend:
+        async def get_address_object(self, request, path):
+            lookups.append(path)
+            if path.endswith("gone.vcf"):
+                raise HTTPError(404, Exception("not found"))
+            return AddressObject(path=path, data="")
+
+    body = (
+        b'<C:addressbook-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">'
+        b"<D:prop><D:getetag/></D:prop>"
+        b"<D:href>/contacts/multiget/a.vcf</D:href><D:href>/contacts/multiget/gone.vcf</D:href>"
+        b"</C:addressbook-multiget>"
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def multiget(backend):
+        scope = {"type": "http", "method": "REPORT", "path": "/contacts/multiget/", "headers": []}
+        resp = await handle_carddav_report(Request(scope, receive), "/contacts/", "/p/", backend)
+        chunks = [chunk async for chunk in resp.body_iterator]
+        return MultiStatus.from_xml(etree.fromstring(b"".join(chunks)))
+
+    backend = CountingBackend()
+    first = await multiget(backend)
+    second = await multiget(backend)
+    forget_missing_address_object(backend, "/contacts/multiget/gone.vcf")
+    await multiget(backend)
+    # Another backend has its own record of missing hrefs
+    await multiget(CountingBackend())
+
+    assert [str(r.hrefs[0]) for r in first.responses] == ["/contacts/multiget/a.vcf"]
+    assert [str(r.hrefs[0]) for r in second.responses] == ["/contacts/multiget/a.vcf"]
+    assert lookups.count("/contacts/multiget/gone.vcf") == 3
+    assert lookups.count("/contacts/multiget/a.vcf") == 4
+
+
+async def test_multiget_reports_backend_failures():
+    """Test that a failing backend is not answered as if the objects were deleted."""
+    lookups = []
+
+    class FlakyBackend:
+        async def get_address_object(self, request, path):
+            lookups.append(path)
+            if path.endswith("gone.vcf"):
+                raise HTTPError(404, Exception("not found"))
+            raise HTTPError(502, Exception("upstream timeout"))
+
+    body = (
+        b'<C:addressbook-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">'
+        b"<D:prop><D:getetag/></D:prop>"
+        b"<D:href>/contacts/flaky/gone.vcf</D:href><D:href>/contacts/flaky/a.vcf</D:href>"
+        b"</C:addressbook-multiget>"
+    )
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    backend = FlakyBackend()
+    scope = {"type": "http", "method": "REPORT", "path": "/contacts/flaky/", "headers": []}
+    for _ in range(2):
+        with pytest.raises(HTTPError) as excinfo:
+            await handle_carddav_report(Request(scope, receive), "/contacts/", "/p/", backend)
+        assert excinfo.value.code == 502
+
+    # Nothing is remembered as missing from a failed multiget
+    assert lookups.count("/contacts/flaky/gone.vcf") == 2
+
+
+async def test_report_parses_chunked_body_and_rejects_malformed():
+    """Test that REPORT bodies are parsed across chunks and bad XML answers 400."""
+    body = (
+        b'<C:addressbook-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">'
+        b"<D:prop><D:getetag/></D:prop><D:href>/contacts/chunked/a.vcf</D:href>"
+        b"</C:addressbook-multiget>"
+    )
+
+    def receiver(chunks):
+        messages = [{"type": "http.request", "body": c, "more_body": True} for c in chunks]
+        messages.append({"type": "http.request", "body": b"", "more_body": False})
+
+        async def receive():
+            return messages.pop(0)
+
+        return receive
+
+    class Backend:
+        async def get_address_object(self, request, path):
+            return AddressObject(path=path, data="", etag="abc")
+
+    scope = {"type": "http", "method": "REPORT", "path": "/contacts/chunked/", "headers": []}
+    chunks = [body[i : i + 16] for i in range(0, len(body), 16)]
+    resp = await handle_carddav_report(
+        Request(scope, receiver(chunks)), "/contacts/", "/p/", Backend()
+    )
+    ms = MultiStatus.from_xml(etree.fromstring(b"".join([c async for c in resp.body_iterator])))
+
+    malformed = await handle_carddav_report(
+        Request(scope, receiver([b"<C:addressbook-multiget"])), "/contacts/", "/p/", Backend()
+    )
+    empty = await handle_carddav_report(
+        Request(scope, receiver([])), "/contacts/", "/p/", Backend()
+    )
+
+    assert [str(r.hrefs[0]) for r in ms.responses] == ["/contacts/chunked/a.vcf"]
+    assert malformed.status_code == 400
+    assert empty.status_code == 400
+
+
+def test_not_found_props_are_reused_safely():
+    """Test that cached not-found elements survive being serialized."""
+    obj = AddressObject(path="/contacts/default/a.vcf", data="", etag="abc")
+    prop = Prop(raw=[etree.Element("{urn:x}color"), etree.Element("{urn:x}size")])
+
+    first = _propfind_address_object(obj, PropFind(prop=prop))
+    etree.tostring(MultiStatus(responses=[first]).to_xml())
+    second = _propfind_address_object(obj, PropFind(prop=prop))
+
+    assert _propstats(second) == {404: ["{urn:x}color", "{urn:x}size"]}
+
+
+async def test_propfind_home_set_by_depth(tmp_path):
+    """Test that only Depth: 1 lists the addressbooks of the home set."""
+    backend = LocalCardDAVBackend(tmp_path)
+    await backend.create_addressbook(None, AddressBook(path="/contacts/default/", name="Work"))
+    scope = {"type": "http", "method": "PROPFIND", "path": "/contacts/", "headers": []}
+
+    async def hrefs(depth):
+        resp = await handle_carddav_propfind(
+            Request(scope), PropFind(allprop=True), depth, "/contacts/", "/p/", backend
+        )
+        body = b"".join([chunk async for chunk in resp.body_iterator])
+        return [str(r.hrefs[0]) for r in MultiStatus.from_xml(etree.fromstring(body)).responses]
+
+    assert await hrefs(Depth.ZERO) == ["/contacts/"]
+    assert await hrefs(Depth.ONE) == ["/contacts/", "/contacts/default/"]
+    assert await hrefs(Depth.INFINITY) == ["/contacts/"]
+
+
+def test_address_object_response_xml_matches_response():
+    """Test that directly built object rows match the Response-based builder."""
+    objects = [
+        AddressObject(path="/c/a.vcf", data="BEGIN:VCARD", etag="a", content_length=11),
+        AddressObject(
+            path="/c/b.vcf", data="", etag="b", mod_time=datetime(2026, 1, 1, tzinfo=UTC)
+        ),
+        AddressObject(path="/c/c.vcf", data="not xml \x00", etag="c"),
+    ]
+    prop = Prop(raw=[etree.Element(GET_ETAG), etree.Element("{urn:x}color")])
+
+    for propfind in (PropFind(allprop=True), PropFind(prop=prop)):
+        for obj in objects:
+            row = _address_object_response_xml(obj, propfind)
+            expected = _propfind_address_object(obj, propfind).to_xml()
+            assert etree.tostring(row) == etree.tostring(expected)
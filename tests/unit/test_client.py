@@ -0,0 +1,175 @@
+"""Tests for the WebDAV client."""
+
+from datetime import UTC, datetime
+from io import BytesIO
+
+import httpx
+import pytest
+from lxml import etree
+
+from py_webdav.client import (
+    FILE_INFO_PROPFIND_BODY,
+    Client,
+    ResponseBody,
+    file_info_from_response,
+)
+from py_webdav.internal import HTTPError
+from py_webdav.internal.elements import Response
+
+
+async def test_default_http_client_is_pooled_and_owned():
+    """Test that a self-created HTTP client is tuned and closed with the client."""
+    client = Client(endpoint="https://dav.example.com/")
+    http_client = client.internal_client.http_client
+
+    assert http_client.timeout.connect == 10.0
+    assert client._owns_client
+
+    await client.close()
+    assert http_client.is_closed
+
+
+async def test_supplied_http_client_is_left_open():
+    """Test that closing the client leaves a caller-supplied HTTP client open."""
+    http_client = httpx.AsyncClient()
+    client = Client(http_client, endpoint="https://dav.example.com/")
+
+    await client.close()
+
+    # The caller still owns the HTTP client and can keep using it
+    assert not http_client.is_closed
+    assert not client._owns_client
+    await http_client.aclose()
+    assert http_client.is_closed
+
+
+MULTISTATUS = b"""<?xml version="1.0" encoding="utf-8"?>
+<D:multistatus xmlns:D="DAV:">
+  <D:response>
+    <D:href>/files/</D:href>
+    <D:propstat>
+      <D:prop><D:resourcetype><D:collection/></D:resourcetype></D:prop>
+      <D:status>HTTP/1.1 200 OK</D:status>
+    </D:propstat>
+  </D:response>
+  <D:response>
+    <D:href>/files/a.txt</D:href>
+    <D:propstat>
+      <D:prop>
+        <D:resourcetype/>
+        <D:getcontentlength>5</D:getcontentlength>
+        <D:getetag>"abc"</D:getetag>
+      </D:prop>
+      <D:status>HTTP/1.1 200 OK</D:status>
+    </D:propstat>
+  </D:response>
+</D:multistatus>"""
+
+
+async def test_read_dir():
+    """Test that a directory listing is converted to file infos."""
+
+    def handler(request):
+        assert request.method == "PROPFIND"
+        assert request.headers["Depth"] == "1"
+        assert request.content == FILE_INFO_PROPFIND_BODY
+        return httpx.Response(207, content=MULTISTATUS)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = Client(http_client, endpoint="https://dav.example.com/")
+        files = await client.read_dir("/files/")
+
+    assert [(fi.path, fi.is_dir, fi.size, fi.etag) for fi in files] == [
+        ("/files/", True, 0, ""),
+        ("/files/a.txt", False, 5, "abc"),
+    ]
+
+
+def test_file_info_from_response_skips_not_found_props():
+    """Test that empty properties of a 404 propstat don't hide found ones."""
+    resp = Response.from_xml(
+        etree.fromstring(
+            b"""<D:response xmlns:D="DAV:">
+              <D:href>/files/a.txt</D:href>
+              <D:propstat>
+                <D:prop><D:getetag/><D:getcontenttype/></D:prop>
+                <D:status>HTTP/1.1 404 Not Found</D:status>
+              </D:propstat>
+              <D:propstat>
+                <D:prop>
+                  <D:resourcetype/>
+                  <D:getetag>"abc"</D:getetag>
+                  <D:getlastmodified>Tue, 13 Jan 2026 14:00:05 GMT</D:getlastmodified>
+                </D:prop>
+                <D:status>HTTP/1.1 200 OK</D:status>
+              </D:propstat>
+            </D:response>"""
+        )
+    )
+
+    fi = file_info_from_response(resp)
+
+    assert (fi.is_dir, fi.etag, fi.mime_type) == (False, "abc", "")
+    assert fi.mod_time == datetime(2026, 1, 13, 14, 0, 5, tzinfo=UTC)
+
+
+async def test_open_reads_files_into_memory():
+    """Test that open returns a binary file object regardless of the file size."""
+
+    def handler(request):
+        if request.url.path.endswith("small.txt"):
+            return httpx.Response(200, content=b"hello")
+        return httpx.Response(404, text="no such file")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = Client(http_client, endpoint="https://dav.example.com/")
+
+        small = await client.open("/files/small.txt")
+        assert isinstance(small, BytesIO)
+        assert small.read() == b"hello"
+
+        with pytest.raises(HTTPError):
+            await client.open("/files/missing.txt")
+
+
+async def test_open_stream_reads_in_chunks_and_releases_the_connection():
+    """Test that streamed files are read in chunks and closed at the end."""
+    large = bytes(range(256)) * 5000
+    streams = []
+
+    class Stream(httpx.AsyncByteStream):
+        closed = False
+
+        async def __aiter__(self):
+            for i in range(0, len(large), 1000):
+                yield large[i : i + 1000]
+
+        async def aclose(self):
+            self.closed = True
+
+    def handler(request):
+        if request.url.path.endswith("large.bin"):
+            streams.append(Stream())
+            return httpx.Response(200, stream=streams[-1])
+        return httpx.Response(404, text="no such file")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+        client = Client(http_client, endpoint="https://dav.example.com/")
+
+        async with client.open_stream("/files/large.bin") as body:
+            assert isinstance(body, ResponseBody)
+            head = await body.read(1500)
+            rest = await body.read()
+            # Reading to the end releases the connection before the context exits
+            assert streams[0].closed
+            assert await body.read(10) == b""
+        assert head + rest == large
+
+        # Leaving the context early releases the connection too
+        async with client.open_stream("/files/large.bin") as body:
+            assert len(await body.read(10)) == 10
+        assert streams[1].closed
+
+        with pytest.raises(HTTPError):
+            async with client.open_stream("/files/missing.txt"):
+                pass
@@ -0,0 +1,65 @@
+"""Tests for debug logging helpers."""
+
+import json
+import logging
+
+from py_webdav import debug
+from py_webdav.debug import FORMAT_XML_MAX_SIZE, format_xml
+
+
+def test_format_xml():
+    """Test pretty-printing of XML bodies and fallbacks for other content."""
+    assert format_xml(b'<a xmlns="DAV:"><b>x</b></a>') == '<a xmlns="DAV:">\n  <b>x</b>\n</a>\n'
+    assert format_xml("<a><b/></a>") == "<a>\n  <b/>\n</a>\n"
+    assert format_xml(b"<a><b></a>") == "<a><b></a>"
+    assert format_xml(bytearray(b"<a><b/></a>")) == "<a>\n  <b/>\n</a>\n"
+    assert format_xml('<?xml version="1.0" encoding="utf-8"?><a/>') == "<a/>\n"
+
+    large = b"<a>" + b"<b/>" * (FORMAT_XML_MAX_SIZE // 4) + b"</a>"
+    assert format_xml(large) == large.decode()
+
+
+def test_log_response_skips_formatting_when_disabled(monkeypatch, caplog):
+    """Test that bodies are only formatted when the messages are logged."""
+    calls = []
+    monkeypatch.setattr(debug, "format_xml", lambda body: calls.append(body) or "<a/>")
+    headers = {"content-type": "application/xml"}
+
+    with caplog.at_level(logging.WARNING, logger="py_webdav"):
+        debug.log_response(207, headers, b"<a/>")
+    assert not calls
+
+    with caplog.at_level(logging.INFO, logger="py_webdav"):
+        debug.log_response(207, headers, b"<a/>")
+    assert calls == [b"<a/>"]
+    assert len(caplog.messages) == 1
+    assert "Response Body:\n  <a/>\n" in caplog.messages[0]
+
+
+def test_dumps_matches_json_module():
+    """Test that INFORM log data is serialized like json.dumps with indent=2."""
+    data = {"type": "response", "body": {"subject": "Besprechung in Köln", "ids": [1, 2]}}
+
+    assert debug._dumps(data) == json.dumps(data, indent=2, ensure_ascii=False)
+    assert json.loads(debug._dumps({"big": 2**70})) == {"big": 2**70}
+
+
+def test_log_request_headers_any_case(caplog):
+    """Test that headers are found regardless of case and credentials redacted."""
+    headers = {"Content-Type": "text/xml", "depth": "1", "AUTHORIZATION": "Basic c2VjcmV0"}
+
+    with caplog.at_level(logging.INFO, logger="py_webdav"):
+        debug.log_request("PROPFIND", "/files/", headers, b"<a/>")
+
+    message = caplog.messages[0]
+    assert "  Content-Type: text/xml\n  Depth: 1\n  Authorization: [REDACTED]" in message
+    assert "c2VjcmV0" not in message
+    assert "Request Body:\n  <a/>" in message
+
+
+def test_is_xml_content():
+    """Test XML detection from Content-Type header values."""
+    assert debug.is_xml_content("Text/XML; charset=utf-8")
+    assert debug.is_xml_content("application/xml")
+    assert not debug.is_xml_content("text/vcard")
+    assert not debug.is_xml_content(None)
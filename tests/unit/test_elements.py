@@ -2,7 +2,7 @@
 
 from lxml import etree
 
-from py_webdav.internal.elements import MultiStatus
+from py_webdav.internal.elements import MultiStatus, PropFind
 from py_webdav.internal.internal import HrefError, HTTPError
 
 # https://tools.ietf.org/html/rfc4918#section-9.6.2
@@ -47,3 +47,17 @@ def test_multistatus_round_trip():
     assert "response" in xml_str
     assert "href" in xml_str
     assert "status" in xml_str
+
+
+def test_propfind_qualified_prop_names():
+    """Test that requested property names are resolved to Clark notation."""
+    body = (
+        b'<D:propfind xmlns:D="DAV:"><D:prop>'
+        b"<D:getetag/><!-- etag --><displayname/>"
+        b"</D:prop></D:propfind>"
+    )
+    propfind = PropFind.from_xml(etree.fromstring(body))
+
+    assert propfind.qualified_prop_names() == ("{DAV:}getetag", "displayname")
+    assert propfind.qualified_prop_names() is propfind.qualified_prop_names()
+    assert PropFind(allprop=True).qualified_prop_names() == ()
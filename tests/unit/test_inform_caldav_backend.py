@@ -0,0 +1,233 @@
+"""Tests for the INFORM CalDAV backend conversion helpers."""
+
+import httpx
+import pytest
+from starlette.requests import Request
+
+from py_webdav.caldav import InformCalDAVBackend
+from py_webdav.caldav.inform_backend import _parse_byday, _split_occurrence_name
+from py_webdav.internal import HTTPError
+
+OCCURRENCE = {
+    "key": "EVT1",
+    "occurrenceId": "42",
+    "subject": "Team Meeting",
+    "startDateTime": "2026-01-13T14:00:00Z",
+    "endDateTime": "2026-01-13T15:00:00Z",
+}
+
+
+def test_occurrence_ical_is_cached():
+    """Test that unchanged occurrences reuse the serialized iCalendar data."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    ical_data, encoded, etag = backend._cached_occurrence_ical(dict(OCCURRENCE))
+    again = backend._cached_occurrence_ical(dict(OCCURRENCE))
+
+    assert "UID:EVT1-42" in ical_data
+    assert encoded == ical_data.encode()
+    assert again == (ical_data, encoded, etag)
+
+
+def test_occurrence_ical_cache_tracks_changes():
+    """Test that moved, edited and invalidated occurrences are re-serialized."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    _, _, etag = backend._cached_occurrence_ical(dict(OCCURRENCE))
+    moved = dict(OCCURRENCE, startDateTime="2026-01-13T15:00:00Z")
+    _, _, moved_etag = backend._cached_occurrence_ical(moved)
+
+    assert moved_etag != etag
+
+    renamed = dict(OCCURRENCE, subject="Moved Meeting")
+    ical_data, _, renamed_etag = backend._cached_occurrence_ical(renamed)
+
+    assert "SUMMARY:Moved Meeting" in ical_data
+    assert renamed_etag != etag
+
+    relocated = dict(OCCURRENCE, location="Room 2")
+    ical_data, _, relocated_etag = backend._cached_occurrence_ical(relocated)
+
+    assert "LOCATION:Room 2" in ical_data
+    assert relocated_etag not in (etag, renamed_etag)
+
+    backend._invalidate_event_caches("EVT1")
+    assert not backend._ical_cache
+
+
+async def test_put_occurrence_invalidates_cached_ical():
+    """Test that a PUT re-serializes the occurrence instead of serving the cache."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+    ical_data, _, _ = backend._cached_occurrence_ical(dict(OCCURRENCE))
+
+    async def get_occurrence(event_key, occurrence_id, fields=None):
+        return dict(OCCURRENCE, subject="Renamed Meeting")
+
+    async def update_occurrence(event_key, occurrence_id, event_data):
+        return {}
+
+    backend.api_client.get_calendar_event_occurrence = get_occurrence
+    backend.api_client.update_calendar_event_occurrence = update_occurrence
+
+    obj = await backend.put_calendar_object(None, "/calendars/default/EVT1-42.ics", ical_data)
+
+    assert "SUMMARY:Renamed Meeting" in obj.data
+
+
+def test_occurrence_index_lookup():
+    """Test that indexed occurrences are found and dropped on invalidation."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    backend._index_occurrences([dict(OCCURRENCE), {"key": "EVT2"}])
+
+    assert backend._lookup_occurrence("EVT1", "42") == OCCURRENCE
+    assert backend._lookup_occurrence("EVT1", "43") is None
+    assert backend._lookup_occurrence("EVT2", "") is None
+
+    backend._invalidate_event_caches("EVT1")
+    assert backend._lookup_occurrence("EVT1", "42") is None
+
+
+def test_rrule_to_inform_series_schema_weekdays():
+    """Test weekday conversion for weekly, monthly and yearly rules."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    weekly = backend._rrule_to_inform_series_schema({"freq": ["WEEKLY"], "byday": ["MO", "FR"]})
+    assert weekly["weeklySchemaData"]["weekdays"] == ["monday", "friday"]
+
+    monthly = backend._rrule_to_inform_series_schema({"freq": ["MONTHLY"], "byday": ["2TU"]})
+    assert monthly["monthlySchemaData"]["weekday"] == "tuesday"
+    assert monthly["monthlySchemaData"]["weekNumber"] == 2
+
+    yearly = backend._rrule_to_inform_series_schema(
+        {"freq": ["YEARLY"], "bymonth": [3], "byday": ["SU"]}
+    )
+    assert yearly["yearlySchemaData"]["weekday"] == "sunday"
+    assert yearly["yearlySchemaData"]["weekNumber"] == 1
+    assert yearly["yearlySchemaData"]["monthOfYear"] == 3
+
+
+async def test_materialize_objects_converts_occurrences():
+    """Test that occurrences are converted to calendar objects."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    async def fake_occurrences(**kwargs):
+        return {"calendarEvents": [dict(OCCURRENCE), {"subject": "No key"}]}
+
+    backend.api_client.get_calendar_events_occurrences = fake_occurrences
+    start, end = backend._get_sync_date_range()
+
+    objects = await backend._materialize_objects("/calendars/default/", start, end)
+
+    assert [obj.path for obj in objects] == ["/calendars/default/EVT1-42.ics"]
+    assert objects[0].content_length == len(objects[0].data.encode())
+    assert backend._lookup_occurrence("EVT1", "42") is not None
+
+
+async def test_get_calendar_objects_raises_inform_failures():
+    """Test that only a 404 skips an event and API failures are raised."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    async def fake_event(event_key, fields=None):
+        status = 404 if event_key == "GONE" else 503
+        request = httpx.Request("GET", f"https://inform.example/calendarEvents/{event_key}")
+        response = httpx.Response(status, request=request)
+        raise httpx.HTTPStatusError("error", request=request, response=response)
+
+    backend.api_client.get_calendar_event = fake_event
+
+    assert await backend.get_calendar_objects(None, ["/calendars/default/GONE.ics"]) == []
+    with pytest.raises(HTTPError) as excinfo:
+        await backend.get_calendar_objects(None, ["/calendars/default/DOWN.ics"])
+    assert excinfo.value.code == 502
+
+
+def test_split_occurrence_name():
+    """Test splitting object names at the last hyphen."""
+    assert _split_occurrence_name("EVT1") == ("EVT1", None)
+    assert _split_occurrence_name("EVT1-42") == ("EVT1", "42")
+    assert _split_occurrence_name("a-b-c") == ("a-b", "c")
+
+
+async def test_occurrence_window_fetched_once_per_request():
+    """Test that occurrence GETs in one request share a single window fetch."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+    calls = []
+
+    async def fake_occurrences(**kwargs):
+        calls.append(kwargs)
+        return {"calendarEvents": [dict(OCCURRENCE)]}
+
+    backend.api_client.get_calendar_events_occurrences = fake_occurrences
+    request = Request({"type": "http", "method": "REPORT", "headers": []})
+
+    obj = await backend.get_calendar_object(request, "/calendars/default/EVT1-42.ics")
+    backend._occurrence_index.clear()
+    with pytest.raises(HTTPError):
+        await backend.get_calendar_object(request, "/calendars/default/EVT1-43.ics")
+
+    assert "UID:EVT1-42" in obj.data
+    assert len(calls) == 1
+
+
+def test_sync_date_range_is_stable_within_the_hour():
+    """Test that the sync range is hour-aligned and formats without microseconds."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+
+    start, end = backend._get_sync_date_range()
+
+    assert backend._get_sync_date_range() == (start, end)
+    assert start.minute == start.second == start.microsecond == 0
+    assert backend._format_datetime_for_inform(start).endswith(":00:00Z")
+
+
+def test_occurrence_to_ical_whole_day_with_reminder():
+    """Test conversion of whole-day occurrences with a reminder."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+    event_data = dict(
+        OCCURRENCE,
+        location="Room 1",
+        wholeDayEvent=True,
+        reminderEnabled=True,
+        remindBeforeStart=900,
+        private=True,
+    )
+
+    ical_data = backend._inform_occurrence_to_ical(event_data)
+
+    assert "DTSTART;VALUE=DATE:20260113" in ical_data
+    assert "LOCATION:Room 1" in ical_data
+    assert "TRIGGER:-PT15M" in ical_data
+    assert "CLASS:PRIVATE" in ical_data
+
+
+async def test_get_calendar_objects_batch():
+    """Test that a multiget resolves occurrences with one window fetch."""
+    backend = InformCalDAVBackend(owner_key="INFO")
+    calls = []
+
+    async def fake_occurrences(**kwargs):
+        calls.append(kwargs)
+        return {"calendarEvents": [dict(OCCURRENCE), dict(OCCURRENCE, occurrenceId="43")]}
+
+    backend.api_client.get_calendar_events_occurrences = fake_occurrences
+    request = Request({"type": "http", "method": "REPORT", "headers": []})
+    paths = [
+        "/calendars/default/EVT1-43.ics",
+        "/calendars/default/EVT1-99.ics",
+        "/calendars/default/EVT1-42.ics",
+    ]
+
+    objects = await backend.get_calendar_objects(request, paths)
+
+    assert [obj.path for obj in objects] == [paths[0], paths[2]]
+    assert len(calls) == 1
+
+
+def test_parse_byday():
+    """Test parsing BYDAY entries with and without ordinals."""
+    assert _parse_byday("MO") == (1, "monday")
+    assert _parse_byday("3TH") == (3, "thursday")
+    assert _parse_byday("+2SA") == (2, "saturday")
+    assert _parse_byday("-1FR") == (-1, "friday")
+    assert _parse_byday("bogus") == (1, "monday")
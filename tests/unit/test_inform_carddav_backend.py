@@ -0,0 +1,145 @@
+"""Tests for the INFORM CardDAV backend conversion helpers."""
+
+import httpx
+import pytest
+import vobject
+
+from py_webdav.carddav import InformCardDAVBackend
+from py_webdav.carddav.inform_backend import _fold_line
+from py_webdav.internal import HTTPError
+
+ADDRESS = {
+    "key": "ADR1",
+    "addressType": "customer",
+    "postAddresses": [
+        {
+            "postAddress": {
+                "line1": "ACME Corp",
+                "street": "Main Street 1",
+                "zipCodeAndCity": "12345 Springfield",
+                "phone": "+1 555 1234",
+                "email": "info@acme.example",
+            }
+        }
+    ],
+}
+
+
+async def test_list_address_objects_converts_addresses():
+    """Test that listed addresses are converted and keyless entries are skipped."""
+    backend = InformCardDAVBackend()
+
+    async def fake_addresses(**kwargs):
+        return {"addresses": [dict(ADDRESS), {"addressType": "customer"}]}
+
+    backend._company_name = "ACME"
+    backend.api_client.get_addresses = fake_addresses
+
+    objects = await backend.list_address_objects(None, "/contacts/customer/")
+
+    assert [obj.path for obj in objects] == ["/contacts/customer/ADR1.vcf"]
+    assert "UID:ADR1" in objects[0].data
+    assert "FN:ACME Corp" in objects[0].data
+    assert objects[0].content_length == len(objects[0].data.encode())
+
+
+def test_address_to_vcard_round_trips_through_vobject():
+    """Test that generated vCards parse back to the escaped INFORM values."""
+    backend = InformCardDAVBackend()
+    address = dict(ADDRESS, note="Line one\nLine two, with; separators", clientNumber="C-1")
+
+    vcard = vobject.readOne(backend._inform_address_to_vcard(address))
+
+    assert vcard.uid.value == "ADR1"
+    assert vcard.fn.value == "ACME Corp"
+    assert vcard.n.value.family == "ACME Corp"
+    assert vcard.note.value == "Line one\nLine two, with; separators"
+    assert vcard.adr.value.city == "Springfield"
+    assert vcard.adr.value.code == "12345"
+    assert vcard.tel.type_param == "WORK"
+    assert vcard.categories.value == ["CUSTOMER"]
+    assert vcard.x_clientnumber.value == "C-1"
+
+
+def test_fold_line():
+    """Test folding long content lines at 75 octets without splitting characters."""
+    assert _fold_line("NOTE:short") == "NOTE:short\r\n"
+
+    folded = _fold_line("NOTE:" + "é" * 80)
+    assert folded.split("\r\n ") == ["NOTE:" + "é" * 35, "é" * 37, "é" * 8 + "\r\n"]
+    assert all(len(line.encode()) <= 75 for line in folded.split("\r\n"))
+
+
+async def test_get_address_objects_uses_one_listing():
+    """Test that a multiget resolves addresses from a single listing per type."""
+    backend = InformCardDAVBackend()
+    listings = []
+    lookups = []
+
+    async def fake_addresses(**kwargs):
+        listings.append(kwargs)
+        return {"addresses": [dict(ADDRESS), dict(ADDRESS, key="ADR2")]}
+
+    async def fake_address(company, address_key):
+        lookups.append(address_key)
+        return dict(ADDRESS, key=address_key)
+
+    backend._company_name = "ACME"
+    backend.api_client.get_addresses = fake_addresses
+    backend.api_client.get_address = fake_address
+    paths = [
+        "/contacts/customer/ADR2.vcf",
+        "/contacts/bogus/ADR1.vcf",
+        "/contacts/customer/ADR3.vcf",
+        "/contacts/customer/ADR1.vcf",
+    ]
+
+    objects, not_found = await backend.get_address_objects(None, paths)
+    await backend.get_address_objects(None, paths[:1])
+
+    assert [obj.path for obj in objects] == [paths[0], paths[2], paths[3]]
+    assert not_found == [paths[1]]
+    assert len(listings) == 1
+    assert lookups == ["ADR3"]
+
+
+async def test_addressbooks_are_built_once():
+    """Test that address books are reused and keep the requested path."""
+    backend = InformCardDAVBackend()
+
+    books = await backend.list_addressbooks(None)
+    customer = await backend.get_addressbook(None, "/contacts/customer/")
+    unslashed = await backend.get_addressbook(None, "/contacts/customer")
+
+    assert [book.name for book in books] == ["Customers", "Suppliers", "Employees", "Other"]
+    assert customer is books[0]
+    assert unslashed.path == "/contacts/customer"
+    assert unslashed.name == "Customers"
+
+
+async def test_get_address_objects_reports_only_real_404s():
+    """Test that only a 404 marks an address as not found and API failures are raised."""
+    backend = InformCardDAVBackend()
+
+    async def fake_addresses(**kwargs):
+        return {"addresses": []}
+
+    async def fake_address(company, address_key):
+        status = 404 if address_key == "GONE" else 503
+        request = httpx.Request("GET", f"https://inform.example/addresses/{address_key}")
+        response = httpx.Response(status, request=request)
+        raise httpx.HTTPStatusError("error", request=request, response=response)
+
+    backend._company_name = "ACME"
+    backend.api_client.get_addresses = fake_addresses
+    backend.api_client.get_address = fake_address
+    paths = ["/contacts/customer/GONE.vcf", "/contacts/customer/DOWN.vcf"]
+
+    objects, not_found = await backend.get_address_objects(None, paths[:1])
+
+    assert objects == []
+    assert not_found == [paths[0]]
+
+    with pytest.raises(HTTPError) as excinfo:
+        await backend.get_address_objects(None, paths)
+    assert excinfo.value.code == 502